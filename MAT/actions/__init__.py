@@ -3,12 +3,14 @@ Filename: MetaGPT-Ewan/MAT/actions/__init__.py
 Created Date: Sunday, December 29th 2025
 Author: Ewan Su
 Description: Package initialization for MAT actions.
+
+The action classes are re-exported lazily (PEP 562), like the roles package:
+CalculateTechnicals pulls in pandas/NumPy and the other actions their own
+clients, so each module is only imported the first time its class is accessed.
+The lightweight pub-sub marker actions are imported eagerly.
 """
 
-from .search_deep_dive import SearchDeepDive
-from .retrieve_rag_data import RetrieveRAGData
-from .calculate_technicals import CalculateTechnicals
-from .synthesize_strategy import AnalyzeConflict, SynthesizeDecision
+import importlib
 
 # Import action classes from sibling actions_module.py file using relative import
 from ..actions_module import (
@@ -21,6 +23,15 @@ from ..actions_module import (
     PublishInvestigationReport
 )
 
+# Public name -> submodule that defines it
+_LAZY = {
+    "SearchDeepDive": "search_deep_dive",
+    "RetrieveRAGData": "retrieve_rag_data",
+    "CalculateTechnicals": "calculate_technicals",
+    "AnalyzeConflict": "synthesize_strategy",
+    "SynthesizeDecision": "synthesize_strategy",
+}
+
 __all__ = [
     "SearchDeepDive",
     "RetrieveRAGData",
@@ -37,3 +48,16 @@ __all__ = [
     "PublishInvestigationReport"
 ]
 
+
+def __getattr__(name):
+    """Import an action on first access and cache it in the package namespace."""
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{_LAZY[name]}", __name__)
+    obj = getattr(module, name)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -18,18 +18,39 @@ Configuration:
     Settings can be configured in config/config2.yaml under 'technicals' section.
 """
 
-import json
-from typing import Optional, Dict, Any
-from datetime import datetime, timedelta
+import asyncio
+import os
+import time
+from collections import OrderedDict
+from typing import ClassVar, Optional, Dict, Any, List, Tuple
+from datetime import datetime
 from pathlib import Path
+import numpy as np
 import pandas as pd
 
 from metagpt.actions import Action
 from metagpt.logs import logger
 from pydantic import Field
 
-from ..schemas import TAReport
+from ..schemas import TAReport, PivotZones
 from ..config_loader import get_config
+from . import indicator_kernels
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+# Downloaded OHLCV frames keyed by (ticker, start_date, end_date, period); LRU-bounded.
+# Historical windows never change; real-time ("period") downloads expire after a TTL.
+_PRICE_CACHE: "OrderedDict[Tuple[str, str, str, int], Tuple[float, pd.DataFrame]]" = OrderedDict()
+_PRICE_CACHE_MAX = 256
+_REALTIME_PRICE_TTL = 3600.0
+
+# Columns of the on-disk historical price store (long format, one row per ticker and day)
+_PRICE_STORE_COLUMNS = ['Date', 'Open', 'High', 'Low', 'Close', 'Volume']
 
 
 class CalculateTechnicals(Action):
@@ -88,6 +109,13 @@ class CalculateTechnicals(Action):
     
     # Output directory for saving technical analysis results
     output_dir: Path = Field(default=Path("MAT/report/TA"))
+
+    # Parquet store for historical (start/end) price windows, shared across runs of a backtest
+    price_cache_dir: Path = Field(default=Path("MAT/cache"))
+
+    # Shared instance returned by get(), and the keep-alive HTTP session passed to yfinance
+    _singleton: ClassVar[Optional["CalculateTechnicals"]] = None
+    _http_session: ClassVar[Any] = None
     
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -113,8 +141,45 @@ class CalculateTechnicals(Action):
 
         # Note: output_dir uses Field default (MAT/report/TA) unless overridden in config
 
+        # Compile the indicator kernels up front (no-op without numba or when already warm)
+        indicator_kernels.warmup()
+
         logger.info(f"📈 CalculateTechnicals initialized (RSI={self.rsi_period}, BB={self.bb_period}, SMA={self.sma_period})")
         logger.info(f"📁 Output directory: {self.output_dir}")
+
+    @classmethod
+    def get(cls) -> "CalculateTechnicals":
+        """
+        Get the shared CalculateTechnicals instance, building it on first use.
+
+        Every TechnicalAnalyst uses this instance, so config loading, kernel
+        warm-up and the HTTP session are set up once per process.
+
+        Returns:
+            The shared CalculateTechnicals action
+        """
+        if cls._singleton is None:
+            cls._singleton = cls()
+        return cls._singleton
+
+    @classmethod
+    def _download_kwargs(cls) -> Dict[str, Any]:
+        """
+        Get the extra yf.download() arguments that route requests through the shared session.
+
+        yfinance only accepts curl_cffi sessions, so without curl_cffi this is
+        empty and yfinance keeps managing its own connections.
+
+        Returns:
+            {"session": session} or an empty dict
+        """
+        if cls._http_session is None:
+            try:
+                from curl_cffi import requests as curl_requests
+            except ImportError:
+                return {}
+            cls._http_session = curl_requests.Session(impersonate="chrome")
+        return {"session": cls._http_session}
     
     async def run(
         self,
@@ -203,6 +268,224 @@ class CalculateTechnicals(Action):
             logger.debug(traceback.format_exc())
             return self._create_default_report(ticker, error_message=str(e))
     
+    async def run_batch(
+        self,
+        tickers: List[str],
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None
+    ) -> List[TAReport]:
+        """
+        Calculate technicals for several tickers sharing one time window.
+
+        Prices for all uncached tickers are fetched with a single multi-ticker
+        yf.download in a worker thread (yfinance's own thread pool downloads them in
+        parallel), then each ticker's indicators and LLM interpretation run concurrently.
+
+        Args:
+            tickers: Stock ticker symbols
+            start_date: Optional start date in format "YYYY-MM-DD"
+            end_date: Optional end date in format "YYYY-MM-DD"
+
+        Returns:
+            List of TAReports, one per ticker, in the same order as tickers
+        """
+        logger.info(f"📈 CALCULATE TECHNICALS BATCH: {len(tickers)} tickers ({', '.join(tickers)})")
+        await asyncio.to_thread(self._prefetch_stock_data, tickers, start_date, end_date)
+        return list(await asyncio.gather(
+            *(self.run(ticker=ticker, start_date=start_date, end_date=end_date) for ticker in tickers)
+        ))
+
+    def _price_cache_key(
+        self,
+        ticker: str,
+        start_date: Optional[str],
+        end_date: Optional[str]
+    ) -> Tuple[str, str, str, int]:
+        """Build the _PRICE_CACHE key for a ticker and time window."""
+        historical = bool(start_date and end_date)
+        return (ticker, start_date or "", end_date or "", 0 if historical else self.default_period)
+
+    @staticmethod
+    def _get_cached_prices(cache_key: Tuple[str, str, str, int]):
+        """
+        Look up a fresh cached price frame.
+
+        Expired real-time entries are left in place (and reported as a miss) so
+        _extend_realtime_prices() can top them up instead of re-downloading.
+
+        Args:
+            cache_key: Key from _price_cache_key()
+
+        Returns:
+            The cached DataFrame, or None on a miss
+        """
+        cached = _PRICE_CACHE.get(cache_key)
+        if cached is None:
+            return None
+        fetched_at, cached_df = cached
+        historical = cache_key[3] == 0
+        if historical or time.monotonic() - fetched_at < _REALTIME_PRICE_TTL:
+            _PRICE_CACHE.move_to_end(cache_key)
+            return cached_df
+        return None
+
+    @staticmethod
+    def _cache_prices(cache_key: Tuple[str, str, str, int], df) -> None:
+        """Store a validated price frame in _PRICE_CACHE (LRU-bounded)."""
+        _PRICE_CACHE[cache_key] = (time.monotonic(), df)
+        if len(_PRICE_CACHE) > _PRICE_CACHE_MAX:
+            _PRICE_CACHE.popitem(last=False)
+
+    def _price_store_path(self, start_date: str, end_date: str) -> Path:
+        """Path of the Parquet price store for a historical window."""
+        return self.price_cache_dir / f"prices_{start_date}_{end_date}.parquet"
+
+    def _load_stored_prices(self, ticker: str, start_date: str, end_date: str):
+        """
+        Read one ticker's prices from the historical Parquet store.
+
+        The file is memory-mapped and the ticker filter is pushed down to
+        Parquet, so only that ticker's row groups are decoded.
+
+        Args:
+            ticker: Stock ticker symbol
+            start_date: Start date "YYYY-MM-DD"
+            end_date: End date "YYYY-MM-DD"
+
+        Returns:
+            OHLCV DataFrame indexed by Date, or None if pyarrow is missing or the ticker is not stored
+        """
+        if pq is None:
+            return None
+        path = self._price_store_path(start_date, end_date)
+        if not path.exists():
+            return None
+
+        try:
+            table = pq.read_table(
+                path,
+                columns=_PRICE_STORE_COLUMNS,
+                filters=[("ticker", "=", ticker)],
+                memory_map=True
+            )
+        except Exception as e:
+            logger.debug(f"Could not read price store {path}: {e}")
+            return None
+
+        if table.num_rows == 0:
+            return None
+        return table.to_pandas().set_index("Date")
+
+    def _store_prices(self, frames: Dict[str, Any], start_date: str, end_date: str) -> None:
+        """
+        Add downloaded historical frames to the Parquet store for their window.
+
+        Existing rows for the same tickers are replaced; other tickers are kept.
+        The new file is written next to the store and swapped in with os.replace,
+        so readers never see a partial file. An unreadable store is treated as
+        missing and overwritten.
+
+        Args:
+            frames: Ticker -> validated OHLCV DataFrame
+            start_date: Start date "YYYY-MM-DD"
+            end_date: End date "YYYY-MM-DD"
+        """
+        if pq is None or not frames:
+            return
+        path = self._price_store_path(start_date, end_date)
+
+        try:
+            parts = [
+                df.rename_axis("Date").reset_index()[_PRICE_STORE_COLUMNS].assign(ticker=ticker)
+                for ticker, df in frames.items()
+            ]
+            if path.exists():
+                try:
+                    stored = pq.read_table(path).to_pandas()
+                    parts.insert(0, stored[~stored["ticker"].isin(list(frames))])
+                except Exception as e:
+                    logger.warning(f"⚠️ Price store {path} is unreadable, overwriting it: {e}")
+
+            path.parent.mkdir(parents=True, exist_ok=True)
+            table = pa.Table.from_pandas(pd.concat(parts, ignore_index=True), preserve_index=False)
+            tmp_path = path.with_suffix(".tmp")
+            pq.write_table(table, tmp_path)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.debug(f"Could not update price store {path}: {e}")
+
+    def _prefetch_stock_data(
+        self,
+        tickers: List[str],
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None
+    ) -> None:
+        """
+        Download prices for all uncached tickers in one multi-ticker yf.download call.
+
+        Frames that pass validation are stored in the price cache so the
+        per-ticker run() finds them; anything missing or malformed is left
+        for run() to download (and report) individually.
+
+        Args:
+            tickers: Stock ticker symbols
+            start_date: Optional start date "YYYY-MM-DD"
+            end_date: Optional end date "YYYY-MM-DD"
+        """
+        historical = bool(start_date and end_date)
+        missing = []
+        for ticker in dict.fromkeys(tickers):
+            cache_key = self._price_cache_key(ticker, start_date, end_date)
+            if self._get_cached_prices(cache_key) is not None:
+                continue
+            stored_df = self._load_stored_prices(ticker, start_date, end_date) if historical else None
+            if stored_df is not None:
+                self._cache_prices(cache_key, stored_df)
+            else:
+                missing.append(ticker)
+        if len(missing) < 2:
+            return
+
+        try:
+            import yfinance as yf
+        except ImportError:
+            return
+
+        if start_date and end_date:
+            window = {"start": start_date, "end": end_date}
+        else:
+            window = {"period": f"{self.default_period}d"}
+
+        try:
+            logger.info(f"🌐 Downloading stock data for {len(missing)} tickers from Yahoo Finance...")
+            data = yf.download(
+                " ".join(missing),
+                group_by="ticker",
+                progress=False,
+                auto_adjust=True,
+                threads=True,
+                **window,
+                **self._download_kwargs()
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ Batch download failed, falling back to per-ticker downloads: {e}")
+            return
+
+        required_columns = ['Open', 'High', 'Low', 'Close', 'Volume']
+        downloaded = {}
+        for ticker in missing:
+            try:
+                df = data[ticker].dropna(how="all")
+            except KeyError:
+                continue
+            if df.empty or any(col not in df.columns for col in required_columns):
+                continue
+            self._cache_prices(self._price_cache_key(ticker, start_date, end_date), df)
+            downloaded[ticker] = df
+
+        if historical:
+            self._store_prices(downloaded, start_date, end_date)
+
     async def _download_stock_data(
         self,
         ticker: str,
@@ -218,14 +501,33 @@ class CalculateTechnicals(Action):
             end_date: Optional end date "YYYY-MM-DD"
             
         Returns:
-            pandas DataFrame with OHLCV data, or None if failed
+            pandas DataFrame with OHLCV data, or None if failed. The frame may be
+            shared with the download cache and must not be mutated in place.
         """
+        cache_key = self._price_cache_key(ticker, start_date, end_date)
+        cached_df = self._get_cached_prices(cache_key)
+        if cached_df is not None:
+            logger.info(f"💾 Using cached price data for {ticker} ({len(cached_df)} trading days)")
+            return cached_df
+
+        if start_date and end_date:
+            stored_df = self._load_stored_prices(ticker, start_date, end_date)
+            if stored_df is not None:
+                logger.info(f"💾 Using stored price data for {ticker} ({len(stored_df)} trading days)")
+                self._cache_prices(cache_key, stored_df)
+                return stored_df
+
         try:
             import yfinance as yf
         except ImportError:
             logger.error("❌ yfinance not installed. Run: pip install yfinance")
             return None
         
+        if not (start_date and end_date):
+            extended_df = self._extend_realtime_prices(yf, ticker, cache_key)
+            if extended_df is not None:
+                return extended_df
+
         try:
             logger.info("🌐 Downloading stock data from Yahoo Finance...")
             
@@ -238,7 +540,8 @@ class CalculateTechnicals(Action):
                     end=end_date,
                     progress=False,
                     auto_adjust=True,  # Adjust for splits and dividends
-                    threads=False      # Avoid threading issues
+                    threads=False,     # Avoid threading issues
+                    **self._download_kwargs()
                 )
                 logger.info(f"   Downloaded historical data: {start_date} to {end_date}")
             else:
@@ -248,7 +551,8 @@ class CalculateTechnicals(Action):
                     period=f"{self.default_period}d",
                     progress=False,
                     auto_adjust=True,
-                    threads=False
+                    threads=False,
+                    **self._download_kwargs()
                 )
                 logger.info(f"   Downloaded recent data: last {self.default_period} days")
             
@@ -274,6 +578,10 @@ class CalculateTechnicals(Action):
             
             logger.info(f"   Data range: {df.index[0].date()} to {df.index[-1].date()}")
             logger.info(f"   Trading days: {len(df)}")
+
+            self._cache_prices(cache_key, df)
+            if start_date and end_date:
+                self._store_prices({ticker: df}, start_date, end_date)
             
             return df
             
@@ -286,9 +594,60 @@ class CalculateTechnicals(Action):
             logger.error(f"   3. Update yfinance: pip install --upgrade yfinance")
             return None
     
+    def _extend_realtime_prices(self, yf, ticker: str, cache_key: Tuple[str, str, str, int]):
+        """
+        Top up an expired real-time price frame with only the bars from its last date on.
+
+        The last cached bar is downloaded again because it may have been a partial
+        intraday bar; the de-duplication below replaces it with the fresh one.
+
+        Args:
+            yf: The imported yfinance module
+            ticker: Stock ticker symbol
+            cache_key: Real-time key from _price_cache_key()
+
+        Returns:
+            The extended DataFrame (also re-cached), or None to fall back to a full download
+        """
+        cached = _PRICE_CACHE.get(cache_key)
+        if cached is None:
+            return None
+        stale_df = cached[1]
+
+        try:
+            last_day = stale_df.index[-1].strftime("%Y-%m-%d")
+            new_df = yf.download(
+                ticker, start=last_day, progress=False, auto_adjust=True, threads=False, **self._download_kwargs()
+            )
+        except Exception as e:
+            logger.debug(f"Incremental price download failed for {ticker}: {e}")
+            return None
+
+        if isinstance(new_df.columns, pd.MultiIndex):
+            new_df.columns = new_df.columns.get_level_values(0)
+
+        new_days = len(new_df.index.difference(stale_df.index))
+        if new_df.empty:
+            merged = stale_df
+        elif all(col in new_df.columns for col in stale_df.columns):
+            merged = pd.concat([stale_df, new_df[stale_df.columns]])
+            # keep="last" refreshes the re-fetched (possibly partial) last cached bar
+            merged = merged[~merged.index.duplicated(keep="last")]
+            # Keep the same trailing window a fresh period download would return
+            merged = merged[merged.index > merged.index[-1] - pd.Timedelta(days=self.default_period)]
+        else:
+            return None
+
+        logger.info(f"🌐 Extended cached price data for {ticker} with {new_days} new trading days")
+        self._cache_prices(cache_key, merged)
+        return merged
+
     async def _calculate_indicators(self, df, ticker: str):
         """
-        Calculate technical indicators using pandas_ta.
+        Calculate technical indicators.
+
+        Uses the Numba-JIT kernels in indicator_kernels when numba is installed,
+        otherwise pandas_ta.
 
         Indicators:
         - RSI (Relative Strength Index, 14-period)
@@ -303,48 +662,35 @@ class CalculateTechnicals(Action):
         Returns:
             DataFrame with added indicator columns, or None if failed
         """
-        try:
-            import pandas_ta as ta
-        except ImportError:
-            logger.error("❌ pandas_ta not installed. Run: pip install pandas_ta")
-            return None
-
         try:
             logger.info("🔢 Calculating technical indicators...")
 
             # Make a copy to avoid modifying original
             df = df.copy()
 
-            # Calculate RSI (Relative Strength Index)
-            df['RSI'] = ta.rsi(df['Close'], length=self.rsi_period)
-            logger.info(f"   ✅ RSI({self.rsi_period}) calculated")
-
-            # Calculate Bollinger Bands
-            bbands = ta.bbands(df['Close'], length=self.bb_period, std=self.bb_std)
-            if bbands is not None:
-                df['BB_Lower'] = bbands[f'BBL_{self.bb_period}_{self.bb_std}']
-                df['BB_Middle'] = bbands[f'BBM_{self.bb_period}_{self.bb_std}']
-                df['BB_Upper'] = bbands[f'BBU_{self.bb_period}_{self.bb_std}']
-                logger.info(f"   ✅ Bollinger Bands({self.bb_period}, {self.bb_std}) calculated")
-            else:
-                logger.warning("   ⚠️ Bollinger Bands calculation returned None")
-                df['BB_Lower'] = df['Close']
-                df['BB_Middle'] = df['Close']
-                df['BB_Upper'] = df['Close']
-
-            # Calculate Multi-Period SMAs (Simple Moving Averages) for trend structure
-            df['SMA_20'] = ta.sma(df['Close'], length=20)
-            logger.info(f"   ✅ SMA(20) calculated - short-term trend")
-
-            df['SMA_50'] = ta.sma(df['Close'], length=50)
-            logger.info(f"   ✅ SMA(50) calculated - medium-term trend")
-
-            df['SMA_200'] = ta.sma(df['Close'], length=self.sma_period)
-            logger.info(f"   ✅ SMA({self.sma_period}) calculated - long-term trend")
-
-            # Calculate ATR (Average True Range) for volatility
-            df['ATR'] = ta.atr(df['High'], df['Low'], df['Close'], length=self.atr_period)
-            logger.info(f"   ✅ ATR({self.atr_period}) calculated")
+            # Contiguous float64 buffers for the kernels (yfinance frames can yield strided column views)
+            close = np.ascontiguousarray(df['Close'].to_numpy(), dtype=np.float64)
+            high = np.ascontiguousarray(df['High'].to_numpy(), dtype=np.float64)
+            low = np.ascontiguousarray(df['Low'].to_numpy(), dtype=np.float64)
+
+            if indicator_kernels.NUMBA_AVAILABLE and not (
+                np.isnan(close).any() or np.isnan(high).any() or np.isnan(low).any()
+            ):
+                (
+                    df['RSI'], df['BB_Lower'], df['BB_Middle'], df['BB_Upper'],
+                    df['SMA_20'], df['SMA_50'], df['SMA_200'], df['ATR']
+                ) = indicator_kernels.fused_indicators(
+                    close, high, low,
+                    self.bb_period, float(self.bb_std),
+                    20, 50, self.sma_period,
+                    self.rsi_period, self.atr_period
+                )
+                logger.info(
+                    f"   ✅ RSI({self.rsi_period}), BB({self.bb_period}, {self.bb_std}), "
+                    f"SMA(20/50/{self.sma_period}), ATR({self.atr_period}) calculated (Numba kernels)"
+                )
+            elif not self._calculate_indicators_pandas_ta(df):
+                return None
 
             # Drop rows with NaN values (initial periods where indicators can't be calculated)
             initial_rows = len(df)
@@ -368,6 +714,54 @@ class CalculateTechnicals(Action):
             logger.debug(traceback.format_exc())
             return None
     
+    def _calculate_indicators_pandas_ta(self, df) -> bool:
+        """
+        Add indicator columns to df in place using pandas_ta (fallback when numba is unavailable).
+
+        Args:
+            df: DataFrame with OHLCV data (modified in place)
+
+        Returns:
+            True on success, False if pandas_ta is not installed
+        """
+        try:
+            import pandas_ta as ta
+        except ImportError:
+            logger.error("❌ pandas_ta not installed. Run: pip install pandas_ta")
+            return False
+
+        # Calculate RSI (Relative Strength Index)
+        df['RSI'] = ta.rsi(df['Close'], length=self.rsi_period)
+        logger.info(f"   ✅ RSI({self.rsi_period}) calculated")
+
+        # Calculate Bollinger Bands
+        bbands = ta.bbands(df['Close'], length=self.bb_period, std=self.bb_std)
+        if bbands is not None:
+            df['BB_Lower'] = bbands[f'BBL_{self.bb_period}_{self.bb_std}']
+            df['BB_Middle'] = bbands[f'BBM_{self.bb_period}_{self.bb_std}']
+            df['BB_Upper'] = bbands[f'BBU_{self.bb_period}_{self.bb_std}']
+            logger.info(f"   ✅ Bollinger Bands({self.bb_period}, {self.bb_std}) calculated")
+        else:
+            logger.warning("   ⚠️ Bollinger Bands calculation returned None")
+            df['BB_Lower'] = df['Close']
+            df['BB_Middle'] = df['Close']
+            df['BB_Upper'] = df['Close']
+
+        # Calculate Multi-Period SMAs (Simple Moving Averages) for trend structure
+        df['SMA_20'] = ta.sma(df['Close'], length=20)
+        logger.info(f"   ✅ SMA(20) calculated - short-term trend")
+
+        df['SMA_50'] = ta.sma(df['Close'], length=50)
+        logger.info(f"   ✅ SMA(50) calculated - medium-term trend")
+
+        df['SMA_200'] = ta.sma(df['Close'], length=self.sma_period)
+        logger.info(f"   ✅ SMA({self.sma_period}) calculated - long-term trend")
+
+        # Calculate ATR (Average True Range) for volatility
+        df['ATR'] = ta.atr(df['High'], df['Low'], df['Close'], length=self.atr_period)
+        logger.info(f"   ✅ ATR({self.atr_period}) calculated")
+        return True
+
     async def _generate_ta_report(
         self,
         ticker: str,
@@ -608,7 +1002,7 @@ CRITICAL: You are providing PURE DESCRIPTIVE EVIDENCE using API-derived metrics
 
             # Parse JSON response robustly (handles Markdown wrapping)
             from MAT.roles.base_agent import BaseInvestmentAgent
-            response_data = BaseInvestmentAgent.parse_json_robustly(response)
+            response_data = await BaseInvestmentAgent.parse_json_robustly_async(response)
 
             # Log LLM evidence-based analysis
             logger.info(f"\n🧠 LLM Technical Evidence Analysis:")
@@ -622,7 +1016,7 @@ CRITICAL: You are providing PURE DESCRIPTIVE EVIDENCE using API-derived metrics
                 "market_regime": response_data.get('market_regime', 'Neutral Consolidation'),
                 "indicator_tension_analysis": response_data.get('indicator_tension_analysis', 'No analysis available'),
                 "dead_cat_vs_value": response_data.get('dead_cat_vs_value', 'Insufficient data'),
-                "pivot_zones": response_data.get('pivot_zones', {})
+                "pivot_zones": PivotZones.from_raw(response_data.get('pivot_zones'))
             }
 
         except Exception as e:
@@ -636,12 +1030,12 @@ CRITICAL: You are providing PURE DESCRIPTIVE EVIDENCE using API-derived metrics
                 "market_regime": "Analysis Failed",
                 "indicator_tension_analysis": f"LLM analysis failed: {str(e)}",
                 "dead_cat_vs_value": "Unable to categorize due to analysis failure",
-                "pivot_zones": {
-                    "ma200_level": sma_200,
-                    "ma50_level": sma_50,
-                    "ma20_level": sma_20,
-                    "bb_middle": bb_middle
-                }
+                "pivot_zones": PivotZones(
+                    ma200_level=sma_200,
+                    ma50_level=sma_50,
+                    ma20_level=sma_20,
+                    bb_middle=bb_middle
+                )
             }
 
     def _save_technical_results(
@@ -683,10 +1077,7 @@ CRITICAL: You are providing PURE DESCRIPTIVE EVIDENCE using API-derived metrics
         
         try:
             # Save TAReport as JSON
-            report_dict = ta_report.model_dump()
-
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(report_dict, f, indent=2, ensure_ascii=False, default=str)
+            json_path.write_bytes(ta_report.to_json(indent=True))
             
             # Save full data with indicators as CSV
             df.to_csv(csv_path)
@@ -790,6 +1181,6 @@ CRITICAL: You are providing PURE DESCRIPTIVE EVIDENCE using API-derived metrics
             market_regime="Analysis Failed",
             indicator_tension_analysis=f"Unable to perform analysis: {error_message}",
             dead_cat_vs_value="Insufficient data for categorization",
-            pivot_zones={}
+            pivot_zones=PivotZones()
         )
 
@@ -0,0 +1,143 @@
+"""
+Filename: MetaGPT-Ewan/MAT/actions/indicator_kernels.py
+Created Date: Friday, October 16th 2026
+Author: Ewan Su
+Description: Numba-JIT technical indicator kernels used by CalculateTechnicals.
+
+The kernels operate on float64 NumPy arrays and return full-length series with
+NaN during each indicator's warm-up period, matching the pandas_ta definitions
+CalculateTechnicals used before:
+- SMA: simple rolling mean
+- Bollinger Bands: SMA +/- k * rolling population std (ddof=0)
+- RSI / ATR: Wilder smoothing as pandas_ta's rma, i.e. ewm(alpha=1/n, min_periods=n, adjust=True)
+
+numba is optional. Without it NUMBA_AVAILABLE is False and callers should keep
+using pandas_ta, since the plain-Python loops would be slower than pandas.
+Inputs must not contain NaN (callers fall back to pandas_ta in that case).
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    njit = None
+    NUMBA_AVAILABLE = False
+
+
+def _jit(fn):
+    """Compile fn with numba (cached on disk) when available, else return it unchanged."""
+    return njit(cache=True)(fn) if NUMBA_AVAILABLE else fn
+
+
+@_jit
+def fused_indicators(close, high, low, bb_n, bb_k, sma_short_n, sma_mid_n, sma_long_n, rsi_n, atr_n):
+    """
+    All CalculateTechnicals indicators in one pass over the price arrays.
+
+    Produces the pandas_ta Bollinger Bands, three SMAs, RSI and ATR (Wilder
+    averages matching pandas ewm(alpha=1/n, adjust=True, min_periods=n)),
+    streaming close/high/low once instead of once per indicator and without
+    intermediate gain/loss/true-range arrays.
+
+    Returns:
+        (rsi, bb_lower, bb_middle, bb_upper, sma_short, sma_mid, sma_long, atr)
+    """
+    size = close.shape[0]
+    rsi_out = np.full(size, np.nan)
+    bb_lower = np.full(size, np.nan)
+    bb_middle = np.full(size, np.nan)
+    bb_upper = np.full(size, np.nan)
+    sma_short = np.full(size, np.nan)
+    sma_mid = np.full(size, np.nan)
+    sma_long = np.full(size, np.nan)
+    atr_out = np.full(size, np.nan)
+
+    bb_total = 0.0
+    bb_total_sq = 0.0
+    short_total = 0.0
+    mid_total = 0.0
+    long_total = 0.0
+
+    rsi_decay = 1.0 - 1.0 / rsi_n
+    gain_num = 0.0
+    loss_num = 0.0
+    rsi_den = 0.0
+    atr_decay = 1.0 - 1.0 / atr_n
+    tr_num = 0.0
+    atr_den = 0.0
+
+    for i in range(size):
+        v = close[i]
+
+        # Bollinger Bands
+        bb_total += v
+        bb_total_sq += v * v
+        if i >= bb_n:
+            old = close[i - bb_n]
+            bb_total -= old
+            bb_total_sq -= old * old
+        if i >= bb_n - 1:
+            mean = bb_total / bb_n
+            var = bb_total_sq / bb_n - mean * mean
+            std = np.sqrt(var) if var > 0.0 else 0.0
+            bb_middle[i] = mean
+            bb_lower[i] = mean - bb_k * std
+            bb_upper[i] = mean + bb_k * std
+
+        # SMAs
+        short_total += v
+        if i >= sma_short_n:
+            short_total -= close[i - sma_short_n]
+        if i >= sma_short_n - 1:
+            sma_short[i] = short_total / sma_short_n
+        mid_total += v
+        if i >= sma_mid_n:
+            mid_total -= close[i - sma_mid_n]
+        if i >= sma_mid_n - 1:
+            sma_mid[i] = mid_total / sma_mid_n
+        long_total += v
+        if i >= sma_long_n:
+            long_total -= close[i - sma_long_n]
+        if i >= sma_long_n - 1:
+            sma_long[i] = long_total / sma_long_n
+
+        if i == 0:
+            continue
+
+        # RSI and ATR: Wilder averages start at the first price change (index 1)
+        prev_close = close[i - 1]
+        d = v - prev_close
+        gain = d if d > 0.0 else 0.0
+        loss = -d if d < 0.0 else 0.0
+        gain_num = gain + rsi_decay * gain_num
+        loss_num = loss + rsi_decay * loss_num
+        rsi_den = 1.0 + rsi_decay * rsi_den
+        if i >= rsi_n:
+            avg_gain = gain_num / rsi_den
+            denom = avg_gain + loss_num / rsi_den
+            if denom != 0.0:
+                rsi_out[i] = 100.0 * avg_gain / denom
+
+        tr = max(abs(high[i] - low[i]), abs(high[i] - prev_close), abs(prev_close - low[i]))
+        tr_num = tr + atr_decay * tr_num
+        atr_den = 1.0 + atr_decay * atr_den
+        if i >= atr_n:
+            atr_out[i] = tr_num / atr_den
+
+    return rsi_out, bb_lower, bb_middle, bb_upper, sma_short, sma_mid, sma_long, atr_out
+
+
+_warmed_up = False
+
+
+def warmup() -> None:
+    """Compile fused_indicators once on a small dummy series so the first analysis does not pay JIT cost."""
+    global _warmed_up
+    if _warmed_up or not NUMBA_AVAILABLE:
+        return
+    dummy = np.linspace(100.0, 120.0, 250)
+    fused_indicators(dummy, dummy + 1.0, dummy - 1.0, 20, 2.0, 20, 50, 200, 14, 14)
+    _warmed_up = True
+
@@ -24,7 +24,7 @@ from metagpt.actions import Action
 from metagpt.logs import logger
 from pydantic import Field
 
-from ..schemas import FAReport, FinancialMetric
+from ..schemas import FAReport, FinancialMetric, MetricMeta
 from ..config_loader import get_config
 
 
@@ -200,6 +200,7 @@ class RetrieveRAGData(Action):
 
     # Query parameters
     top_k: int = Field(default=5, description="Number of chunks to retrieve per query")
+    batch_concurrency: int = Field(default=2, description="Max tickers retrieved concurrently by run_batch()")
 
     # Output directory for saving RAG results (for debugging/audit)
     output_dir: Path = Field(default=Path("MAT/report/RA"))
@@ -323,6 +324,39 @@ class RetrieveRAGData(Action):
         except Exception as e:
             logger.error(f"❌ RetrieveRAGData failed: {e}")
             return self._create_default_report(ticker, error_message=str(e))
+
+    async def run_batch(
+        self,
+        tickers: List[str],
+        fiscal_year: Optional[int] = None,
+        llm_callback: Optional[Any] = None
+    ) -> List[FAReport]:
+        """
+        Retrieve fundamental data for several tickers in one call.
+
+        RAGFlow has no multi-question retrieval endpoint and each query is
+        filtered to a single ticker, so this runs the per-ticker pipelines
+        concurrently (at most batch_concurrency at a time, since unbounded
+        parallel queries time out on RAGFlow) and returns the reports in
+        input order. run() never raises, so a failing ticker yields a default
+        FAReport rather than aborting the batch.
+
+        Args:
+            tickers: Stock ticker symbols to analyze
+            fiscal_year: Optional fiscal year to focus on (shared by all tickers)
+            llm_callback: Optional callback for LLM analysis (default: use self._aask)
+
+        Returns:
+            List of FAReports, one per ticker, in the same order as tickers
+        """
+        logger.info(f"📚 RETRIEVE RAG DATA BATCH: {len(tickers)} tickers ({', '.join(tickers)})")
+        semaphore = asyncio.Semaphore(max(1, self.batch_concurrency))
+
+        async def _run_one(ticker: str) -> FAReport:
+            async with semaphore:
+                return await self.run(ticker=ticker, fiscal_year=fiscal_year, llm_callback=llm_callback)
+
+        return list(await asyncio.gather(*(_run_one(ticker) for ticker in tickers)))
     
     def _is_ragflow_configured(self) -> bool:
         """
@@ -812,7 +846,7 @@ NOTE: source_citations field removed - all source integrity is tracked within ea
                 response = await self._aask(prompt)
             
             # Parse LLM response
-            parsed = self._parse_llm_response(response, ticker)
+            parsed = await self._parse_llm_response(response, ticker)
             
             # Create FAReport from parsed data
             fa_report = FAReport(**parsed)
@@ -866,7 +900,7 @@ NOTE: source_citations field removed - all source integrity is tracked within ea
         
         return "\n".join(content_parts)
     
-    def _parse_llm_response(self, response: str, ticker: str) -> Dict:
+    async def _parse_llm_response(self, response: str, ticker: str) -> Dict:
         """
         Parse LLM JSON response with robust error handling.
 
@@ -880,7 +914,7 @@ NOTE: source_citations field removed - all source integrity is tracked within ea
         try:
             # Parse JSON robustly (handles Markdown wrapping)
             from MAT.roles.base_agent import BaseInvestmentAgent
-            data = BaseInvestmentAgent.parse_json_robustly(response)
+            data = await BaseInvestmentAgent.parse_json_robustly_async(response)
 
             # Parse NEW schema fields matching FAReport structure
             # Support both old field names (evidence_chunk) and new (evidence_md) for backward compatibility
@@ -892,7 +926,7 @@ NOTE: source_citations field removed - all source integrity is tracked within ea
                     "evidence_md": data.get("revenue_performance", {}).get("evidence_md") or data.get("revenue_performance", {}).get("evidence_chunk", "No evidence available"),
                     "source_link": data.get("revenue_performance", {}).get("source_link", "No source link available"),
                     "source_url": data.get("revenue_performance", {}).get("source_url", "No source URL available"),
-                    "metadata": data.get("revenue_performance", {}).get("metadata", {})
+                    "metadata": MetricMeta.from_raw(data.get("revenue_performance", {}).get("metadata"))
                 },
                 "profitability_audit": {
                     "value": data.get("profitability_audit", {}).get("value"),
@@ -900,7 +934,7 @@ NOTE: source_citations field removed - all source integrity is tracked within ea
                     "evidence_md": data.get("profitability_audit", {}).get("evidence_md") or data.get("profitability_audit", {}).get("evidence_chunk", "No evidence available"),
                     "source_link": data.get("profitability_audit", {}).get("source_link", "No source link available"),
                     "source_url": data.get("profitability_audit", {}).get("source_url", "No source URL available"),
-                    "metadata": data.get("profitability_audit", {}).get("metadata", {})
+                    "metadata": MetricMeta.from_raw(data.get("profitability_audit", {}).get("metadata"))
                 },
                 "cash_flow_stability": {
                     "value": data.get("cash_flow_stability", {}).get("value"),
@@ -908,7 +942,7 @@ NOTE: source_citations field removed - all source integrity is tracked within ea
                     "evidence_md": data.get("cash_flow_stability", {}).get("evidence_md") or data.get("cash_flow_stability", {}).get("evidence_chunk", "No evidence available"),
                     "source_link": data.get("cash_flow_stability", {}).get("source_link", "No source link available"),
                     "source_url": data.get("cash_flow_stability", {}).get("source_url", "No source URL available"),
-                    "metadata": data.get("cash_flow_stability", {}).get("metadata", {})
+                    "metadata": MetricMeta.from_raw(data.get("cash_flow_stability", {}).get("metadata"))
                 },
                 "management_guidance_audit": data.get("management_guidance_audit", "No guidance analysis available"),
                 "key_risks_evidence": data.get("key_risks_evidence", [])
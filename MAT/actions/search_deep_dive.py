@@ -14,7 +14,8 @@ Configuration:
 
 import re
 import json
-from typing import List, Dict, Optional, Any
+from functools import lru_cache
+from typing import List, Dict, Optional, Any, Tuple
 from datetime import datetime
 from pathlib import Path
 
@@ -62,6 +63,95 @@ TICKER_TO_COMPANY = {
 }
 
 
+# Common words filtered out of context issues when extracting query key terms
+_STOP_WORDS = frozenset({
+    "the", "a", "an", "is", "are", "was", "were", "be", "been", "being",
+    "have", "has", "had", "do", "does", "did", "will", "would", "could",
+    "should", "may", "might", "must", "shall", "can", "need", "dare",
+    "and", "but", "or", "nor", "for", "yet", "so", "as", "if", "then",
+    "than", "that", "this", "these", "those", "it", "its", "of", "to",
+    "in", "on", "at", "by", "with", "from", "into", "onto", "upon",
+    "about", "above", "below", "between", "under", "over", "through",
+    "during", "before", "after", "while", "because", "although", "though",
+    "signal", "bullish", "bearish", "sentiment", "negative", "positive",
+    "conflict", "detected", "unclear", "analysis", "analyst"
+})
+
+_WORD_RE = re.compile(r'\b[a-zA-Z]{3,}\b')
+
+# Analytical keywords to add depth to search
+_ANALYTICAL_KEYWORDS = ("reason", "analysis", "impact", "official statement")
+
+
+@lru_cache(maxsize=256)
+def extract_key_terms(context_issue: str) -> Tuple[str, ...]:
+    """
+    Extract key terms from a context issue (memoized; issues recur across runs and retries).
+
+    Args:
+        context_issue: The conflict description
+
+    Returns:
+        Unique non-stop-word terms in order of first appearance
+    """
+    words = _WORD_RE.findall(context_issue.lower())
+    # dict.fromkeys removes duplicates while preserving order
+    return tuple(dict.fromkeys(w for w in words if w not in _STOP_WORDS))
+
+
+@lru_cache(maxsize=256)
+def build_investigation_query(ticker: str, context_issue: str, reference_date: Optional[str] = None) -> str:
+    """
+    Build an intelligent search query combining ticker and context issue (memoized).
+
+    Query Engineering Strategy:
+    1. Include company name (not just ticker) for broader results
+    2. Extract key terms from context_issue
+    3. Add analytical keywords for deeper insights
+    4. Include "official statement" for authoritative sources
+
+    Args:
+        ticker: Stock ticker symbol (e.g., "NVDA")
+        context_issue: The specific conflict/issue to investigate
+        reference_date: Optional reference date "YYYY-MM-DD" for time context
+
+    Returns:
+        Optimized search query string
+
+    Example:
+        Input: ticker="NVDA", context="CFO resignation"
+        Output: "Nvidia NVDA CFO resignation reason analysis official statement"
+    """
+    # Get company name from mapping, or use ticker as fallback
+    company_name = TICKER_TO_COMPANY.get(ticker.upper(), ticker)
+
+    key_terms = extract_key_terms(context_issue)
+
+    # Add time context if reference_date is provided
+    time_context = ""
+    if reference_date:
+        ref_dt = datetime.strptime(reference_date, "%Y-%m-%d")
+        quarter = (ref_dt.month - 1) // 3 + 1
+        time_context = f"Q{quarter} {ref_dt.year}"
+
+    # Build the query
+    query_parts = [
+        company_name,
+        ticker.upper(),
+        " ".join(key_terms[:5]),  # Top 5 key terms
+        " ".join(_ANALYTICAL_KEYWORDS[:3]),  # Add 3 analytical keywords
+        time_context  # Add time context if available
+    ]
+
+    query = " ".join([p for p in query_parts if p])  # Filter out empty strings
+
+    # Limit query length to avoid API issues
+    if len(query) > 300:
+        query = query[:300]
+
+    return query.strip()
+
+
 class SearchDeepDive(Action):
     """
     Deep dive search action using Tavily API for targeted investigation.
@@ -310,57 +400,18 @@ class SearchDeepDive(Action):
         """
         Build an intelligent search query combining ticker and context issue.
 
-        Query Engineering Strategy:
-        1. Include company name (not just ticker) for broader results
-        2. Extract key terms from context_issue
-        3. Add analytical keywords for deeper insights
-        4. Include "official statement" for authoritative sources
+        Delegates to the memoized build_investigation_query(); see there for
+        the query engineering strategy.
         
         Args:
             ticker: Stock ticker symbol (e.g., "NVDA")
             context_issue: The specific conflict/issue to investigate
+            reference_date: Optional reference date "YYYY-MM-DD" for time context
             
         Returns:
             Optimized search query string
-            
-        Example:
-            Input: ticker="NVDA", context="CFO resignation"
-            Output: "Nvidia NVDA CFO resignation reason analysis official statement"
         """
-        # Get company name from mapping, or use ticker as fallback
-        company_name = TICKER_TO_COMPANY.get(ticker.upper(), ticker)
-        
-        # Extract key terms from context_issue
-        # Remove common words and extract important terms
-        key_terms = self._extract_key_terms(context_issue)
-        
-        # Analytical keywords to add depth to search
-        analytical_keywords = ["reason", "analysis", "impact", "official statement"]
-
-        # Add time context if reference_date is provided
-        time_context = ""
-        if reference_date:
-            ref_dt = datetime.strptime(reference_date, "%Y-%m-%d")
-            year = ref_dt.year
-            quarter = (ref_dt.month - 1) // 3 + 1
-            time_context = f"Q{quarter} {year}"
-
-        # Build the query
-        query_parts = [
-            company_name,
-            ticker.upper(),
-            " ".join(key_terms[:5]),  # Top 5 key terms
-            " ".join(analytical_keywords[:3]),  # Add 3 analytical keywords
-            time_context  # Add time context if available
-        ]
-
-        query = " ".join([p for p in query_parts if p])  # Filter out empty strings
-        
-        # Limit query length to avoid API issues
-        if len(query) > 300:
-            query = query[:300]
-        
-        return query.strip()
+        return build_investigation_query(ticker, context_issue, reference_date)
     
     def _extract_key_terms(self, context_issue: str) -> List[str]:
         """
@@ -372,33 +423,7 @@ class SearchDeepDive(Action):
         Returns:
             List of key terms
         """
-        # Common words to filter out
-        stop_words = {
-            "the", "a", "an", "is", "are", "was", "were", "be", "been", "being",
-            "have", "has", "had", "do", "does", "did", "will", "would", "could",
-            "should", "may", "might", "must", "shall", "can", "need", "dare",
-            "and", "but", "or", "nor", "for", "yet", "so", "as", "if", "then",
-            "than", "that", "this", "these", "those", "it", "its", "of", "to",
-            "in", "on", "at", "by", "with", "from", "into", "onto", "upon",
-            "about", "above", "below", "between", "under", "over", "through",
-            "during", "before", "after", "while", "because", "although", "though",
-            "signal", "bullish", "bearish", "sentiment", "negative", "positive",
-            "conflict", "detected", "unclear", "analysis", "analyst"
-        }
-        
-        # Extract words and filter
-        words = re.findall(r'\b[a-zA-Z]{3,}\b', context_issue.lower())
-        key_terms = [w for w in words if w not in stop_words]
-        
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_terms = []
-        for term in key_terms:
-            if term not in seen:
-                seen.add(term)
-                unique_terms.append(term)
-        
-        return unique_terms
+        return list(extract_key_terms(context_issue))
     
     async def _execute_tavily_search(
         self,
@@ -569,8 +594,7 @@ class SearchDeepDive(Action):
 
         try:
             # Save structured report as JSON
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(report.model_dump(), f, indent=2, ensure_ascii=False, default=str)
+            json_path.write_bytes(report.to_json(indent=True))
 
             logger.info(f"📁 Structured {mode.upper()} report saved: {json_path}")
 
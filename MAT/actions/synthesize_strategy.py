@@ -15,17 +15,220 @@ Key Design Principles:
 - Schema-compliant output (StrategyDecision Pydantic model)
 """
 
-from typing import Dict, Any, Optional
+import asyncio
+import re
+import traceback
+import types
+from typing import Dict, Any, ClassVar, List, Optional, Tuple
 from pathlib import Path
 
 from metagpt.actions import Action
 from metagpt.logs import logger
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
 from ..schemas import (
     FAReport, TAReport, SAReport, InvestigationReport,
-    StrategyDecision, SignalIntensity
+    StrategyDecision, SignalIntensity, intern_strings
 )
+from ..roles.base_agent import BaseInvestmentAgent, _json_loads
+from ..config_loader import get_config
+
+try:
+    import aiofiles
+except ImportError:
+    # Optional: decision-log writes fall back to a worker thread
+    aiofiles = None
+
+_BANNER = "=" * 80
+
+# Name -> member lookup for LLM-provided signals (unknown names fall back to NEUTRAL)
+_SIGNAL_MAP = SignalIntensity.__members__
+_DEFAULT_LOGIC_CHAIN = ("No logic chain provided",)
+
+# Max decision records written to the JSONL decision log in one append
+_DECISION_LOG_BATCH_SIZE = 50
+
+
+def _append_text(path: Path, text: str) -> None:
+    """Append text to a file synchronously (thread-offloaded fallback for aiofiles)."""
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(text)
+
+# Defaults for the qualitative SA sentiment matrix dimensions
+_SA_MATRIX_DEFAULTS = types.MappingProxyType({
+    "Product_Demand": "Not available",
+    "Macro_Environment": "Not available",
+    "Management_Confidence": "Not available",
+    "Competitive_Position": "Not available",
+})
+
+# Context values used when no SA-Advanced investigation was triggered
+_SA_ADV_DEFAULTS = types.MappingProxyType({
+    "sa_adv_findings": "N/A - Advanced investigation not triggered",
+    "sa_adv_resolved": False,
+    "sa_adv_risk_class": "N/A",
+    "sa_adv_revision": "N/A",
+    "sa_adv_gaps": (),
+    "sa_adv_evidence": (),
+    "sa_adv_confidence": "N/A",
+})
+
+# Per-field character caps for free-text upstream fields injected into prompts.
+# List fields are capped per item; "sa_adv_evidence_items" caps the item count.
+_FIELD_CHAR_LIMITS = types.MappingProxyType({
+    "ra_guidance": 600,
+    "ra_risks": 400,
+    "sa_news_summary": 600,
+    "sa_adv_findings": 800,
+    "sa_adv_evidence": 300,
+    "sa_adv_evidence_items": 3,
+})
+
+
+def _truncate(s: str, max_chars: int = 400) -> str:
+    """Cap a free-text field at max_chars, marking the cut with an ellipsis."""
+    if s is None or len(s) <= max_chars:
+        return s
+    return s[:max_chars] + "…"
+
+
+# Version of the deterministic conflict rules applied before the LLM audit.
+# Bump whenever _STRUCTURAL_RISK_PATTERNS or the rule logic changes.
+DETERMINISTIC_RULES_VERSION = "1.1"
+
+# RA risk phrasing that marks a structural fundamental threat (Value Trap rule).
+# Each pattern needs a threat qualifier next to the topic word, so neutral or
+# reassuring mentions ("low debt", "ample liquidity") do not fire the rule.
+_STRUCTURAL_RISK_PATTERNS = {
+    "debt": re.compile(
+        r"\b(?:rising|increasing|elevated|high|heavy|excessive|mounting|unsustainable)\s+"
+        r"(?:net\s+)?(?:debt|leverage)\b"
+        r"|\bdebt\s+(?:burden|overhang|default|restructuring|covenant\s+breach(?:es)?)\b"
+        r"|\b(?:refinancing|default)\s+risk\b",
+        re.IGNORECASE
+    ),
+    "going concern": re.compile(
+        r"\bgoing[\s-]+concern\s+(?:doubt|warning|risk|uncertainty|qualification|opinion)s?\b"
+        r"|\bsubstantial\s+doubt\b",
+        re.IGNORECASE
+    ),
+    "liquidity": re.compile(
+        r"\bliquidity\s+(?:crunch|crisis|shortfall|squeeze|risk|strain|constraints?|concerns?)\b"
+        r"|\b(?:cash\s+runway|running\s+out\s+of\s+cash)\b",
+        re.IGNORECASE
+    ),
+    "dilution": re.compile(
+        r"\b(?:share(?:holder)?|equity|significant|further)\s+dilution\b"
+        r"|\bdilution\s+risk\b"
+        r"|\bdilutive\s+(?:offering|issuance|financing|raise)s?\b",
+        re.IGNORECASE
+    ),
+}
+
+# A negation just before a threat phrase ("no going concern doubt") cancels the match
+_RISK_NEGATION_RE = re.compile(r"\b(?:no|not|without|never|neither|nor)\b[^.;,\n]{0,20}$", re.IGNORECASE)
+
+# Rough chars-per-token ratio used to keep batched prompts under the input budget
+_CHARS_PER_TOKEN = 4
+
+_BATCH_PROMPT_HEADER = """
+You are the Chief Strategy Auditor. You are in the SYNTHESIS PHASE for a BATCH of tickers. For EACH ticker below, provide the final "Safe-First" investment decision by resolving its evidence conflicts and assigning a definitive signal. Tickers are independent: never mix evidence between sections.
+"""
+
+_BATCH_TICKER_SECTION = """
+=== TICKER {batch_index}: {ticker} ===
+Conflict Analysis: {conflict_issue}
+1. [RA Data]: {ra_revenue_value}, {ra_revenue_analysis}, {ra_profit_analysis}, {ra_cash_analysis}, {ra_guidance}, {ra_risks}
+2. [TA Data]: {ta_market_regime}, {ta_indicator_tension}, {ta_dead_cat_vs_value}
+3. [SA Data]: {sa_news_summary}, {sa_causal_narrative}, {sa_expectation_gap}, {sa_macro_env}, {sa_comp_pos}
+4. [SA-Advanced Investigation]: Resolved: {sa_adv_resolved} | Findings: {sa_adv_findings} | Risk Class: {sa_adv_risk_class} | Revision: {sa_adv_revision} | Confidence: {sa_adv_confidence} | Evidence: {sa_adv_evidence} | Gaps: {sa_adv_gaps}
+"""
+
+_BATCH_PROMPT_FOOTER = """
+=== YOUR DECISION SYNTHESIS TASK (PER TICKER) ===
+1. **The Investigation Override**: If a conflict was identified and the SA-Advanced investigation is unresolved, LOW confidence, or "FUNDAMENTAL_THREAT", you MUST default to "NEUTRAL".
+2. **Quality of Growth Audit**: Justify the action using RA revenue and profit analysis; SA causal narrative and competitive position must support sustainability.
+3. **Technical Execution**: Validate entry timing via TA market regime and structural categorization; reject extreme momentum exhaustion.
+
+=== SIGNAL GUIDELINES ===
+- **STRONG_BUY**: RA, TA, and SA are all bullish; fundamentals strong; technical shows structural value support.
+- **BUY**: Majority bullish; fundamentals solid; technical shows reasonable opportunity; conflicts resolved.
+- **NEUTRAL**: Mixed signals; unresolved investigation; critical evidence gaps; or high risk classification.
+- **SELL**: Majority bearish; fundamentals weakening; technical shows structural resistance.
+- **STRONG_SELL**: All agents bearish; fundamentals deteriorating; technical indicates "Dead Cat Bounce" risk.
+
+=== OUTPUT FORMAT (STRICT JSON) ===
+{
+  "decisions": [
+    {
+      "ticker": "<ticker symbol exactly as given>",
+      "final_action": "STRONG_BUY" | "BUY" | "NEUTRAL" | "SELL" | "STRONG_SELL",
+      "confidence_score": <float 0-100>,
+      "logic_chain": ["Step 1: Metric Check", "Step 2: Analysis Cross-Check", "Step 3: Technical Structure Check", "Step 4: Conflict Resolution"],
+      "risk_notes": "<Actionable risk points>",
+      "suggested_module": "mean_reversion_engine" | "trend_following_engine" | "hold_module",
+      "decision_summary": "<2-3 sentence executive summary>",
+      "conflict_report": "<Summary of detected friction and how it was resolved>"
+    }
+  ]
+}
+
+Return exactly one decision per ticker section, in the same order.
+CRITICAL: Output ONLY the JSON. No markdown code blocks, no explanations.
+"""
+
+# Signed YoY growth in RA revenue values such as "$365.8B, +33% YoY"
+_YOY_PATTERN = re.compile(r'([+-])\s*\d+(?:\.\d+)?%\s*YoY', re.IGNORECASE)
+
+
+def _first_json_object(text: str) -> Optional[str]:
+    """
+    Return the first balanced top-level {...} block in an LLM response.
+
+    A response that already parses as a JSON object is returned unchanged.
+    Otherwise scans once with a brace counter (string/escape aware) and stops
+    at the depth-0 closing brace, so anything the LLM emits after the JSON
+    object is never handed to the parser.
+
+    Args:
+        text: Raw LLM response text
+
+    Returns:
+        The JSON object substring, or None if no balanced object was found
+    """
+    # Fast path: well-formed responses skip the character-by-character scan
+    try:
+        if isinstance(_json_loads(text), dict):
+            return text
+    except ValueError:
+        pass
+
+    start = text.find("{")
+    if start < 0:
+        return None
+
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+
+    return None
 
 
 class AnalyzeConflict(Action):
@@ -42,6 +245,47 @@ class AnalyzeConflict(Action):
     """
 
     name: str = "AnalyzeConflict"
+    field_char_limits: ClassVar[Dict[str, int]] = _FIELD_CHAR_LIMITS
+
+    @staticmethod
+    def _rule_based_conflict_check(context: Dict[str, Any], risks: List[str]) -> Optional[Dict[str, Any]]:
+        """
+        Decide the Structure-Risk Collision (Value Trap) audit rule without the LLM.
+
+        The rule fires when TA categorizes the setup as a "Value Entry
+        Opportunity" while an RA risk states a structural threat (see
+        _STRUCTURAL_RISK_PATTERNS). The remaining audit rules need semantic
+        interpretation and are left to the LLM.
+
+        Args:
+            context: Flat metric context from _extract_metrics_to_context()
+            risks: Full RA key_risks_evidence (context["ra_risks"] is truncated for the prompt)
+
+        Returns:
+            Conflict result dict if the rule fires, otherwise None
+        """
+        if "Value Entry Opportunity" not in context["ta_dead_cat_vs_value"]:
+            return None
+
+        risks_text = "\n".join(risks)
+        matched = [
+            label for label, pattern in _STRUCTURAL_RISK_PATTERNS.items()
+            if any(
+                not _RISK_NEGATION_RE.search(risks_text, 0, m.start())
+                for m in pattern.finditer(risks_text)
+            )
+        ]
+        if not matched:
+            return None
+
+        return {
+            "has_conflict": True,
+            "context_issue": (
+                f"Structure-Risk Collision: TA categorizes the setup as a 'Value Entry Opportunity' "
+                f"but RA risks cite structural threats ({', '.join(matched)}). "
+                f"[deterministic rules v{DETERMINISTIC_RULES_VERSION}]"
+            )
+        }
 
     def _extract_metrics_to_context(
         self,
@@ -65,6 +309,8 @@ class AnalyzeConflict(Action):
         Returns:
             Dictionary with exact parameter names for prompt injection
         """
+        limits = self.field_char_limits
+        sentiment_matrix = {**_SA_MATRIX_DEFAULTS, **sa.sentiment_matrix}
         context = {
             # TA Metrics
             "ta_market_regime": ta.market_regime,
@@ -78,16 +324,16 @@ class AnalyzeConflict(Action):
             "ra_profit_analysis": ra.profitability_audit.analysis,
             "ra_cash_value": ra.cash_flow_stability.value,
             "ra_cash_analysis": ra.cash_flow_stability.analysis,
-            "ra_guidance": ra.management_guidance_audit,
-            "ra_risks": ra.key_risks_evidence,
+            "ra_guidance": _truncate(ra.management_guidance_audit, limits["ra_guidance"]),
+            "ra_risks": [_truncate(risk, limits["ra_risks"]) for risk in ra.key_risks_evidence],
 
             # SA Metrics
-            "sa_news_summary": sa.news_summary,
+            "sa_news_summary": _truncate(sa.news_summary, limits["sa_news_summary"]),
             "sa_sentiment_assessment": sa.qualitative_sentiment_assessment,
-            "sa_product_demand": sa.sentiment_matrix.get("Product_Demand", "Not available"),
-            "sa_macro_env": sa.sentiment_matrix.get("Macro_Environment", "Not available"),
-            "sa_mgmt_conf": sa.sentiment_matrix.get("Management_Confidence", "Not available"),
-            "sa_comp_pos": sa.sentiment_matrix.get("Competitive_Position", "Not available"),
+            "sa_product_demand": sentiment_matrix["Product_Demand"],
+            "sa_macro_env": sentiment_matrix["Macro_Environment"],
+            "sa_mgmt_conf": sentiment_matrix["Management_Confidence"],
+            "sa_comp_pos": sentiment_matrix["Competitive_Position"],
             "sa_causal_narrative": sa.causal_narrative,
             "sa_expectation_gap": sa.expectation_gap,
             "sa_tensions": sa.paradoxes_or_tensions,
@@ -96,25 +342,20 @@ class AnalyzeConflict(Action):
         # SA-Advanced Metrics (if investigation was triggered)
         if sa_adv is not None:
             context.update({
-                "sa_adv_findings": sa_adv.detailed_findings,
+                "sa_adv_findings": _truncate(sa_adv.detailed_findings, limits["sa_adv_findings"]),
                 "sa_adv_resolved": sa_adv.is_ambiguity_resolved,
                 "sa_adv_risk_class": sa_adv.risk_classification,
                 "sa_adv_revision": sa_adv.qualitative_sentiment_revision,
                 "sa_adv_gaps": sa_adv.evidence_gaps,
-                "sa_adv_evidence": sa_adv.key_evidence,
+                "sa_adv_evidence": [
+                    _truncate(item, limits["sa_adv_evidence"])
+                    for item in sa_adv.key_evidence[:limits["sa_adv_evidence_items"]]
+                ],
                 "sa_adv_confidence": sa_adv.confidence_level,
             })
         else:
             # Provide defaults if advanced mode not used
-            context.update({
-                "sa_adv_findings": "N/A - Advanced investigation not triggered",
-                "sa_adv_resolved": False,
-                "sa_adv_risk_class": "N/A",
-                "sa_adv_revision": "N/A",
-                "sa_adv_gaps": [],
-                "sa_adv_evidence": [],
-                "sa_adv_confidence": "N/A",
-            })
+            context.update(_SA_ADV_DEFAULTS)
 
         return context
 
@@ -139,14 +380,23 @@ class AnalyzeConflict(Action):
             - has_conflict: bool indicating if conflict detected
             - context_issue: str describing the conflict (if detected)
         """
-        logger.info(f"\n{'='*80}")
-        logger.info(f"🔍 ANALYZING CONFLICTS for {ticker}")
-        logger.info(f"{'='*80}")
+        logger.info(f"\n{_BANNER}\n🔍 ANALYZING CONFLICTS for {ticker}\n{_BANNER}")
 
         # Step 1: Extract metrics into flat context dictionary
         context = self._extract_metrics_to_context(ra, ta, sa)
         context["ticker"] = ticker
 
+        # Deterministic rules first: the cheapest LLM call is the one not made
+        rule_result = self._rule_based_conflict_check(context, ra.key_risks_evidence)
+        if rule_result is not None:
+            logger.info(
+                f"\n📊 Conflict Analysis Result (rule-based):\n"
+                f"   Has Conflict: {rule_result['has_conflict']}\n"
+                f"   Context Issue: {rule_result['context_issue']}\n"
+                f"{_BANNER}\n"
+            )
+            return rule_result
+
         # Step 2: Build conflict analysis prompt with placeholders
         prompt = """
 You are the Senior Strategy Auditor. You are in the AUDIT PHASE of the investment workflow. Your mission is to detect "Logical Friction" by cross-examining qualitative and quantitative evidence across three dimensions (RA, TA, SA).
@@ -201,16 +451,17 @@ CRITICAL: Output ONLY the JSON. No markdown code blocks, no explanations.
             response = await self._aask(formatted_prompt)
 
             # Step 5: Parse JSON response
-            from MAT.roles.base_agent import BaseInvestmentAgent
-            result = BaseInvestmentAgent.parse_json_robustly(response)
+            result = await BaseInvestmentAgent.parse_json_robustly_async(_first_json_object(response) or response)
 
             has_conflict = result.get("has_conflict", False)
             context_issue = result.get("context_issue", "No conflicts detected")
 
-            logger.info(f"\n📊 Conflict Analysis Result:")
-            logger.info(f"   Has Conflict: {has_conflict}")
-            logger.info(f"   Context Issue: {context_issue}")
-            logger.info(f"{'='*80}\n")
+            logger.info(
+                f"\n📊 Conflict Analysis Result:\n"
+                f"   Has Conflict: {has_conflict}\n"
+                f"   Context Issue: {context_issue}\n"
+                f"{_BANNER}\n"
+            )
 
             return {
                 "has_conflict": has_conflict,
@@ -219,13 +470,12 @@ CRITICAL: Output ONLY the JSON. No markdown code blocks, no explanations.
 
         except Exception as e:
             logger.error(f"❌ Conflict analysis failed: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.opt(lazy=True).debug("{}", traceback.format_exc)
 
             # Return safe default (no conflict detected)
             return {
                 "has_conflict": False,
-                "context_issue": f"Conflict analysis failed: {str(e)}"
+                "context_issue": f"Conflict analysis failed: {e}"
             }
 
 
@@ -238,7 +488,7 @@ class SynthesizeDecision(Action):
 
     Output Schema: StrategyDecision
     - ticker: Stock symbol
-    - final_action: SignalIntensity (STRONG_BUY, BUY, HOLD, SELL, STRONG_SELL)
+    - final_action: SignalIntensity (STRONG_BUY, BUY, NEUTRAL, SELL, STRONG_SELL)
     - confidence_score: 0-100
     - logic_chain: List of reasoning steps
     - risk_notes: Risk management constraints
@@ -248,6 +498,249 @@ class SynthesizeDecision(Action):
     """
 
     name: str = "SynthesizeDecision"
+    field_char_limits: ClassVar[Dict[str, int]] = _FIELD_CHAR_LIMITS
+    enable_fast_path: bool = Field(
+        default=True,
+        description="Decide unambiguous RA/TA/SA consensus by rules instead of calling the LLM"
+    )
+
+    max_batch_input_tokens: int = Field(
+        default=6000,
+        description="Approximate input-token budget for one run_batch() LLM request"
+    )
+
+    decisions_log_path: Path = Field(
+        default_factory=lambda: get_config().get_strategy_output_dir() / "decisions.jsonl",
+        description="JSONL file that every synthesized StrategyDecision is appended to"
+    )
+
+    _decision_q: Optional[asyncio.Queue] = PrivateAttr(default=None)
+    _decision_writer: Optional[asyncio.Task] = PrivateAttr(default=None)
+    _fast_path_hits: int = PrivateAttr(default=0)
+    _fast_path_calls: int = PrivateAttr(default=0)
+
+    @staticmethod
+    def _is_trivial_consensus(context: Dict[str, Any]) -> Optional[SignalIntensity]:
+        """
+        Detect an unambiguous bullish or bearish consensus across RA, TA and SA.
+
+        Only fires when all three dimensions agree on direction:
+        - RA: signed YoY revenue growth in the revenue value
+        - TA: structural categorization ("Value Entry Opportunity" vs "Dead Cat Bounce Risk")
+        - SA: qualitative assessment is one-sided (positive or negative, not mixed)
+
+        Args:
+            context: Flat metric context from _extract_metrics_to_context()
+
+        Returns:
+            SignalIntensity.BUY / SignalIntensity.SELL on consensus, otherwise None
+        """
+        yoy = _YOY_PATTERN.search(context["ra_revenue_value"] or "")
+        if yoy is None:
+            return None
+
+        structure = context["ta_dead_cat_vs_value"]
+        sentiment = context["sa_sentiment_assessment"].lower()
+        if "mixed" in sentiment:
+            return None
+
+        if (
+            yoy.group(1) == "+"
+            and "Value Entry Opportunity" in structure
+            and "Dead Cat Bounce" not in structure
+            and "positive" in sentiment
+            and "negative" not in sentiment
+        ):
+            return SignalIntensity.BUY
+
+        if (
+            yoy.group(1) == "-"
+            and "Dead Cat Bounce" in structure
+            and "Value Entry Opportunity" not in structure
+            and "negative" in sentiment
+            and "positive" not in sentiment
+        ):
+            return SignalIntensity.SELL
+
+        return None
+
+    def _build_fast_path_decision(
+        self,
+        ticker: str,
+        signal: SignalIntensity,
+        context: Dict[str, Any]
+    ) -> StrategyDecision:
+        """
+        Build a rule-based StrategyDecision for the trivial-consensus fast path.
+
+        Args:
+            ticker: Stock ticker symbol
+            signal: Consensus signal from _is_trivial_consensus()
+            context: Flat metric context from _extract_metrics_to_context()
+
+        Returns:
+            StrategyDecision built without an LLM call
+        """
+        direction = "bullish" if signal is SignalIntensity.BUY else "bearish"
+        return StrategyDecision.model_construct(
+            ticker=ticker,
+            final_action=signal,
+            confidence_score=75.0,
+            logic_chain=(
+                f"Step 1: Metric Check (Revenue: {context['ra_revenue_value']})",
+                f"Step 2: Analysis Cross-Check (SA assessment is uniformly {direction})",
+                f"Step 3: Technical Structure Check ({context['ta_dead_cat_vs_value'][:120]})",
+                "Step 4: Conflict Resolution (No conflicts detected - rule-based consensus)",
+            ),
+            risk_notes=f"Rule-based consensus decision. Monitor RA risks: {context['ra_risks']}",
+            suggested_module="trend_following_engine",
+            decision_summary=(
+                f"RA, TA and SA are uniformly {direction} for {ticker}; "
+                f"decided by the trivial-consensus fast path without LLM synthesis."
+            ),
+            conflict_report="No conflicts detected"
+        )
+
+    def _try_fast_path(
+        self,
+        ticker: str,
+        context: Dict[str, Any],
+        sa_adv: Optional[InvestigationReport],
+        conflict_issue: Optional[str]
+    ) -> Optional[StrategyDecision]:
+        """
+        Return a rule-based decision when the trivial-consensus fast path applies.
+
+        Args:
+            ticker: Stock ticker symbol
+            context: Flat metric context from _extract_metrics_to_context()
+            sa_adv: Optional advanced investigation report
+            conflict_issue: Optional conflict description from AnalyzeConflict
+
+        Returns:
+            StrategyDecision on a fast-path hit, otherwise None
+        """
+        if not self.enable_fast_path or conflict_issue is not None or sa_adv is not None:
+            return None
+
+        self._fast_path_calls += 1
+        signal = self._is_trivial_consensus(context)
+        if signal is None:
+            return None
+
+        self._fast_path_hits += 1
+        logger.info(
+            f"⚡ Trivial consensus for {ticker}: {signal.value} "
+            f"(fast-path hit rate {self._fast_path_hits}/{self._fast_path_calls})"
+        )
+        return self._build_fast_path_decision(ticker, signal, context)
+
+    async def _log_decision(self, decision: StrategyDecision) -> None:
+        """
+        Queue a decision for the background JSONL writer and log a one-line summary.
+
+        The writer task is started lazily on first use (an event loop is required),
+        so synthesis never waits on disk I/O.
+
+        Args:
+            decision: The synthesized StrategyDecision
+        """
+        if self._decision_writer is None or self._decision_writer.done():
+            self._decision_q = asyncio.Queue()
+            self._decision_writer = asyncio.create_task(self._write_decision_log(self._decision_q))
+
+        await self._decision_q.put(decision.model_dump_json())
+        logger.info(
+            f"🎯 {decision.ticker} → {decision.final_action.value} @ {decision.confidence_score:.0f}%"
+        )
+
+    async def _write_decision_log(self, queue: asyncio.Queue) -> None:
+        """
+        Consume queued decision records and append them to decisions_log_path.
+
+        Records are written as soon as the queue drains, in appends of at most
+        _DECISION_LOG_BATCH_SIZE records. A None record stops the writer. A failed
+        append is logged and its batch dropped; the writer keeps draining the queue.
+
+        Args:
+            queue: Queue of serialized StrategyDecision JSON strings
+        """
+        path = self.decisions_log_path
+        batch: List[str] = []
+        while True:
+            record = await queue.get()
+            if record is not None:
+                batch.append(record)
+
+            if batch and (record is None or queue.empty() or len(batch) >= _DECISION_LOG_BATCH_SIZE):
+                payload = "".join(f"{line}\n" for line in batch)
+                batch = []
+                try:
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    if aiofiles is not None:
+                        async with aiofiles.open(path, "a", encoding="utf-8") as f:
+                            await f.write(payload)
+                    else:
+                        await asyncio.to_thread(_append_text, path, payload)
+                except OSError as e:
+                    logger.warning(f"⚠️ Failed to append to decision log {path}: {e}")
+
+            if record is None:
+                return
+
+    async def aclose(self) -> None:
+        """
+        Flush pending decision-log records and stop the background writer.
+
+        Must be awaited before the event loop shuts down, otherwise queued
+        records are lost with the cancelled writer task.
+        """
+        if self._decision_writer is not None and not self._decision_writer.done():
+            await self._decision_q.put(None)
+            await self._decision_writer
+        self._decision_writer = None
+
+    async def __aenter__(self) -> "SynthesizeDecision":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+
+    def _build_decision(self, result: Dict[str, Any], ticker: str) -> StrategyDecision:
+        """
+        Convert a parsed LLM decision dict into a StrategyDecision.
+
+        Args:
+            result: Parsed JSON decision from the LLM
+            ticker: Fallback ticker if the LLM omitted it
+
+        Returns:
+            StrategyDecision with defaults applied to missing or null fields
+
+        Raises:
+            pydantic.ValidationError: If a field still has an invalid type after defaulting
+        """
+        # LLM output is untrusted: nulls fall back to defaults, a bare-string
+        # logic_chain becomes a one-step chain, and the result is validated
+        logic_chain = result.get("logic_chain") or _DEFAULT_LOGIC_CHAIN
+        if isinstance(logic_chain, str):
+            logic_chain = [logic_chain]
+        try:
+            confidence_score = float(result.get("confidence_score", 50.0))
+        except (TypeError, ValueError):
+            confidence_score = 50.0
+
+        decision_fields = dict(
+            ticker=result.get("ticker") or ticker,
+            final_action=_SIGNAL_MAP.get(result.get("final_action"), SignalIntensity.NEUTRAL),
+            confidence_score=min(max(confidence_score, 0.0), 100.0),
+            logic_chain=intern_strings([str(step) for step in logic_chain]),
+            risk_notes=result.get("risk_notes") or "No risk notes provided",
+            suggested_module=result.get("suggested_module") or "hold_module",
+            decision_summary=result.get("decision_summary") or "No summary provided",
+            conflict_report=result.get("conflict_report") or "No conflicts detected"
+        )
+        return StrategyDecision.model_validate(decision_fields)
 
     def _extract_metrics_to_context(
         self,
@@ -261,6 +754,8 @@ class SynthesizeDecision(Action):
 
         (Same implementation as AnalyzeConflict for consistency)
         """
+        limits = self.field_char_limits
+        sentiment_matrix = {**_SA_MATRIX_DEFAULTS, **sa.sentiment_matrix}
         context = {
             # TA Metrics
             "ta_market_regime": ta.market_regime,
@@ -274,16 +769,16 @@ class SynthesizeDecision(Action):
             "ra_profit_analysis": ra.profitability_audit.analysis,
             "ra_cash_value": ra.cash_flow_stability.value,
             "ra_cash_analysis": ra.cash_flow_stability.analysis,
-            "ra_guidance": ra.management_guidance_audit,
-            "ra_risks": ra.key_risks_evidence,
+            "ra_guidance": _truncate(ra.management_guidance_audit, limits["ra_guidance"]),
+            "ra_risks": [_truncate(risk, limits["ra_risks"]) for risk in ra.key_risks_evidence],
 
             # SA Metrics
-            "sa_news_summary": sa.news_summary,
+            "sa_news_summary": _truncate(sa.news_summary, limits["sa_news_summary"]),
             "sa_sentiment_assessment": sa.qualitative_sentiment_assessment,
-            "sa_product_demand": sa.sentiment_matrix.get("Product_Demand", "Not available"),
-            "sa_macro_env": sa.sentiment_matrix.get("Macro_Environment", "Not available"),
-            "sa_mgmt_conf": sa.sentiment_matrix.get("Management_Confidence", "Not available"),
-            "sa_comp_pos": sa.sentiment_matrix.get("Competitive_Position", "Not available"),
+            "sa_product_demand": sentiment_matrix["Product_Demand"],
+            "sa_macro_env": sentiment_matrix["Macro_Environment"],
+            "sa_mgmt_conf": sentiment_matrix["Management_Confidence"],
+            "sa_comp_pos": sentiment_matrix["Competitive_Position"],
             "sa_causal_narrative": sa.causal_narrative,
             "sa_expectation_gap": sa.expectation_gap,
             "sa_tensions": sa.paradoxes_or_tensions,
@@ -292,25 +787,20 @@ class SynthesizeDecision(Action):
         # SA-Advanced Metrics (if investigation was triggered)
         if sa_adv is not None:
             context.update({
-                "sa_adv_findings": sa_adv.detailed_findings,
+                "sa_adv_findings": _truncate(sa_adv.detailed_findings, limits["sa_adv_findings"]),
                 "sa_adv_resolved": sa_adv.is_ambiguity_resolved,
                 "sa_adv_risk_class": sa_adv.risk_classification,
                 "sa_adv_revision": sa_adv.qualitative_sentiment_revision,
                 "sa_adv_gaps": sa_adv.evidence_gaps,
-                "sa_adv_evidence": sa_adv.key_evidence,
+                "sa_adv_evidence": [
+                    _truncate(item, limits["sa_adv_evidence"])
+                    for item in sa_adv.key_evidence[:limits["sa_adv_evidence_items"]]
+                ],
                 "sa_adv_confidence": sa_adv.confidence_level,
             })
         else:
             # Provide defaults if advanced mode not used
-            context.update({
-                "sa_adv_findings": "N/A - Advanced investigation not triggered",
-                "sa_adv_resolved": False,
-                "sa_adv_risk_class": "N/A",
-                "sa_adv_revision": "N/A",
-                "sa_adv_gaps": [],
-                "sa_adv_evidence": [],
-                "sa_adv_confidence": "N/A",
-            })
+            context.update(_SA_ADV_DEFAULTS)
 
         return context
 
@@ -337,15 +827,19 @@ class SynthesizeDecision(Action):
         Returns:
             StrategyDecision Pydantic object with final trading signal
         """
-        logger.info(f"\n{'='*80}")
-        logger.info(f"🎯 SYNTHESIZING DECISION for {ticker}")
-        logger.info(f"{'='*80}")
+        logger.info(f"\n{_BANNER}\n🎯 SYNTHESIZING DECISION for {ticker}\n{_BANNER}")
 
         # Step 1: Extract metrics into flat context dictionary
         context = self._extract_metrics_to_context(ra, ta, sa, sa_adv)
         context["ticker"] = ticker
         context["conflict_issue"] = conflict_issue or "No conflicts detected"
 
+        # Fast path: unambiguous consensus with no conflict needs no LLM synthesis
+        fast_decision = self._try_fast_path(ticker, context, sa_adv, conflict_issue)
+        if fast_decision is not None:
+            await self._log_decision(fast_decision)
+            return fast_decision
+
         # Step 2: Build decision synthesis prompt with placeholders
         prompt = """
 You are the Chief Strategy Auditor. You are in the SYNTHESIS PHASE. Your task is to provide the final "Safe-First" investment decision by resolving all evidence conflicts and assigning a definitive signal.
@@ -404,43 +898,119 @@ CRITICAL: Output ONLY the JSON. No markdown code blocks, no explanations.
             response = await self._aask(formatted_prompt)
 
             # Step 5: Parse JSON response
-            from MAT.roles.base_agent import BaseInvestmentAgent
-            result = BaseInvestmentAgent.parse_json_robustly(response)
-
-            # Step 6: Validate and create StrategyDecision
-            strategy_decision = StrategyDecision(
-                ticker=result.get("ticker", ticker),
-                final_action=SignalIntensity[result.get("final_action", "HOLD")],
-                confidence_score=float(result.get("confidence_score", 50.0)),
-                logic_chain=result.get("logic_chain", ["No logic chain provided"]),
-                risk_notes=result.get("risk_notes", "No risk notes provided"),
-                suggested_module=result.get("suggested_module", "hold_module"),
-                decision_summary=result.get("decision_summary", "No summary provided"),
-                conflict_report=result.get("conflict_report", "No conflicts detected")
-            )
+            result = await BaseInvestmentAgent.parse_json_robustly_async(_first_json_object(response) or response)
 
-            logger.info(f"\n🎯 Final Decision:")
-            logger.info(f"   Signal: {strategy_decision.final_action.value}")
-            logger.info(f"   Confidence: {strategy_decision.confidence_score:.1f}%")
-            logger.info(f"   Module: {strategy_decision.suggested_module}")
-            logger.info(f"   Summary: {strategy_decision.decision_summary}")
-            logger.info(f"{'='*80}\n")
-
-            return strategy_decision
+            # Step 6: Create StrategyDecision
+            strategy_decision = self._build_decision(result, ticker)
 
         except Exception as e:
             logger.error(f"❌ Decision synthesis failed: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.opt(lazy=True).debug("{}", traceback.format_exc)
 
-            # Return safe default HOLD decision
+            # Return safe default NEUTRAL decision
             return StrategyDecision(
                 ticker=ticker,
-                final_action=SignalIntensity.HOLD,
+                final_action=SignalIntensity.NEUTRAL,
                 confidence_score=0.0,
-                logic_chain=[f"Decision synthesis failed: {str(e)}"],
+                logic_chain=[f"Decision synthesis failed: {e}"],
                 risk_notes="Unable to generate decision due to errors",
                 suggested_module="hold_module",
-                decision_summary=f"Decision failed: {str(e)}",
+                decision_summary=f"Decision failed: {e}",
                 conflict_report="Unable to analyze conflicts due to errors"
             )
+
+        # Logged outside the try so a decision-log failure cannot discard a good decision
+        await self._log_decision(strategy_decision)
+        return strategy_decision
+
+    async def run_batch(
+        self,
+        tickers_reports: List[Tuple[str, FAReport, TAReport, SAReport, Optional[InvestigationReport]]],
+        conflict_issues: Optional[Dict[str, str]] = None
+    ) -> List[StrategyDecision]:
+        """
+        Synthesize decisions for several tickers with as few LLM round-trips as possible.
+
+        Tickers are packed into one structured-JSON prompt until the approximate
+        input budget (max_batch_input_tokens) is reached; each packed batch asks the
+        LLM for {"decisions": [...]}. Trivial-consensus tickers skip the LLM entirely,
+        and any ticker that cannot be batched or is missing from the batch response
+        falls back to a single run() call.
+
+        Args:
+            tickers_reports: (ticker, ra, ta, sa, sa_adv) tuples to decide
+            conflict_issues: Optional conflict description per ticker
+
+        Returns:
+            StrategyDecision list in the same order as tickers_reports
+        """
+        conflict_issues = conflict_issues or {}
+        decisions: List[Optional[StrategyDecision]] = [None] * len(tickers_reports)
+
+        # Step 1: Resolve fast-path tickers and render sections for the rest
+        pending: List[Tuple[int, str]] = []
+        for index, (ticker, ra, ta, sa, sa_adv) in enumerate(tickers_reports):
+            conflict_issue = conflict_issues.get(ticker)
+            context = self._extract_metrics_to_context(ra, ta, sa, sa_adv)
+            context["ticker"] = ticker
+            context["conflict_issue"] = conflict_issue or "No conflicts detected"
+
+            fast_decision = self._try_fast_path(ticker, context, sa_adv, conflict_issue)
+            if fast_decision is not None:
+                await self._log_decision(fast_decision)
+                decisions[index] = fast_decision
+                continue
+
+            context["batch_index"] = len(pending) + 1
+            pending.append((index, _BATCH_TICKER_SECTION.format(**context)))
+
+        # Step 2: Pack sections into batches under the input-token budget
+        budget_chars = self.max_batch_input_tokens * _CHARS_PER_TOKEN
+        fixed_chars = len(_BATCH_PROMPT_HEADER) + len(_BATCH_PROMPT_FOOTER)
+        batches: List[List[Tuple[int, str]]] = []
+        current: List[Tuple[int, str]] = []
+        used_chars = fixed_chars
+        for entry in pending:
+            if current and used_chars + len(entry[1]) > budget_chars:
+                batches.append(current)
+                current, used_chars = [], fixed_chars
+            current.append(entry)
+            used_chars += len(entry[1])
+        if current:
+            batches.append(current)
+
+        # Step 3: One LLM request per batch
+        for batch in batches:
+            if len(batch) > 1:
+                logger.info(f"📦 Batched synthesis for {len(batch)} tickers")
+                prompt = _BATCH_PROMPT_HEADER + "".join(section for _, section in batch) + _BATCH_PROMPT_FOOTER
+                try:
+                    response = await self._aask(prompt)
+                    result = await BaseInvestmentAgent.parse_json_robustly_async(_first_json_object(response) or response)
+                    by_ticker = {
+                        item.get("ticker"): item
+                        for item in result.get("decisions", [])
+                        if isinstance(item, dict)
+                    }
+                    for index, _ in batch:
+                        ticker = tickers_reports[index][0]
+                        if ticker in by_ticker:
+                            decisions[index] = self._build_decision(by_ticker[ticker], ticker)
+                            await self._log_decision(decisions[index])
+                except Exception as e:
+                    logger.warning(f"⚠️ Batched synthesis failed, falling back to single calls: {e}")
+
+            # Fallback: single-call mode for anything the batch did not resolve
+            for index, _ in batch:
+                if decisions[index] is None:
+                    ticker, ra, ta, sa, sa_adv = tickers_reports[index]
+                    decisions[index] = await self.run(
+                        ticker=ticker,
+                        ra=ra,
+                        ta=ta,
+                        sa=sa,
+                        sa_adv=sa_adv,
+                        conflict_issue=conflict_issues.get(ticker)
+                    )
+
+        return decisions
@@ -15,11 +15,132 @@ Usage:
     openai_key = config.get_openai_api_key()
 """
 
+import copy
 import os
-import yaml
+import threading
+import types
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, Dict, Any
-from metagpt.logs import logger
+from typing import Optional, Dict, Any, Mapping, Tuple
+
+# yaml and metagpt.logs are imported on first use to keep this module cheap to import
+_logger = None
+_yaml_loader = None
+
+
+def _log():
+    """Return the MetaGPT logger, importing it on first use."""
+    global _logger
+    if _logger is None:
+        from metagpt.logs import logger
+        _logger = logger
+    return _logger
+
+
+def _get_yaml_loader():
+    """
+    Return the YAML loader class, importing yaml on first use.
+
+    Prefers the libyaml C loader (same semantics as SafeLoader, several times faster).
+    """
+    global _yaml_loader
+    if _yaml_loader is None:
+        import yaml
+        _yaml_loader = getattr(yaml, "CSafeLoader", None)
+        if _yaml_loader is None:
+            _yaml_loader = yaml.SafeLoader
+            _log().warning("⚠️ libyaml not available, using pure-Python YAML loader. Reinstall pyyaml with libyaml for faster config parsing")
+    return _yaml_loader
+
+
+# Section defaults (read-only); merged once with config2.yaml overrides
+_TAVILY_DEFAULTS = types.MappingProxyType({
+    "api_key": None,
+    "search_depth": "advanced",
+    "max_results": 10,
+    "include_answer": True,
+    "include_raw_content": True
+})
+
+_LLM_DEFAULTS = types.MappingProxyType({
+    "api_type": "openai",
+    "base_url": "https://api.openai.com/v1",
+    "api_key": None,
+    "model": "gpt-4o-mini"
+})
+
+_MAT_DEFAULTS = types.MappingProxyType({
+    "search_output_dir": "MAT/data/search_results",
+    "log_level": "INFO",
+    "use_tavily": True
+})
+
+_RAGFLOW_DEFAULTS = types.MappingProxyType({
+    "endpoint": "http://<your-ragflow-ip>:9380/api/v1/retrieval",
+    "api_key": "<your-api-key>",
+    "dataset_id": "<your-dataset-id>",
+    "top_k": 5,
+    "rerank_id": None  # Optional: Advanced reranking model
+})
+
+_MEAN_REVERSION_DEFAULTS = types.MappingProxyType({
+    "rsi_oversold_strong": 30.0,
+    "rsi_oversold": 40.0,
+    "rsi_overbought": 60.0,
+    "rsi_overbought_strong": 70.0
+})
+
+_TECHNICALS_DEFAULTS = types.MappingProxyType({
+    "default_period": 60,  # Default period in days
+    "rsi_period": 14,
+    "bb_period": 20,
+    "bb_std": 2.0,
+    "sma_period": 200,
+    "atr_period": 14,
+    "mean_reversion_thresholds": _MEAN_REVERSION_DEFAULTS
+})
+
+# Unset / template values that mean RAGFlow is not configured
+_RAGFLOW_KEY_PLACEHOLDERS = frozenset({"", "<your-api-key>"})
+_RAGFLOW_DATASET_PLACEHOLDERS = frozenset({"", "<your-dataset-id>"})
+
+# Parsed YAML files keyed by path -> (mtime_ns, size, data), bounded LRU
+_YAML_CACHE: "OrderedDict[str, Tuple[int, int, Dict[str, Any]]]" = OrderedDict()
+_YAML_CACHE_MAX_ENTRIES = 100
+
+
+def _load_yaml_cached(path: Path) -> Dict[str, Any]:
+    """
+    Parse a YAML file, reusing the previous parse while (mtime, size) is unchanged.
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        A deep copy of the parsed mapping, so callers cannot poison the cache
+    """
+    st = path.stat()
+    key = str(path)
+
+    cached = _YAML_CACHE.get(key)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        _YAML_CACHE.move_to_end(key)
+        return copy.deepcopy(cached[2])
+
+    # Same as yaml.load(f, Loader=...), without re-importing yaml here
+    with open(path, 'r', encoding='utf-8') as f:
+        loader = _get_yaml_loader()(f)
+        try:
+            data = loader.get_single_data() or {}
+        finally:
+            loader.dispose()
+
+    _YAML_CACHE[key] = (st.st_mtime_ns, st.st_size, data)
+    _YAML_CACHE.move_to_end(key)
+    while len(_YAML_CACHE) > _YAML_CACHE_MAX_ENTRIES:
+        _YAML_CACHE.popitem(last=False)
+
+    return copy.deepcopy(data)
 
 
 class MATConfig:
@@ -37,49 +158,54 @@ class MATConfig:
     
     # Default config path relative to project root
     DEFAULT_CONFIG_PATH = "config/config2.yaml"
+
+    # Environment variables that override config2.yaml values
+    ENV_KEYS = ("TAVILY_API_KEY", "OPENAI_API_KEY")
     
     # Singleton instance
     _instance: Optional["MATConfig"] = None
     _config: Dict[str, Any] = {}
+    _cached_root: Optional[Path] = None
+    _lock = threading.Lock()
     
     def __new__(cls):
-        """Singleton pattern to ensure only one config instance."""
+        """Singleton pattern to ensure only one config instance (thread-safe)."""
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._load_config()
+            with cls._lock:
+                # Double-checked: another thread may have finished loading meanwhile
+                if cls._instance is None:
+                    instance = super().__new__(cls)
+                    instance._load_config()
+                    cls._instance = instance
         return cls._instance
     
     def _find_project_root(self) -> Path:
         """
         Find the project root directory by looking for config/config2.yaml.
-        
+
+        The root is deterministic for a given install, so it is resolved once
+        and cached on the class; re-created singletons skip the search.
+
         Returns:
             Path to project root directory
         """
-        # Start from current file location
-        current = Path(__file__).resolve().parent
-        
-        # Walk up the directory tree looking for config/config2.yaml
-        for _ in range(5):  # Limit search depth
-            config_path = current / "config" / "config2.yaml"
-            if config_path.exists():
-                return current
-            current = current.parent
-        
-        # Fallback: try common locations
-        possible_roots = [
-            Path.cwd(),
-            Path(__file__).resolve().parent.parent,  # MAT/../
-            Path(__file__).resolve().parent.parent.parent,  # MAT/../../
-        ]
-        
-        for root in possible_roots:
-            config_path = root / "config" / "config2.yaml"
-            if config_path.exists():
-                return root
-        
-        # Return current working directory as fallback
-        return Path.cwd()
+        if MATConfig._cached_root is not None:
+            return MATConfig._cached_root
+
+        # MAT/ and up to four ancestors, then the working directory
+        candidates = list(Path(__file__).resolve().parents)[:5] + [Path.cwd()]
+
+        root = Path.cwd()  # Fallback if no candidate has a config file
+        for candidate in candidates:
+            try:
+                os.stat(candidate / self.DEFAULT_CONFIG_PATH)
+            except OSError:
+                continue
+            root = candidate
+            break
+
+        MATConfig._cached_root = root
+        return root
     
     def _load_config(self):
         """
@@ -90,24 +216,134 @@ class MATConfig:
         
         if config_path.exists():
             try:
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    self._config = yaml.safe_load(f) or {}
-                logger.info(f"✅ Loaded config from: {config_path}")
+                self._config = _load_yaml_cached(config_path)
+                _log().info(f"✅ Loaded config from: {config_path}")
             except Exception as e:
-                logger.warning(f"⚠️ Failed to load config: {e}")
+                _log().warning(f"⚠️ Failed to load config: {e}")
                 self._config = {}
         else:
-            logger.warning(f"⚠️ Config file not found: {config_path}")
+            _log().warning(f"⚠️ Config file not found: {config_path}")
             self._config = {}
         
         # Store project root for later use
         self._project_root = project_root
+
+        # Normalize config-file API keys once (None when unset)
+        self._tavily_api_key_file: Optional[str] = (self._config.get("tavily") or {}).get("api_key") or None
+        openai_key = (self._config.get("llm") or {}).get("api_key") or ""
+        # Only accept keys in valid OpenAI format (starts with "sk-")
+        self._openai_api_key_file: Optional[str] = openai_key if openai_key.startswith("sk-") else None
+
+        # Snapshot env overrides once; API keys do not change mid-process
+        self.refresh_env()
+
+    def refresh_env(self):
+        """
+        Re-read the environment variable overrides (e.g. after a test sets them).
+        """
+        self._env: Dict[str, Optional[str]] = {key: os.environ.get(key) for key in self.ENV_KEYS}
+        self._build_section_configs()
+
+    def _build_section_configs(self):
+        """
+        Merge every config section with its defaults once (Flyweight).
+
+        The merged sections are shared, read-only mappings returned by the
+        get_*_config() getters, so repeated lookups allocate nothing.
+        """
+        self._tavily_cfg = types.MappingProxyType(self._build_tavily_config())
+        self._llm_cfg = types.MappingProxyType(self._build_llm_config())
+        self._mat_cfg = types.MappingProxyType(self._build_mat_config())
+        self._ragflow_cfg = types.MappingProxyType(self._build_ragflow_config())
+        self._ragflow_ready = (
+            self._ragflow_cfg.get("api_key", "") not in _RAGFLOW_KEY_PLACEHOLDERS and
+            self._ragflow_cfg.get("dataset_id", "") not in _RAGFLOW_DATASET_PLACEHOLDERS and
+            "<your-ragflow-ip>" not in self._ragflow_cfg.get("endpoint", "")
+        )
+
+        technicals = self._build_technicals_config()
+        technicals["mean_reversion_thresholds"] = types.MappingProxyType(technicals["mean_reversion_thresholds"])
+        self._technicals_cfg = types.MappingProxyType(technicals)
+
+        # Output directories are resolved (and created) lazily from the MAT section
+        self._dir_cache: Dict[str, Path] = {}
+
+    def invalidate(self):
+        """
+        Drop all cached configuration and reload it from disk and environment.
+
+        Intended for tests that rewrite config2.yaml or environment variables.
+        """
+        self._load_config()
     
     @property
     def project_root(self) -> Path:
         """Get the project root directory."""
         return self._project_root
+
+    def get_tavily_config(self) -> Mapping[str, Any]:
+        """Get full Tavily configuration (cached, read-only)."""
+        return self._tavily_cfg
+
+    def get_llm_config(self) -> Mapping[str, Any]:
+        """Get full LLM configuration (cached, read-only)."""
+        return self._llm_cfg
+
+    def get_mat_config(self) -> Mapping[str, Any]:
+        """Get MAT framework specific configuration (cached, read-only)."""
+        return self._mat_cfg
+
+    def get_ragflow_config(self) -> Mapping[str, Any]:
+        """Get RAGFlow API configuration (cached, read-only)."""
+        return self._ragflow_cfg
+
+    def get_technicals_config(self) -> Mapping[str, Any]:
+        """Get technical analysis configuration (cached, read-only)."""
+        return self._technicals_cfg
     
+    def _resolve_output_dir(self, key: str, default: str) -> Path:
+        """
+        Resolve an output directory from the MAT config, creating it once per process.
+
+        Args:
+            key: MAT config key holding the directory (e.g. "rag_output_dir")
+            default: Directory used when the key is not configured
+
+        Returns:
+            Absolute path to the (existing) output directory
+        """
+        output_path = self._dir_cache.get(key)
+        if output_path is not None:
+            return output_path
+
+        output_path = Path(self._mat_cfg.get(key, default))
+
+        # Make it absolute if relative
+        if not output_path.is_absolute():
+            output_path = self._project_root / output_path
+
+        # Ensure directory exists
+        output_path.mkdir(parents=True, exist_ok=True)
+
+        self._dir_cache[key] = output_path
+        return output_path
+
+    def get_search_output_dir(self) -> Path:
+        """Get the search output directory path."""
+        return self._resolve_output_dir("search_output_dir", "MAT/report/SA")
+
+    def get_rag_output_dir(self) -> Path:
+        """Get the RAG output directory path for saving RAG results."""
+        return self._resolve_output_dir("rag_output_dir", "MAT/report/RA")
+
+    def get_technical_output_dir(self) -> Path:
+        """Get the technical analysis output directory path."""
+        return self._resolve_output_dir("technical_output_dir", "MAT/report/TA")
+
+    def get_strategy_output_dir(self) -> Path:
+        """Get the strategy (AlphaStrategist) output directory path."""
+        return self._resolve_output_dir("strategy_output_dir", "MAT/report/AS")
+
     def get_tavily_api_key(self) -> Optional[str]:
         """
         Get Tavily API key.
@@ -117,19 +353,7 @@ class MATConfig:
         Returns:
             Tavily API key or None if not configured
         """
-        # First check environment variable
-        env_key = os.getenv("TAVILY_API_KEY")
-        if env_key:
-            return env_key
-        
-        # Then check config file
-        tavily_config = self._config.get("tavily", {})
-        config_key = tavily_config.get("api_key", "")
-        
-        if config_key and config_key != "":
-            return config_key
-        
-        return None
+        return self._env["TAVILY_API_KEY"] or self._tavily_api_key_file
     
     def get_openai_api_key(self) -> Optional[str]:
         """
@@ -140,153 +364,71 @@ class MATConfig:
         Returns:
             OpenAI API key or None if not configured
         """
-        # First check environment variable
-        env_key = os.getenv("OPENAI_API_KEY")
-        if env_key:
-            return env_key
-        
-        # Then check config file
-        llm_config = self._config.get("llm", {})
-        config_key = llm_config.get("api_key", "")
-        
-        # Return key if it's a valid OpenAI format (starts with "sk-")
-        if config_key and config_key.startswith("sk-"):
-            return config_key
-        
-        return None
+        return self._env["OPENAI_API_KEY"] or self._openai_api_key_file
     
-    def get_tavily_config(self) -> Dict[str, Any]:
+    def _build_tavily_config(self) -> Dict[str, Any]:
         """
-        Get full Tavily configuration.
+        Build the merged Tavily configuration (defaults < config file < env).
         
         Returns:
             Dictionary with Tavily settings
         """
-        default_config = {
-            "api_key": None,
-            "search_depth": "advanced",
-            "max_results": 10,
-            "include_answer": True,
-            "include_raw_content": True
-        }
-        
         tavily_config = self._config.get("tavily", {})
         
         # Merge with defaults
-        merged = {**default_config, **tavily_config}
+        merged = {**_TAVILY_DEFAULTS, **tavily_config}
         
         # Override with environment variable if set
-        env_key = os.getenv("TAVILY_API_KEY")
+        env_key = self._env["TAVILY_API_KEY"]
         if env_key:
             merged["api_key"] = env_key
         
         return merged
     
-    def get_llm_config(self) -> Dict[str, Any]:
+    def _build_llm_config(self) -> Dict[str, Any]:
         """
-        Get full LLM configuration.
+        Build the merged LLM configuration (defaults < config file < env).
         
         Returns:
             Dictionary with LLM settings
         """
-        default_config = {
-            "api_type": "openai",
-            "base_url": "https://api.openai.com/v1",
-            "api_key": None,
-            "model": "gpt-4o-mini"
-        }
-        
         llm_config = self._config.get("llm", {})
         
         # Merge with defaults
-        merged = {**default_config, **llm_config}
+        merged = {**_LLM_DEFAULTS, **llm_config}
         
         # Override with environment variable if set
-        env_key = os.getenv("OPENAI_API_KEY")
+        env_key = self._env["OPENAI_API_KEY"]
         if env_key:
             merged["api_key"] = env_key
         
         return merged
     
-    def get_mat_config(self) -> Dict[str, Any]:
+    def _build_mat_config(self) -> Dict[str, Any]:
         """
-        Get MAT framework specific configuration.
+        Build the merged MAT framework specific configuration.
         
         Returns:
             Dictionary with MAT settings
         """
-        default_config = {
-            "search_output_dir": "MAT/data/search_results",
-            "log_level": "INFO",
-            "use_tavily": True
-        }
-        
         mat_config = self._config.get("mat", {})
         
-        return {**default_config, **mat_config}
-    
-    def get_search_output_dir(self) -> Path:
-        """
-        Get the search output directory path.
-
-        Returns:
-            Path to search output directory
-        """
-        mat_config = self.get_mat_config()
-        output_dir = mat_config.get("search_output_dir", "MAT/report/SA")
-        
-        # Make it absolute if relative
-        output_path = Path(output_dir)
-        if not output_path.is_absolute():
-            output_path = self._project_root / output_path
-        
-        # Ensure directory exists
-        output_path.mkdir(parents=True, exist_ok=True)
-        
-        return output_path
+        return {**_MAT_DEFAULTS, **mat_config}
     
-    def get_ragflow_config(self) -> Dict[str, Any]:
+    def _build_ragflow_config(self) -> Dict[str, Any]:
         """
-        Get RAGFlow API configuration.
+        Build the merged RAGFlow API configuration.
 
         Returns:
             Dictionary with RAGFlow settings including rerank_id
         """
-        default_config = {
-            "endpoint": "http://<your-ragflow-ip>:9380/api/v1/retrieval",
-            "api_key": "<your-api-key>",
-            "dataset_id": "<your-dataset-id>",
-            "top_k": 5,
-            "rerank_id": None  # Optional: Advanced reranking model
-        }
-
         ragflow_config = self._config.get("ragflow", {})
 
         # Merge with defaults
-        merged = {**default_config, **ragflow_config}
+        merged = {**_RAGFLOW_DEFAULTS, **ragflow_config}
 
         return merged
     
-    def get_rag_output_dir(self) -> Path:
-        """
-        Get the RAG output directory path for saving RAG results.
-
-        Returns:
-            Path to RAG output directory
-        """
-        mat_config = self.get_mat_config()
-        output_dir = mat_config.get("rag_output_dir", "MAT/report/RA")
-        
-        # Make it absolute if relative
-        output_path = Path(output_dir)
-        if not output_path.is_absolute():
-            output_path = self._project_root / output_path
-        
-        # Ensure directory exists
-        output_path.mkdir(parents=True, exist_ok=True)
-        
-        return output_path
-    
     def is_ragflow_configured(self) -> bool:
         """
         Check if RAGFlow API is properly configured.
@@ -294,77 +436,28 @@ class MATConfig:
         Returns:
             True if RAGFlow API key and dataset_id are set
         """
-        config = self.get_ragflow_config()
-        api_key = config.get("api_key", "")
-        dataset_id = config.get("dataset_id", "")
-        endpoint = config.get("endpoint", "")
-        
-        is_configured = (
-            api_key != "<your-api-key>" and
-            dataset_id != "<your-dataset-id>" and
-            "<your-ragflow-ip>" not in endpoint and
-            len(api_key) > 0 and
-            len(dataset_id) > 0
-        )
-        
-        return is_configured
+        return self._ragflow_ready
     
-    def get_technicals_config(self) -> Dict[str, Any]:
+    def _build_technicals_config(self) -> Dict[str, Any]:
         """
-        Get technical analysis configuration.
+        Build the merged technical analysis configuration.
         
         Returns:
             Dictionary with technical analysis settings
         """
-        default_config = {
-            "default_period": 60,  # Default period in days
-            "rsi_period": 14,
-            "bb_period": 20,
-            "bb_std": 2.0,
-            "sma_period": 200,
-            "atr_period": 14,
-            "mean_reversion_thresholds": {
-                "rsi_oversold_strong": 30.0,
-                "rsi_oversold": 40.0,
-                "rsi_overbought": 60.0,
-                "rsi_overbought_strong": 70.0
-            }
-        }
-        
         technicals_config = self._config.get("technicals", {})
         
         # Merge with defaults (config overrides defaults)
-        merged = {**default_config, **technicals_config}
+        merged = {**_TECHNICALS_DEFAULTS, **technicals_config}
         
         # Handle nested mean_reversion_thresholds
-        if "mean_reversion_thresholds" in technicals_config:
-            merged["mean_reversion_thresholds"] = {
-                **default_config["mean_reversion_thresholds"],
-                **technicals_config["mean_reversion_thresholds"]
-            }
+        merged["mean_reversion_thresholds"] = {
+            **_MEAN_REVERSION_DEFAULTS,
+            **technicals_config.get("mean_reversion_thresholds", {})
+        }
         
         return merged
     
-    def get_technical_output_dir(self) -> Path:
-        """
-        Get the technical analysis output directory path.
-
-        Returns:
-            Path to technical analysis output directory
-        """
-        mat_config = self.get_mat_config()
-        output_dir = mat_config.get("technical_output_dir", "MAT/report/TA")
-        
-        # Make it absolute if relative
-        output_path = Path(output_dir)
-        if not output_path.is_absolute():
-            output_path = self._project_root / output_path
-        
-        # Ensure directory exists
-        output_path.mkdir(parents=True, exist_ok=True)
-        
-        return output_path
-    
     def is_tavily_configured(self) -> bool:
         """
         Check if Tavily API is properly configured.
@@ -395,6 +488,21 @@ class MATConfig:
         mat_config = self.get_mat_config()
         return mat_config.get("log_level", "INFO")
     
+    def get_max_concurrency(self, default: int = 4) -> int:
+        """
+        Get the cap on concurrently running investigations / API fan-out.
+
+        Args:
+            default: Value used when mat.max_concurrency is not configured
+
+        Returns:
+            Max concurrency (at least 1)
+        """
+        try:
+            return max(1, int(self.get_mat_config().get("max_concurrency", default)))
+        except (TypeError, ValueError):
+            return max(1, default)
+    
     def use_tavily(self) -> bool:
         """
         Check if Tavily should be used (both configured and enabled).
@@ -410,29 +518,52 @@ class MATConfig:
         """
         Print configuration status for debugging.
         """
-        logger.info("="*60)
-        logger.info("📋 MAT Configuration Status")
-        logger.info("="*60)
-        logger.info(f"Project Root: {self._project_root}")
-        logger.info(f"Config File: {self._project_root / self.DEFAULT_CONFIG_PATH}")
-        logger.info(f"OpenAI API: {'✅ Configured' if self.is_openai_configured() else '❌ Not configured'}")
-        logger.info(f"Tavily API: {'✅ Configured' if self.is_tavily_configured() else '❌ Not configured'}")
-        logger.info(f"RAGFlow API: {'✅ Configured' if self.is_ragflow_configured() else '❌ Not configured'}")
-        logger.info(f"Use Tavily: {self.use_tavily()}")
-        logger.info(f"Log Level: {self.get_log_level()}")
-        logger.info(f"Search Output: {self.get_search_output_dir()}")
-        logger.info(f"RAG Output: {self.get_rag_output_dir()}")
-        logger.info(f"Technical Output: {self.get_technical_output_dir()}")
-        logger.info("="*60)
+        separator = "=" * 60
+        status = "\n".join([
+            separator,
+            "📋 MAT Configuration Status",
+            separator,
+            f"Project Root: {self._project_root}",
+            f"Config File: {self._project_root / self.DEFAULT_CONFIG_PATH}",
+            f"OpenAI API: {'✅ Configured' if self.is_openai_configured() else '❌ Not configured'}",
+            f"Tavily API: {'✅ Configured' if self.is_tavily_configured() else '❌ Not configured'}",
+            f"RAGFlow API: {'✅ Configured' if self.is_ragflow_configured() else '❌ Not configured'}",
+            f"Use Tavily: {self.use_tavily()}",
+            f"Log Level: {self.get_log_level()}",
+            f"Search Output: {self.get_search_output_dir()}",
+            f"RAG Output: {self.get_rag_output_dir()}",
+            f"Technical Output: {self.get_technical_output_dir()}",
+            f"Strategy Output: {self.get_strategy_output_dir()}",
+            separator,
+        ])
+        _log().info(status)
+
+
+def _reset_after_fork():
+    """
+    Drop the singleton (and a lock possibly held at fork time) in a forked child.
+
+    The child rebuilds its config on first use; the inherited YAML cache means the
+    file is only re-parsed if its mtime or size changed since the fork.
+    """
+    MATConfig._lock = threading.Lock()
+    MATConfig._instance = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
 
 
 # Convenience function for quick access
 def get_config() -> MATConfig:
     """
     Get the singleton MATConfig instance.
+
+    config2.yaml is parsed once per process (and re-parsed only if the file
+    changes); after the first call this returns the cached instance directly.
     
     Returns:
         MATConfig singleton instance
     """
-    return MATConfig()
+    return MATConfig._instance or MATConfig()
 
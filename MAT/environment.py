@@ -5,13 +5,17 @@ Author: Ewan Su
 Description: Investment Environment for managing shared trading state and agent communication.
 """
 
-from typing import Optional
+from collections import OrderedDict
+from typing import Iterable, List, Optional, Set
 from metagpt.environment import Environment
 from metagpt.schema import Message
 from metagpt.logs import logger
 
 from .schemas import TradingState, FAReport, TAReport, SAReport, StrategyDecision
 
+# Tickers kept in the message-id index; the least recently tagged ticker is dropped first
+_MESSAGE_INDEX_MAX_TICKERS = 64
+
 
 class InvestmentEnvironment(Environment):
     """
@@ -33,16 +37,22 @@ class InvestmentEnvironment(Environment):
         """
         super().__init__(desc=desc, **kwargs)
         self._trading_state: Optional[TradingState] = None
+        # Message ids per ticker, taken from the 'ticker' metadata tag set at publish time
+        self._messages_by_ticker: "OrderedDict[str, Set[str]]" = OrderedDict()
         logger.info(f"📊 {desc} initialized")
     
     def set_ticker(self, ticker: str):
         """
         Initialize or reset the trading state for a new ticker symbol.
+
+        Also clears the message-id index: ids from earlier analyses are stale,
+        and agents fall back to content-based relevance checks for them.
         
         Args:
             ticker: The stock ticker symbol to analyze (e.g., "AAPL", "TSLA")
         """
         self._trading_state = TradingState(current_ticker=ticker)
+        self._messages_by_ticker.clear()
         logger.info(f"🎯 Trading state initialized for ticker: {ticker}")
     
     @property
@@ -131,14 +141,52 @@ class InvestmentEnvironment(Environment):
         """
         Publish a message to the environment for all subscribed agents.
         
-        This method wraps the base environment's publish mechanism and
-        adds logging for better observability.
+        This method wraps the base environment's publish mechanism,
+        adds logging for better observability, and indexes the message
+        by its ticker tag so agents can filter without scanning content.
         
         Args:
             message: The Message to broadcast to all agents
         """
         logger.info(f"📤 Publishing message: {message.cause_by} for ticker {self._trading_state.current_ticker if self._trading_state else 'N/A'}")
+        self._index_message(message)
         super().publish_message(message)
+
+    def publish_batch(self, messages: Iterable[Message]) -> List[Message]:
+        """
+        Publish several messages in order through publish_message().
+
+        Args:
+            messages: The Messages to broadcast, in delivery order
+
+        Returns:
+            The published messages
+        """
+        messages = list(messages)
+        for message in messages:
+            self.publish_message(message)
+        return messages
+
+    def _index_message(self, message: Message):
+        """Record a message id under its 'ticker' metadata tag, if it has one (index is size-capped)."""
+        ticker = message.metadata.get("ticker") if message.metadata else None
+        if ticker:
+            self._messages_by_ticker.setdefault(ticker, set()).add(message.id)
+            self._messages_by_ticker.move_to_end(ticker)
+            while len(self._messages_by_ticker) > _MESSAGE_INDEX_MAX_TICKERS:
+                self._messages_by_ticker.popitem(last=False)
+
+    def message_ids_for_ticker(self, ticker: str) -> Set[str]:
+        """
+        Get the ids of published messages tagged with a ticker.
+
+        Args:
+            ticker: The stock ticker symbol
+
+        Returns:
+            Set of message ids (empty if none were tagged with this ticker)
+        """
+        return self._messages_by_ticker.get(ticker, set())
     
     def get_state_summary(self) -> str:
         """
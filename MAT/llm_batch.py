@@ -0,0 +1,184 @@
+"""
+Filename: MetaGPT-Ewan/MAT/llm_batch.py
+Created Date: Friday, October 16th 2026
+Author: Ewan Su
+Description: OpenAI Batch API transport for action llm_callback hooks.
+
+Actions such as SearchDeepDive accept an ``llm_callback(prompt) -> str``. A
+BatchLLMCallback collects the prompts of many concurrent action runs, submits
+them as one OpenAI Batch job (half the per-token price and a separate, higher
+rate limit) and resolves every caller with its completion once the job is done.
+Latency is minutes to hours, so this is meant for offline sweeps and CI
+verification, not the live agent loop.
+
+Usage:
+    callback = BatchLLMCallback(expected=4)
+    reports = await asyncio.gather(*(action.run(..., llm_callback=callback) for ...))
+"""
+
+import asyncio
+import io
+import json
+from typing import Dict, List, Optional, Tuple
+
+from metagpt.logs import logger
+
+from .config_loader import get_config
+
+# Terminal states of an OpenAI batch job
+_BATCH_DONE_STATES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+
+class BatchLLMCallback:
+    """
+    llm_callback that routes prompts through the OpenAI Batch API.
+
+    Prompts are queued until `expected` of them have arrived or `flush_delay`
+    seconds have passed since the first queued prompt, then submitted as one
+    batch. Callers await their own future, so concurrent action runs can share
+    a single batch job.
+    """
+
+    def __init__(
+        self,
+        expected: int,
+        flush_delay: float = 30.0,
+        poll_interval: float = 30.0,
+        model: Optional[str] = None
+    ):
+        """
+        Initialize the batch callback.
+
+        Args:
+            expected: Number of prompts that triggers an immediate submission
+            flush_delay: Seconds to wait for more prompts before submitting a partial batch
+            poll_interval: Seconds between batch status checks
+            model: Chat model (default: llm.model from config2.yaml)
+        """
+        llm_config = get_config().get_llm_config()
+        self.expected = max(1, expected)
+        self.flush_delay = flush_delay
+        self.poll_interval = poll_interval
+        self.model = model or llm_config.get("model", "gpt-4o-mini")
+        self._llm_config = llm_config
+        self._client = None
+        self._pending: List[Tuple[str, str, asyncio.Future]] = []
+        self._flush_task: Optional[asyncio.Task] = None
+        self._counter = 0
+
+    async def __call__(self, prompt: str) -> str:
+        """
+        Queue a prompt for the next batch and wait for its completion.
+
+        Args:
+            prompt: User prompt built by the action
+
+        Returns:
+            The model's response text
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._counter += 1
+        self._pending.append((f"req-{self._counter}", prompt, future))
+
+        if len(self._pending) >= self.expected:
+            self._start_flush(delay=0.0)
+        elif self._flush_task is None:
+            self._start_flush(delay=self.flush_delay)
+
+        return await future
+
+    def _start_flush(self, delay: float) -> None:
+        """Cancel any scheduled partial flush and schedule a new one."""
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+        self._flush_task = asyncio.create_task(self._flush_after(delay))
+
+    async def _flush_after(self, delay: float) -> None:
+        if delay:
+            await asyncio.sleep(delay)
+        batch, self._pending = self._pending, []
+        self._flush_task = None
+        if not batch:
+            return
+
+        try:
+            results = await self._run_batch([(custom_id, prompt) for custom_id, prompt, _ in batch])
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for custom_id, _, future in batch:
+            if future.done():
+                continue
+            if custom_id in results:
+                future.set_result(results[custom_id])
+            else:
+                future.set_exception(RuntimeError(f"Batch returned no result for {custom_id}"))
+
+    def _get_client(self):
+        """Create the AsyncOpenAI client on first use."""
+        if self._client is None:
+            from openai import AsyncOpenAI
+            self._client = AsyncOpenAI(
+                api_key=get_config().get_openai_api_key(),
+                base_url=self._llm_config.get("base_url")
+            )
+        return self._client
+
+    async def _run_batch(self, requests: List[Tuple[str, str]]) -> Dict[str, str]:
+        """
+        Submit one batch job and wait for it to finish.
+
+        Args:
+            requests: (custom_id, prompt) pairs
+
+        Returns:
+            custom_id -> response text for every request that succeeded
+        """
+        client = self._get_client()
+
+        lines = [
+            json.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {"model": self.model, "messages": [{"role": "user", "content": prompt}]}
+            }, ensure_ascii=False)
+            for custom_id, prompt in requests
+        ]
+        upload = await client.files.create(
+            file=("batch_requests.jsonl", io.BytesIO("\n".join(lines).encode("utf-8"))),
+            purpose="batch"
+        )
+        batch = await client.batches.create(
+            input_file_id=upload.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        logger.info(f"📦 Submitted OpenAI batch {batch.id} with {len(requests)} requests")
+
+        while batch.status not in _BATCH_DONE_STATES:
+            await asyncio.sleep(self.poll_interval)
+            batch = await client.batches.retrieve(batch.id)
+            logger.debug("📦 Batch {} status: {}", batch.id, batch.status)
+
+        if batch.status != "completed" or not batch.output_file_id:
+            raise RuntimeError(f"OpenAI batch {batch.id} ended with status {batch.status}")
+
+        output = await client.files.content(batch.output_file_id)
+        results = {}
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            response = record.get("response") or {}
+            if response.get("status_code") != 200:
+                logger.warning(f"⚠️ Batch request {record.get('custom_id')} failed: {record.get('error')}")
+                continue
+            results[record["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+
+        logger.info(f"📦 OpenAI batch {batch.id} completed ({len(results)}/{len(requests)} succeeded)")
+        return results
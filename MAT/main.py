@@ -441,6 +441,7 @@ async def run_analysis(
 
     # Initialize message tracer
     tracer = MessageTracer(enabled=debug, verbose=verbose)
+    as_role = None
 
     try:
         # Step 1: Initialize Environment
@@ -565,6 +566,11 @@ async def run_analysis(
 
         return None
 
+    finally:
+        # Flush queued decision-log records before the event loop shuts down
+        if as_role is not None:
+            await as_role.aclose()
+
 
 # ============================================================================
 # Entry Point
@@ -3,13 +3,21 @@ Filename: MetaGPT-Ewan/MAT/roles/__init__.py
 Created Date: Friday, December 26th 2025
 Author: Ewan Su
 Description: Package initialization for investment agent roles.
+
+Roles are re-exported lazily (PEP 562): each role module, and its transitive
+dependencies, is only imported the first time its class is accessed.
 """
 
-from .base_agent import BaseInvestmentAgent
-from .research_analyst import ResearchAnalyst
-from .technical_analyst import TechnicalAnalyst
-from .sentiment_analyst import SentimentAnalyst
-from .alpha_strategist import AlphaStrategist
+import importlib
+
+# Public name -> submodule that defines it
+_LAZY = {
+    "BaseInvestmentAgent": "base_agent",
+    "ResearchAnalyst": "research_analyst",
+    "TechnicalAnalyst": "technical_analyst",
+    "SentimentAnalyst": "sentiment_analyst",
+    "AlphaStrategist": "alpha_strategist",
+}
 
 __all__ = [
     "BaseInvestmentAgent",
@@ -19,3 +27,16 @@ __all__ = [
     "AlphaStrategist"
 ]
 
+
+def __getattr__(name):
+    """Import a role on first access and cache it in the package namespace."""
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{_LAZY[name]}", __name__)
+    obj = getattr(module, name)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
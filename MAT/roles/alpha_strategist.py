@@ -14,6 +14,9 @@ from metagpt.logs import logger
 import json
 
 from ..roles.base_agent import BaseInvestmentAgent
+from ..schemas_msgspec import (
+    decode_fa_report, decode_ta_report, decode_sa_report, decode_investigation_report
+)
 from ..schemas import (
     FAReport,
     TAReport,
@@ -81,6 +84,15 @@ class AlphaStrategist(BaseInvestmentAgent):
 
         logger.info("🧠 Alpha Strategist initialized with Scheme C (delegated to Actions)")
 
+    async def aclose(self) -> None:
+        """
+        Flush the decision log of the SynthesizeDecision Action.
+
+        Call once when the agent shuts down so the last decisions reach
+        decisions.jsonl before the event loop closes.
+        """
+        await self._synthesize_decision_action.aclose()
+
     def _get_or_create_state(self, ticker: str) -> TradingState:
         """
         Get or create internal trading state for a ticker.
@@ -148,8 +160,12 @@ class AlphaStrategist(BaseInvestmentAgent):
             message: Message from other agents
         """
         try:
-            content = json.loads(message.content)
-            ticker = content.get("ticker")
+            # In-process publishers may attach the report object itself as
+            # instruct_content; only fall back to parsing the JSON body without it
+            if message.instruct_content is not None:
+                ticker = getattr(message.instruct_content, "ticker", None)
+            else:
+                ticker = json.loads(message.content).get("ticker")
 
             if not ticker:
                 return
@@ -165,23 +181,25 @@ class AlphaStrategist(BaseInvestmentAgent):
 
             # Update state based on message type
             if message.cause_by == PublishFAReport or cause_by_str.endswith("PublishFAReport"):
-                state.fa_data = FAReport(**content)
+                state.fa_data = self._message_report(message, FAReport, decode_fa_report)
                 logger.info(f"📈 Received FA Report for {ticker}")
                 logger.info(f"   Revenue: {state.fa_data.revenue_performance.value}")
 
             elif message.cause_by == PublishTAReport or cause_by_str.endswith("PublishTAReport"):
-                state.ta_data = TAReport(**content)
+                state.ta_data = self._message_report(message, TAReport, decode_ta_report)
                 logger.info(f"📊 Received TA Report for {ticker}")
                 logger.info(f"   Market Regime: {state.ta_data.market_regime[:60]}...")
 
             elif message.cause_by == PublishSAReport or cause_by_str.endswith("PublishSAReport"):
-                state.sa_data = SAReport(**content)
+                state.sa_data = self._message_report(message, SAReport, decode_sa_report)
                 logger.info(f"📰 Received SA Report for {ticker}")
                 logger.info(f"   Assessment: {state.sa_data.qualitative_sentiment_assessment[:60]}...")
 
             elif message.cause_by == PublishInvestigationReport or cause_by_str.endswith("PublishInvestigationReport"):
                 # Store investigation report separately
-                inv_report = InvestigationReport(**content)
+                inv_report = self._message_report(
+                    message, InvestigationReport, decode_investigation_report
+                )
                 self._investigation_reports[ticker] = inv_report
                 self._pending_investigations[ticker] = False
 
@@ -192,6 +210,22 @@ class AlphaStrategist(BaseInvestmentAgent):
         except Exception as e:
             logger.error(f"❌ Error processing message: {e}")
 
+    @staticmethod
+    def _message_report(message: Message, model: type, decode):
+        """
+        Get the report carried by a message.
+
+        Args:
+            message: Message from another agent
+            model: Expected report class
+            decode: schemas_msgspec decode_* function for the JSON content
+
+        Returns:
+            message.instruct_content if it is a `model` instance, else the decoded content
+        """
+        report = message.instruct_content
+        return report if isinstance(report, model) else decode(message.content)
+
     def _has_minimum_reports(self, state: TradingState) -> bool:
         """
         Check if we have minimum required reports to make a decision.
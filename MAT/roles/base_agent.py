@@ -5,23 +5,79 @@ Author: Ewan Su
 Description: Base agent class for all investment analysts using MetaGPT's pub-sub pattern.
 """
 
-from typing import Type, Optional
-from abc import ABC, abstractmethod
-from pydantic import BaseModel
+from collections import OrderedDict
+from functools import lru_cache
+from typing import TYPE_CHECKING, ClassVar, Dict, List, Tuple, Type, Optional
+from pydantic import BaseModel, TypeAdapter
+import asyncio
 import re
 import json
 
 from metagpt.roles import Role
 from metagpt.schema import Message
-from metagpt.actions import Action
 from metagpt.logs import logger
+from metagpt.utils.common import any_to_str
 
 from ..environment import InvestmentEnvironment
+from ..actions_module import StartAnalysis
 
+if TYPE_CHECKING:
+    # Only needed for the publish_message() annotation
+    from metagpt.actions import Action
 
-class BaseInvestmentAgent(Role, ABC):
+try:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so handlers below still apply
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    # Transport Structs (see schemas_msgspec.py) are encoded natively when msgspec is installed
+    import msgspec
+except ImportError:
+    msgspec = None
+
+# Greedy outermost {...} block, and Markdown code fences around LLM JSON output
+_JSON_BLOCK_RE = re.compile(r'\{.*\}', re.DOTALL)
+_FENCE_RE = re.compile(r'^```(?:json)?\s*|\s*```$', re.MULTILINE)
+
+# Responses at least this long are parsed in a worker thread by parse_json_robustly_async()
+_ASYNC_PARSE_THRESHOLD = 16_384
+
+# Message.cause_by value of StartAnalysis messages, computed once
+_START_ANALYSIS_TAG = any_to_str(StartAnalysis)
+
+# Relevance verdicts keyed by (message id, agent ticker, state ticker, agent class), LRU-bounded
+_REL_CACHE: "OrderedDict[Tuple[str, str, str, str], bool]" = OrderedDict()
+_REL_CACHE_MAX = 4096
+
+# %-templates for get_trading_state_context(), one per report section
+_FA_CONTEXT_TMPL = "Fundamental Analysis:\n  - Revenue: %s\n  - Profitability: %s\n  - Cash Flow: %s\n\n"
+_TA_CONTEXT_TMPL = "Technical Analysis:\n  - RSI(14): %s\n  - BB Lower Touch: %s\n  - Market Regime: %s\n\n"
+_SA_CONTEXT_TMPL = "Sentiment Analysis:\n  - Sentiment: %s\n  - Events: %s\n\n"
+
+
+@lru_cache(maxsize=16)
+def fiscal_year_from_date(date_str: str) -> Optional[int]:
     """
-    Abstract base class for all investment agents (RA, TA, SA, AS).
+    Extract the fiscal year from a YYYY-MM-DD date string.
+
+    Args:
+        date_str: Date string (e.g., "2022-12-31")
+
+    Returns:
+        The year as an int, or None if the string has no parsable year
+    """
+    try:
+        return int(date_str.split('-')[0])
+    except (ValueError, IndexError):
+        return None
+
+
+class BaseInvestmentAgent(Role):
+    """
+    Base class for all investment agents (RA, TA, SA, AS).
     
     This class provides:
     1. Standardized message observation filtering by ticker
@@ -30,6 +86,9 @@ class BaseInvestmentAgent(Role, ABC):
     
     All concrete agents (RA, TA, SA, AS) should inherit from this class.
     """
+
+    # Serializers for report types, built once per type and shared by all agents
+    _ADAPTERS: ClassVar[Dict[type, TypeAdapter]] = {}
     
     def __init__(
         self,
@@ -78,7 +137,7 @@ class BaseInvestmentAgent(Role, ABC):
             ticker: The stock ticker symbol (e.g., "AAPL", "TSLA")
         """
         self._current_ticker = ticker
-        logger.debug(f"🎯 {self.profile} now tracking: {ticker}")
+        logger.debug("🎯 {} now tracking: {}", self.profile, ticker)
 
     @staticmethod
     def parse_json_robustly(text: str) -> dict:
@@ -104,17 +163,30 @@ class BaseInvestmentAgent(Role, ABC):
             >>> BaseInvestmentAgent.parse_json_robustly(text)
             {'signal': 'BUY'}
         """
-        # Remove markdown code block markers if present
         text = text.strip()
 
+        # Fast path: a well-formed JSON object (the common case) needs no extraction.
+        # Other top-level values (lists, strings, numbers) go through the extraction
+        # below so callers always get the inner object or a JSONDecodeError.
+        try:
+            result = _json_loads(text)
+        except json.JSONDecodeError:
+            pass
+        else:
+            if isinstance(result, dict):
+                return result
+
+        # Remove markdown code block markers if present
+        text = _FENCE_RE.sub('', text)
+
         # Try to find JSON between curly braces using regex
         # This handles cases where JSON is wrapped in markdown or has extra text
-        match = re.search(r'\{.*\}', text, re.DOTALL)
+        match = _JSON_BLOCK_RE.search(text)
 
         if match:
             json_str = match.group(0)
             try:
-                return json.loads(json_str)
+                return _json_loads(json_str)
             except json.JSONDecodeError as e:
                 logger.warning(f"⚠️ Found JSON-like structure but failed to parse: {e}")
                 logger.debug(f"Extracted text: {json_str[:200]}...")
@@ -122,12 +194,31 @@ class BaseInvestmentAgent(Role, ABC):
 
         # Fallback: try to parse the entire text as JSON
         try:
-            return json.loads(text)
+            return _json_loads(text)
         except json.JSONDecodeError as e:
             logger.error(f"❌ No valid JSON found in LLM response")
             logger.debug(f"Raw text: {text[:500]}...")
             raise ValueError(f"Could not extract JSON from LLM response: {e}")
     
+    @classmethod
+    async def parse_json_robustly_async(cls, text: str) -> dict:
+        """
+        Async variant of parse_json_robustly() that keeps the event loop responsive.
+
+        Small responses are parsed inline; responses of at least
+        _ASYNC_PARSE_THRESHOLD characters are parsed in a worker thread so that
+        concurrent agents are not stalled by the regex scan and JSON decode.
+
+        Args:
+            text: Raw LLM response text
+
+        Returns:
+            Parsed JSON dictionary
+        """
+        if len(text) < _ASYNC_PARSE_THRESHOLD:
+            return cls.parse_json_robustly(text)
+        return await asyncio.to_thread(cls.parse_json_robustly, text)
+
     async def _observe(self) -> int:
         """
         Observe messages from the environment and filter by ticker context.
@@ -141,30 +232,94 @@ class BaseInvestmentAgent(Role, ABC):
             Number of messages observed that are relevant to this agent
         """
         # Call parent's observe method to populate rc.news from msg_buffer
+        # (it drains the buffer, applies the watch list and records memory; the
+        # ticker filter below is the only extra pass, over the watched subset)
         count_before = await super()._observe()
-        logger.debug(f"🔍 {self.profile}._observe() - After super(), rc.news has {len(self.rc.news)} messages")
+        logger.debug("🔍 {}._observe() - After super(), rc.news has {} messages", self.profile, count_before)
+        if not count_before:
+            return 0
         
-        # Filter rc.news by ticker if we have a current ticker set
-        if self._current_ticker and self.env.trading_state:
-            # Only keep messages for the current ticker
-            relevant_messages = []
-            for msg in self.rc.news:
-                # Check if message is for the current ticker
-                is_relevant = self._is_message_relevant(msg)
-                if is_relevant:
-                    relevant_messages.append(msg)
+        # Resolve the env/state/ticker chain once rather than per message
+        env = self.env
+        ticker = self._current_ticker
+
+        # Filter rc.news by ticker if we have a current ticker set. When it matches
+        # the environment's ticker every message is relevant (the same
+        # short-circuit _is_message_relevant() applies), so skip the pass.
+        if ticker and env.trading_state and ticker != env.trading_state.current_ticker:
+            # Messages tagged with this agent's ticker are accepted straight from
+            # the environment's ticker index; everything else is decided by
+            # _is_message_relevant(), including subclass overrides
+            tagged_ids = env.message_ids_for_ticker(ticker)
+            is_relevant = self._is_message_relevant_cached
+            relevant_messages = [
+                msg for msg in self.rc.news
+                if msg.id in tagged_ids or is_relevant(msg)
+            ]
             
-            # Replace rc.news with filtered messages
-            self.rc.news = relevant_messages
+            # Replace rc.news with filtered messages (kept as-is when nothing was dropped)
+            if len(relevant_messages) != count_before:
+                self.rc.news = relevant_messages
             
             if relevant_messages:
-                logger.debug(f"🔍 {self.profile} filtered to {len(relevant_messages)} relevant messages for {self._current_ticker}")
+                logger.debug("🔍 {} filtered to {} relevant messages for {}", self.profile, len(relevant_messages), ticker)
             
             return len(relevant_messages)
         
         # No filter applied
-        return len(self.rc.news)
+        return count_before
     
+    def _pending_start_tickers(self) -> List[str]:
+        """
+        Collect the distinct tickers requested by StartAnalysis messages in rc.news.
+
+        Returns:
+            Tickers in arrival order (empty if no parsable StartAnalysis message is pending)
+        """
+        tickers = []
+        for msg in self.rc.news:
+            if msg.cause_by != _START_ANALYSIS_TAG:
+                continue
+            try:
+                ticker = _json_loads(msg.content).get("ticker")
+            except (ValueError, AttributeError):
+                continue
+            if ticker and ticker not in tickers:
+                tickers.append(ticker)
+        return tickers
+
+    def _is_message_relevant_cached(self, message: Message) -> bool:
+        """
+        Memoized _is_message_relevant() shared across agents of the same class.
+
+        The verdict depends only on the message, this agent's ticker, the
+        environment's ticker and the (class-level) filtering logic, so it is
+        cached under that key and reused on later observations of the message.
+
+        Args:
+            message: The message to check for relevance
+
+        Returns:
+            True if the message is relevant to the current ticker, False otherwise
+        """
+        state = self.env.trading_state
+        key = (
+            message.id,
+            self._current_ticker,
+            state.current_ticker if state else "",
+            type(self).__name__,
+        )
+        cached = _REL_CACHE.get(key)
+        if cached is not None:
+            _REL_CACHE.move_to_end(key)
+            return cached
+
+        result = self._is_message_relevant(message)
+        _REL_CACHE[key] = result
+        if len(_REL_CACHE) > _REL_CACHE_MAX:
+            _REL_CACHE.popitem(last=False)
+        return result
+
     def _is_message_relevant(self, message: Message) -> bool:
         """
         Determine if a message is relevant to this agent based on ticker context.
@@ -178,20 +333,50 @@ class BaseInvestmentAgent(Role, ABC):
             True if the message is relevant to the current ticker, False otherwise
         """
         # By default, check if the current ticker matches the environment's ticker
-        if not self.env.trading_state:
+        state = self.env.trading_state
+        if not state:
             return True  # No state to filter by, process all messages
         
+        ticker = self._current_ticker
+        if ticker == state.current_ticker:
+            return True
+
+        # Reports published via publish_message() carry a ticker tag; compare it
+        # instead of scanning the serialized JSON body
+        tagged_ticker = message.metadata.get("ticker") if message.metadata else None
+        if tagged_ticker is not None:
+            return tagged_ticker == ticker
+
+        # Reports passed in-process as instruct_content carry their own ticker
+        report_ticker = getattr(message.instruct_content, "ticker", None)
+        if report_ticker is not None:
+            return report_ticker == ticker
+
         # Check if message content contains the ticker (simple heuristic)
         # Subclasses can override this for more sophisticated filtering
-        return (
-            self._current_ticker == self.env.trading_state.current_ticker or
-            self._current_ticker in message.content
-        )
+        return ticker in message.content
     
+    @classmethod
+    def _dump_report_json(cls, report: BaseModel) -> str:
+        """
+        Serialize a pydantic report to compact JSON with a per-type cached TypeAdapter.
+
+        Args:
+            report: The pydantic report model
+
+        Returns:
+            JSON string
+        """
+        report_type = type(report)
+        adapter = cls._ADAPTERS.get(report_type)
+        if adapter is None:
+            adapter = cls._ADAPTERS.setdefault(report_type, TypeAdapter(report_type))
+        return adapter.dump_json(report).decode()
+
     def publish_message(
         self,
         report: BaseModel,
-        cause_by: Type[Action] = None,
+        cause_by: Type["Action"] = None,
         send_to: str = ""
     ) -> Message:
         """
@@ -199,12 +384,13 @@ class BaseInvestmentAgent(Role, ABC):
         
         This is the standard way for agents to publish their reports to the environment.
         The report will be:
-        1. Serialized to JSON
+        1. Serialized to compact JSON
         2. Wrapped in a Message object with proper metadata
         3. Published to the environment for other agents to observe
         
         Args:
-            report: A Pydantic model (FAReport, TAReport, SAReport, or StrategyDecision) OR a Message object
+            report: A Pydantic model (FAReport, TAReport, SAReport, or StrategyDecision), a msgspec
+                transport Struct from schemas_msgspec, OR a Message object
             cause_by: The Action class that generated this report (optional if report is already a Message)
             send_to: Optional specific recipient role name
             
@@ -216,8 +402,11 @@ class BaseInvestmentAgent(Role, ABC):
             self.env.publish_message(report)
             return report
         
-        # Serialize the Pydantic model to JSON for message content
-        message_content = report.model_dump_json(indent=2)
+        # Serialize the report to compact JSON (content is machine-consumed by other agents)
+        if msgspec is not None and isinstance(report, msgspec.Struct):
+            message_content = msgspec.json.encode(report).decode()
+        else:
+            message_content = self._dump_report_json(report)
         
         # Create the MetaGPT Message
         message = Message(
@@ -225,7 +414,8 @@ class BaseInvestmentAgent(Role, ABC):
             role=self.profile,
             cause_by=cause_by,
             send_to=send_to,
-            instruct_content=None
+            instruct_content=None,
+            metadata={"ticker": report.ticker, "cause_by": cause_by.__name__ if cause_by else None}
         )
         
         logger.info(f"📤 {self.profile} publishing {cause_by.__name__} for {report.ticker}")
@@ -235,10 +425,9 @@ class BaseInvestmentAgent(Role, ABC):
         
         return message
     
-    @abstractmethod
     async def _act(self) -> Message:
         """
-        Abstract method for agent's action logic.
+        Agent's action logic; concrete agents must override this.
         
         Each concrete agent (RA, TA, SA, AS) must implement this method to:
         1. Retrieve relevant data from the environment or messages
@@ -248,8 +437,11 @@ class BaseInvestmentAgent(Role, ABC):
         
         Returns:
             The Message containing the agent's report
+
+        Raises:
+            NotImplementedError: If the concrete agent does not override it
         """
-        pass
+        raise NotImplementedError(f"{type(self).__name__} must implement _act()")
     
     def get_trading_state_context(self) -> str:
         """
@@ -265,24 +457,30 @@ class BaseInvestmentAgent(Role, ABC):
             return "No trading state available."
         
         state = self.env.trading_state
-        context = f"Current Ticker: {state.current_ticker}\n\n"
-        
-        if state.fa_data:
-            context += f"Fundamental Analysis:\n"
-            context += f"  - Revenue Growth YoY: {state.fa_data.revenue_growth_yoy:.2%}\n"
-            context += f"  - Gross Margin: {state.fa_data.gross_margin:.2%}\n"
-            context += f"  - Growth Healthy: {state.fa_data.is_growth_healthy}\n\n"
-        
-        if state.ta_data:
-            context += f"Technical Analysis:\n"
-            context += f"  - RSI(14): {state.ta_data.rsi_14:.2f}\n"
-            context += f"  - BB Lower Touch: {state.ta_data.bb_lower_touch}\n"
-            context += f"  - Signal: {state.ta_data.technical_signal.value}\n\n"
-        
-        if state.sa_data:
-            context += f"Sentiment Analysis:\n"
-            context += f"  - Sentiment Score: {state.sa_data.sentiment_score:.2f}\n"
-            context += f"  - Events: {', '.join([e.value for e in state.sa_data.impactful_events])}\n\n"
-        
+        if state._context_cache is not None:
+            return state._context_cache
+
+        parts = ["Current Ticker: %s\n\n" % state.current_ticker]
+
+        fa = state.fa_data
+        if fa is not None:
+            parts.append(_FA_CONTEXT_TMPL % (
+                fa.revenue_performance.value,
+                fa.profitability_audit.value,
+                fa.cash_flow_stability.value,
+            ))
+
+        ta = state.ta_data
+        if ta is not None:
+            rsi = "%.2f" % ta.rsi_14 if ta.rsi_14 is not None else "N/A"
+            parts.append(_TA_CONTEXT_TMPL % (rsi, ta.bb_lower_touch, ta.market_regime))
+
+        sa = state.sa_data
+        if sa is not None:
+            events = ", ".join([e.value for e in sa.impactful_events])
+            parts.append(_SA_CONTEXT_TMPL % (sa.qualitative_sentiment_assessment, events))
+
+        context = "".join(parts)
+        state._context_cache = context
         return context
 
@@ -8,15 +8,19 @@ This role wraps the RetrieveRAGData action to perform fundamental analysis
 and publishes FAReport when it observes a StartAnalysis message.
 """
 
-from typing import Optional
+from typing import List, Optional
 
 from metagpt.schema import Message
 from metagpt.logs import logger
+from metagpt.utils.common import any_to_str
 
-from .base_agent import BaseInvestmentAgent
+from .base_agent import BaseInvestmentAgent, fiscal_year_from_date
 from ..actions.retrieve_rag_data import RetrieveRAGData
 from ..actions_module import StartAnalysis, PublishFAReport
-from ..schemas import FAReport
+from ..schemas import FAReport, FinancialMetric
+
+# Message.cause_by value of StartAnalysis messages, computed once
+_START_ANALYSIS_TAG = any_to_str(StartAnalysis)
 
 
 class ResearchAnalyst(BaseInvestmentAgent):
@@ -79,6 +83,7 @@ class ResearchAnalyst(BaseInvestmentAgent):
         # Store time window for potential time-aligned analysis
         self.analysis_start_date = analysis_start_date
         self.analysis_end_date = analysis_end_date
+        self._fiscal_year: Optional[int] = self._resolve_fiscal_year()
         
         # Initialize the RetrieveRAGData action
         self.retrieve_rag_action = RetrieveRAGData()
@@ -107,32 +112,24 @@ class ResearchAnalyst(BaseInvestmentAgent):
         logger.info(f"📊 {self.profile} starting fundamental analysis")
         logger.info(f"{'='*80}")
         
+        # Coalesce several pending StartAnalysis messages into one batch
+        pending_tickers = self._pending_start_tickers()
+        if len(pending_tickers) > 1:
+            return await self.run_batch(pending_tickers)
+
         # Get the ticker from the trading state or from the current ticker
         ticker = self._current_ticker or self.env.trading_state.current_ticker
         
         if not ticker:
             logger.error("❌ No ticker specified for analysis")
             # Return a default FAReport with qualitative schema
-            default_report = FAReport(ticker="UNKNOWN")
+            default_report = FAReport.model_construct(ticker="UNKNOWN")
             return self.publish_message(default_report, PublishFAReport)
         
         logger.info(f"🎯 Analyzing ticker: {ticker}")
 
-        # Extract fiscal year from system_reference_date if available
-        fiscal_year = None
-        if self.system_reference_date:
-            try:
-                fiscal_year = int(self.system_reference_date.split('-')[0])
-                logger.info(f"📅 Target fiscal year: {fiscal_year} (from system_reference_date)")
-            except (ValueError, IndexError):
-                logger.warning(f"⚠️ Could not extract fiscal year from {self.system_reference_date}")
-        elif hasattr(self, 'analysis_start_date') and self.analysis_start_date:
-            try:
-                fiscal_year = int(self.analysis_start_date.split('-')[0])
-                logger.info(f"📅 Target fiscal year: {fiscal_year} (from analysis_start_date)")
-            except (ValueError, IndexError):
-                logger.warning(f"⚠️ Could not extract fiscal year from {self.analysis_start_date}")
-        
+        fiscal_year = self._fiscal_year
+
         try:
             # Execute the RetrieveRAGData action
             # Pass fiscal_year to focus on specific year's data
@@ -165,19 +162,85 @@ class ResearchAnalyst(BaseInvestmentAgent):
         except Exception as e:
             logger.error(f"❌ {self.profile} failed to complete analysis: {e}")
             import traceback
-            logger.debug(traceback.format_exc())
+            logger.opt(lazy=True).debug("{}", traceback.format_exc)
             
             # Return a default FAReport on error
-            from ..schemas import FinancialMetric
-            error_report = FAReport(
-                ticker=ticker,
-                revenue_performance=FinancialMetric(value="DATA_GAP", analysis=f"Analysis failed: {str(e)}"),
-                profitability_audit=FinancialMetric(value="DATA_GAP", analysis="Data unavailable due to error"),
-                cash_flow_stability=FinancialMetric(value="DATA_GAP", analysis="Data unavailable due to error"),
-                management_guidance_audit=f"Analysis failed: {str(e)}",
-                key_risks_evidence=[f"Analysis failed: {str(e)}"]
-            )
-            return self.publish_message(error_report, PublishFAReport)
+            return self.publish_message(self._build_error_report(ticker, e), PublishFAReport)
+
+    async def run_batch(self, tickers: List[str]) -> Message:
+        """
+        Analyze several tickers with one RetrieveRAGData batch call and publish each FAReport.
+
+        Args:
+            tickers: Stock ticker symbols to analyze
+
+        Returns:
+            Message containing the last published FAReport
+        """
+        logger.info(f"📦 {self.profile} batching {len(tickers)} tickers: {', '.join(tickers)}")
+        fiscal_year = self._fiscal_year
+
+        try:
+            fa_reports = await self.retrieve_rag_action.run_batch(tickers, fiscal_year=fiscal_year)
+        except Exception as e:
+            logger.error(f"❌ {self.profile} batch analysis failed: {e}")
+            fa_reports = [self._build_error_report(ticker, e) for ticker in tickers]
+
+        state = self.env.trading_state
+        message = None
+        for fa_report in fa_reports:
+            # Only the environment's current ticker is tracked in the shared trading state
+            if state and state.current_ticker == fa_report.ticker:
+                state.fa_data = fa_report
+            message = self.publish_message(fa_report, PublishFAReport)
+
+        logger.info(f"📤 {self.profile} published {len(fa_reports)} FAReports")
+        return message
+
+    def _build_error_report(self, ticker: str, error: Exception) -> FAReport:
+        """
+        Build the default FAReport published when analysis fails.
+
+        Args:
+            ticker: Stock ticker symbol
+            error: The exception that aborted the analysis
+
+        Returns:
+            FAReport with DATA_GAP metrics describing the failure
+        """
+        # Internally built from trusted literals, so validation is skipped
+        return FAReport.model_construct(
+            ticker=ticker,
+            revenue_performance=FinancialMetric(value="DATA_GAP", analysis=f"Analysis failed: {str(error)}"),
+            profitability_audit=FinancialMetric(value="DATA_GAP", analysis="Data unavailable due to error"),
+            cash_flow_stability=FinancialMetric(value="DATA_GAP", analysis="Data unavailable due to error"),
+            management_guidance_audit=f"Analysis failed: {str(error)}",
+            key_risks_evidence=(f"Analysis failed: {str(error)}",)
+        )
+
+    def _resolve_fiscal_year(self) -> Optional[int]:
+        """
+        Extract the target fiscal year from system_reference_date or analysis_start_date.
+
+        Called once at construction and again from set_time_window(); _act()
+        reads the stored self._fiscal_year instead of re-parsing the dates.
+
+        Returns:
+            Fiscal year, or None if neither date is set or parsable
+        """
+        if self.system_reference_date:
+            source, date_str = "system_reference_date", self.system_reference_date
+        elif self.analysis_start_date:
+            source, date_str = "analysis_start_date", self.analysis_start_date
+        else:
+            return None
+
+        fiscal_year = fiscal_year_from_date(date_str)
+        if fiscal_year is None:
+            logger.warning(f"⚠️ Could not extract fiscal year from {date_str}")
+        else:
+            logger.info(f"📅 Target fiscal year: {fiscal_year} (from {source})")
+        return fiscal_year
     
     def _is_message_relevant(self, message: Message) -> bool:
         """
@@ -193,9 +256,10 @@ class ResearchAnalyst(BaseInvestmentAgent):
         Returns:
             True if the message is relevant, False otherwise
         """
-        # Check if it's a StartAnalysis message
-        if message.cause_by == StartAnalysis:
-            logger.debug(f"📩 {self.profile} received StartAnalysis message")
+        # Check if it's a StartAnalysis message (cause_by is stored as the action's
+        # qualified-name string, so compare against the precomputed tag)
+        if message.cause_by == _START_ANALYSIS_TAG:
+            logger.debug("📩 {} received StartAnalysis message", self.profile)
             return True
         
         # Use the parent class's default filtering logic for other messages
@@ -214,5 +278,6 @@ class ResearchAnalyst(BaseInvestmentAgent):
         """
         self.analysis_start_date = start_date
         self.analysis_end_date = end_date
+        self._fiscal_year = self._resolve_fiscal_year()
         logger.info(f"📅 {self.profile} time window set: {start_date} to {end_date}")
 
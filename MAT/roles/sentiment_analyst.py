@@ -212,8 +212,7 @@ class SentimentAnalyst(BaseInvestmentAgent):
             Message with InvestigationReport
         """
         try:
-            request_data = json.loads(request_msg.content)
-            investigation_req = InvestigationRequest(**request_data)
+            investigation_req = InvestigationRequest.model_validate_json(request_msg.content)
 
             ticker = investigation_req.ticker
             context_issue = investigation_req.context_issue
@@ -8,16 +8,47 @@ This role wraps the CalculateTechnicals action to perform technical analysis
 and publishes TAReport when it observes a StartAnalysis message.
 """
 
-from typing import Optional
+from typing import List, Optional, Tuple
 from datetime import datetime, timedelta
 
 from metagpt.schema import Message
 from metagpt.logs import logger
+from metagpt.utils.common import any_to_str
 
 from .base_agent import BaseInvestmentAgent
-from ..actions.calculate_technicals import CalculateTechnicals
 from ..actions_module import StartAnalysis, PublishTAReport
-from ..schemas import TAReport, SignalIntensity
+from ..schemas import TAReport
+
+
+# Message.cause_by value of StartAnalysis messages, computed once
+_START_ANALYSIS_TAG = any_to_str(StartAnalysis)
+
+# Result summary logged after each analysis (one record; loguru formats it only when INFO is enabled)
+_RESULT_LOG_TMPL = (
+    "\n📊 Technical Analysis Results for {ticker}:\n"
+    "   RSI(14): {rsi:.2f}\n"
+    "   BB Lower Touch: {bb}\n"
+    "   Multi-Period MA Distances:\n"
+    "     - MA(20):  {m20:+.2%}\n"
+    "     - MA(50):  {m50:+.2%}\n"
+    "     - MA(200): {m200:+.2%}\n"
+    "   ATR Volatility: ${atr:.2f}\n"
+    "   Market Regime: {regime:.100}..."
+)
+
+# Validated once; failures copy it with the ticker and error instead of re-validating a full TAReport
+_ERROR_TA_REPORT_TEMPLATE = TAReport(
+    ticker="__TEMPLATE__",
+    rsi_14=50.0,
+    bb_lower_touch=False,
+    price_to_ma20_dist=0.0,
+    price_to_ma50_dist=0.0,
+    price_to_ma200_dist=0.0,
+    volatility_atr=0.0,
+    market_regime="Analysis failed",
+    indicator_tension_analysis="Analysis failed",
+    dead_cat_vs_value="Analysis failed"
+)
 
 
 class TechnicalAnalyst(BaseInvestmentAgent):
@@ -94,8 +125,13 @@ class TechnicalAnalyst(BaseInvestmentAgent):
         self.analysis_start_date = analysis_start_date
         self.analysis_end_date = analysis_end_date
         
-        # Initialize the CalculateTechnicals action
-        self.calculate_technicals_action = CalculateTechnicals()
+        # (system_reference_date, start_date, end_date) of the last time-travel window computed in _act()
+        self._ref_window_cache: Optional[Tuple[str, str, str]] = None
+
+        # Shared CalculateTechnicals action (one warm-up and HTTP session for all TAs);
+        # imported here so loading this module does not pull in pandas/NumPy
+        from ..actions.calculate_technicals import CalculateTechnicals
+        self.calculate_technicals_action = CalculateTechnicals.get()
         
         # Set up the role to observe StartAnalysis messages and take PublishTAReport action
         self.set_actions([PublishTAReport])
@@ -127,37 +163,25 @@ class TechnicalAnalyst(BaseInvestmentAgent):
         Returns:
             Message containing the TAReport
         """
+        # Coalesce several pending StartAnalysis messages into one batch
+        pending_tickers = self._pending_start_tickers()
+        if len(pending_tickers) > 1:
+            return await self.run_batch(pending_tickers)
+
+        # Get the ticker from the trading state or from the current ticker;
+        # without one, fail fast before any banner/analysis logging
+        state = self.env.trading_state
+        ticker = self._current_ticker or (state.current_ticker if state else None)
+        if not ticker:
+            logger.error("❌ No ticker specified for analysis")
+            return self.publish_message(TAReport(ticker="UNKNOWN"), PublishTAReport)
+
         logger.info(f"\n{'='*80}")
         logger.info(f"📈 {self.profile} starting technical analysis")
         logger.info(f"{'='*80}")
-        
-        # Get the ticker from the trading state or from the current ticker
-        ticker = self._current_ticker or self.env.trading_state.current_ticker
-        
-        if not ticker:
-            logger.error("❌ No ticker specified for analysis")
-            # Return a default TAReport with qualitative schema
-            default_report = TAReport(ticker="UNKNOWN")
-            return self.publish_message(default_report, PublishTAReport)
-        
         logger.info(f"🎯 Analyzing ticker: {ticker}")
 
-        # Determine time window from system_reference_date or custom dates
-        start_date = self.analysis_start_date
-        end_date = self.analysis_end_date
-
-        # If system_reference_date is set, calculate historical window
-        if self.system_reference_date and not (start_date and end_date):
-            ref_date = datetime.strptime(self.system_reference_date, "%Y-%m-%d")
-            # Get 12 months (365 days) of data before the reference date to support SMA(200)
-            end_date = self.system_reference_date
-            start_date = (ref_date - timedelta(days=365)).strftime("%Y-%m-%d")
-            logger.info(f"🕰️  Time-Travel Mode: Reference date = {self.system_reference_date}")
-            logger.info(f"📅 Time Window: {start_date} to {end_date} (12 months before reference)")
-        elif start_date and end_date:
-            logger.info(f"📅 Time Window: {start_date} to {end_date} (Historical)")
-        else:
-            logger.info(f"📅 Time Window: Last 250 days (Real-time)")
+        start_date, end_date = self._resolve_time_window()
 
         try:
             # Execute the CalculateTechnicals action
@@ -169,15 +193,17 @@ class TechnicalAnalyst(BaseInvestmentAgent):
             )
             
             # Log the analysis results with qualitative evidence
-            logger.info(f"\n📊 Technical Analysis Results for {ticker}:")
-            logger.info(f"   RSI(14): {ta_report.rsi_14:.2f}")
-            logger.info(f"   BB Lower Touch: {ta_report.bb_lower_touch}")
-            logger.info(f"   Multi-Period MA Distances:")
-            logger.info(f"     - MA(20):  {ta_report.price_to_ma20_dist:+.2%}")
-            logger.info(f"     - MA(50):  {ta_report.price_to_ma50_dist:+.2%}")
-            logger.info(f"     - MA(200): {ta_report.price_to_ma200_dist:+.2%}")
-            logger.info(f"   ATR Volatility: ${ta_report.volatility_atr:.2f}")
-            logger.info(f"   Market Regime: {ta_report.market_regime[:100]}...")
+            logger.info(
+                _RESULT_LOG_TMPL,
+                ticker=ticker,
+                rsi=ta_report.rsi_14,
+                bb=ta_report.bb_lower_touch,
+                m20=ta_report.price_to_ma20_dist,
+                m50=ta_report.price_to_ma50_dist,
+                m200=ta_report.price_to_ma200_dist,
+                atr=ta_report.volatility_atr,
+                regime=ta_report.market_regime
+            )
             
             # Update the environment's trading state with TA data
             if self.env.trading_state:
@@ -195,23 +221,76 @@ class TechnicalAnalyst(BaseInvestmentAgent):
         except Exception as e:
             logger.error(f"❌ {self.profile} failed to complete analysis: {e}")
             import traceback
-            logger.debug(traceback.format_exc())
+            logger.opt(lazy=True).debug("{}", traceback.format_exc)
             
             # Return a default TAReport on error with qualitative schema
-            error_report = TAReport(
-                ticker=ticker,
-                rsi_14=50.0,
-                bb_lower_touch=False,
-                price_to_ma20_dist=0.0,
-                price_to_ma50_dist=0.0,
-                price_to_ma200_dist=0.0,
-                volatility_atr=0.0,
-                market_regime=f"Analysis failed: {str(e)}",
-                indicator_tension_analysis="Analysis failed",
-                dead_cat_vs_value="Analysis failed"
+            error_report = _ERROR_TA_REPORT_TEMPLATE.model_copy(
+                update={"ticker": ticker, "market_regime": f"Analysis failed: {str(e)}"}
             )
             return self.publish_message(error_report, PublishTAReport)
     
+    async def run_batch(self, tickers: List[str]) -> Message:
+        """
+        Analyze several tickers with one CalculateTechnicals batch call and publish each TAReport.
+
+        Args:
+            tickers: Stock ticker symbols to analyze
+
+        Returns:
+            Message containing the last published TAReport
+        """
+        logger.info(f"📦 {self.profile} batching {len(tickers)} tickers: {', '.join(tickers)}")
+        start_date, end_date = self._resolve_time_window()
+
+        ta_reports = await self.calculate_technicals_action.run_batch(
+            tickers,
+            start_date=start_date,
+            end_date=end_date
+        )
+
+        state = self.env.trading_state
+        message = None
+        for ta_report in ta_reports:
+            # Only the environment's current ticker is tracked in the shared trading state
+            if state and state.current_ticker == ta_report.ticker:
+                state.ta_data = ta_report
+            message = self.publish_message(ta_report, PublishTAReport)
+
+        logger.info(f"📤 {self.profile} published {len(ta_reports)} TAReports")
+        return message
+
+    def _resolve_time_window(self) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Determine the price window from system_reference_date or the custom dates.
+
+        Returns:
+            (start_date, end_date); both None means real-time mode (last 250 days)
+        """
+        start_date = self.analysis_start_date
+        end_date = self.analysis_end_date
+
+        # If system_reference_date is set, calculate historical window
+        if self.system_reference_date and not (start_date and end_date):
+            window = self._ref_window_cache
+            if window is None or window[0] != self.system_reference_date:
+                ref_date = datetime.strptime(self.system_reference_date, "%Y-%m-%d")
+                # Get 12 months (365 days) of data before the reference date to support SMA(200)
+                window = (
+                    self.system_reference_date,
+                    (ref_date - timedelta(days=365)).strftime("%Y-%m-%d"),
+                    self.system_reference_date,
+                )
+                self._ref_window_cache = window
+            _, start_date, end_date = window
+            logger.info(f"🕰️  Time-Travel Mode: Reference date = {self.system_reference_date}")
+            logger.info(f"📅 Time Window: {start_date} to {end_date} (12 months before reference)")
+        elif start_date and end_date:
+            logger.info(f"📅 Time Window: {start_date} to {end_date} (Historical)")
+        else:
+            logger.info(f"📅 Time Window: Last 250 days (Real-time)")
+
+        return start_date, end_date
+
     def _is_message_relevant(self, message: Message) -> bool:
         """
         Determine if a message is relevant to this Technical Analyst.
@@ -226,9 +305,10 @@ class TechnicalAnalyst(BaseInvestmentAgent):
         Returns:
             True if the message is relevant, False otherwise
         """
-        # Check if it's a StartAnalysis message
-        if message.cause_by == StartAnalysis:
-            logger.debug(f"📩 {self.profile} received StartAnalysis message")
+        # Check if it's a StartAnalysis message (cause_by is stored as the action's
+        # qualified-name string, so compare against the precomputed tag)
+        if message.cause_by == _START_ANALYSIS_TAG:
+            logger.debug("📩 {} received StartAnalysis message", self.profile)
             return True
         
         # Use the parent class's default filtering logic for other messages
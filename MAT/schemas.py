@@ -1,19 +1,26 @@
+import sys
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+from typing import Annotated, List, Optional, Dict, Any, Tuple
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # --- 1. Signal & Event Enums ---
 
-class SignalIntensity(Enum):
-    """Standardized signals for trading decisions."""
+class SignalIntensity(str, Enum):
+    """Standardized signals for trading decisions (members are also plain strings)."""
     STRONG_BUY = "STRONG_BUY"
     BUY = "BUY"
     NEUTRAL = "NEUTRAL"
     SELL = "SELL"
     STRONG_SELL = "STRONG_SELL"
 
-class MarketEvent(Enum):
-    """Categories of market-moving events."""
+class MarketEvent(str, Enum):
+    """Categories of market-moving events (members are also plain strings)."""
     EARNINGS_CALL = "EARNINGS_CALL"
     PRODUCT_LAUNCH = "PRODUCT_LAUNCH"
     REGULATORY_ACTION = "REGULATORY_ACTION"
@@ -23,7 +30,127 @@ class MarketEvent(Enum):
 
 # --- 2. Agent Output Protocols ---
 
-class FinancialMetric(BaseModel):
+# Published reports are immutable once built; TradingState (mutable) holds the latest of each
+_REPORT_CONFIG = ConfigDict(frozen=True)
+
+def intern_strings(value: Any) -> Any:
+    """
+    Intern the strings of a list/tuple and return them as a tuple.
+
+    Risk phrases and keywords recur across reports in a long session, so
+    interning lets them share storage and compare by identity first.
+    Anything else is returned unchanged for pydantic to validate.
+
+    Args:
+        value: Raw field input
+
+    Returns:
+        Tuple of interned strings, or value unchanged
+    """
+    if isinstance(value, (list, tuple)):
+        return tuple(sys.intern(v) if type(v) is str else v for v in value)
+    return value
+
+# Immutable string sequence field whose items are interned on validation
+InternedStrTuple = Annotated[Tuple[str, ...], BeforeValidator(intern_strings)]
+
+# str(MarketEvent.X) prefix; stripped with a constant slice (no split() list per item)
+_MARKET_EVENT_PREFIX = "MarketEvent."
+_MARKET_EVENT_PREFIX_LEN = len(_MARKET_EVENT_PREFIX)
+
+def normalize_market_events(value: Any) -> Any:
+    """
+    Strip the enum class prefix from serialized MarketEvent names.
+
+    Reports written with str(event) contain "MarketEvent.EARNINGS_CALL"
+    instead of "EARNINGS_CALL"; this maps them back so the stored JSON can be
+    validated directly (including by model_validate_json()).
+
+    Args:
+        value: Raw field input
+
+    Returns:
+        List with prefixed names reduced to their member value, or value unchanged
+    """
+    if isinstance(value, (list, tuple)):
+        return [
+            v[_MARKET_EVENT_PREFIX_LEN:] if type(v) is str and v.startswith(_MARKET_EVENT_PREFIX) else v
+            for v in value
+        ]
+    return value
+
+# MarketEvent list field that also accepts "MarketEvent.X" spellings
+MarketEventList = Annotated[List[MarketEvent], BeforeValidator(normalize_market_events)]
+
+class FastJSONMixin:
+    """JSON export for report models via orjson (falls back to pydantic without it)."""
+
+    def to_json(self, indent: bool = False) -> bytes:
+        """
+        Serialize the report to UTF-8 JSON bytes.
+
+        Dict fields keep their insertion order; NumPy scalars/arrays are
+        serialized natively.
+
+        Args:
+            indent: Pretty-print with 2-space indentation (for saved audit files)
+
+        Returns:
+            JSON bytes
+        """
+        if orjson is None:
+            return self.model_dump_json(indent=2 if indent else None).encode()
+        option = orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(self.model_dump(), option=option)
+
+@dataclass(slots=True)
+class MetricMeta:
+    """
+    Typed audit metadata for the chunk a FinancialMetric was extracted from.
+
+    Attributes:
+        page_num: Page of the source PDF the chunk came from.
+        relevance_score: Retrieval relevance score of the chunk.
+        chunk_id: RAGFlow chunk ID.
+    """
+    page_num: Optional[int] = None
+    relevance_score: Optional[float] = None
+    chunk_id: Optional[str] = None
+
+    @classmethod
+    def from_raw(cls, raw: Any) -> "MetricMeta":
+        """
+        Build MetricMeta from an untrusted (LLM-produced) metadata dict.
+
+        Unknown keys are dropped and values that cannot be coerced become None,
+        so a sloppy metadata block never fails the whole FAReport.
+
+        Args:
+            raw: Metadata dict (anything else yields an empty MetricMeta)
+
+        Returns:
+            The coerced MetricMeta
+        """
+        if not isinstance(raw, dict):
+            return cls()
+
+        def coerce(key, to_type):
+            value = raw.get(key)
+            if value is None:
+                return None
+            try:
+                return to_type(value)
+            except (TypeError, ValueError, OverflowError):
+                return None
+
+        return cls(
+            page_num=coerce("page_num", lambda v: int(float(v))),
+            relevance_score=coerce("relevance_score", float),
+            chunk_id=coerce("chunk_id", str),
+        )
+
+@dataclass(slots=True)
+class FinancialMetric:
     """
     Sub-model for evidence-based financial metrics with full traceability.
 
@@ -33,33 +160,27 @@ class FinancialMetric(BaseModel):
     - Full Markdown-cleaned text of the source chunk for manual verification
     - Clickable RAGFlow preview URL for jumping to exact PDF page
     - Metadata tracking page numbers and relevance scores
-    """
-    value: Optional[str] = Field(
-        None,
-        description="Extracted metric value (e.g., '33% YoY', '$100B', 'Increased by 15%'). Use 'DATA_GAP' if data is unavailable."
-    )
-    analysis: str = Field(
-        default="No analysis available",
-        description="Qualitative causal explanation using BECAUSE-THEN logic. Must explain WHY the metric changed and WHAT impact it had. Example: 'Revenue grew 33% BECAUSE iPhone sales surged post-COVID recovery, WHICH THEN drove record quarterly performance despite supply chain headwinds.'"
-    )
-    evidence_md: str = Field(
-        default="No evidence available",
-        description="The full Markdown-cleaned text of the Top 1 retrieved chunk (HTML tables converted to Markdown). Enables manual verification of the LLM's extraction."
-    )
-    source_link: str = Field(
-        default="No source link available",
-        description="Direct reference to source: [Document Name] | [Chunk ID]. Enables jumping to exact PDF location."
-    )
-    source_url: str = Field(
-        default="No source URL available",
-        description="Clickable RAGFlow preview URL to jump directly to the chunk's PDF page. Format: http://{base_ip}/chunk/parsed/chunks?id={dataset_id}&doc_id={doc_id}&page=1"
-    )
-    metadata: Dict[str, Any] = Field(
-        default_factory=dict,
-        description="Additional metadata tracking page_num, relevance_score, and other chunk attributes for audit purposes."
-    )
 
-class FAReport(BaseModel):
+    This is a plain dataclass rather than a BaseModel: it is only ever built by
+    trusted code or validated as a nested field of FAReport, which pydantic
+    handles natively (including model_dump / model_dump_json).
+
+    Attributes:
+        value: Extracted metric value (e.g., '33% YoY', '$100B', 'Increased by 15%'). 'DATA_GAP' if data is unavailable.
+        analysis: Qualitative causal explanation using BECAUSE-THEN logic (WHY the metric changed and WHAT impact it had).
+        evidence_md: The full Markdown-cleaned text of the Top 1 retrieved chunk (HTML tables converted to Markdown).
+        source_link: Direct reference to source: [Document Name] | [Chunk ID].
+        source_url: Clickable RAGFlow preview URL to jump directly to the chunk's PDF page.
+        metadata: Typed chunk metadata (page_num, relevance_score, chunk_id) for audit purposes.
+    """
+    value: Optional[str] = None
+    analysis: str = "No analysis available"
+    evidence_md: str = "No evidence available"
+    source_link: str = "No source link available"
+    source_url: str = "No source URL available"
+    metadata: MetricMeta = field(default_factory=MetricMeta)
+
+class FAReport(FastJSONMixin, BaseModel):
     """
     Protocol for Research Analyst (RA) - Financial Auditor Module.
 
@@ -67,6 +188,8 @@ class FAReport(BaseModel):
     numeric signals. All analysis is descriptive with full source traceability.
     RA acts as a "Financial Auditor" providing expert evidence, not investment signals.
     """
+    model_config = _REPORT_CONFIG
+
     ticker: str
 
     # Core Financial Performance Metrics (Evidence-Based)
@@ -91,15 +214,90 @@ class FAReport(BaseModel):
         description="Qualitative audit of management guidance, forward outlook, and strategic commentary. Must identify tone (optimistic/cautious/mixed) with specific evidence from earnings calls or filings."
     )
 
-    key_risks_evidence: List[str] = Field(
-        default_factory=list,
+    key_risks_evidence: InternedStrTuple = Field(
+        default=(),
         description="Top 3-5 risk factors extracted from filings/earnings with specific evidence. Each risk should include: (1) Risk description, (2) Potential impact, (3) Source reference."
     )
 
     # Note: source_citations removed - source integrity now handled within each FinancialMetric
     # via evidence_md, source_link, source_url, and metadata fields
 
-class TAReport(BaseModel):
+    def to_columns(self) -> Dict[str, Any]:
+        """
+        Export the metadata of all three metrics as column arrays for bulk audit filtering.
+
+        Missing page numbers are -1 and missing relevance scores are NaN, so
+        filters like columns["relevance_score"] > 0.7 work without None checks.
+
+        Returns:
+            Dict of NumPy arrays: metric (names), page_num (int32),
+            relevance_score (float32) and chunk_id (object)
+        """
+        import numpy as np
+
+        names = ("revenue_performance", "profitability_audit", "cash_flow_stability")
+        metas = [getattr(self, name).metadata for name in names]
+        return {
+            "metric": np.array(names),
+            "page_num": np.array(
+                [-1 if m.page_num is None else m.page_num for m in metas], dtype=np.int32
+            ),
+            "relevance_score": np.array(
+                [np.nan if m.relevance_score is None else m.relevance_score for m in metas], dtype=np.float32
+            ),
+            "chunk_id": np.array([m.chunk_id for m in metas], dtype=object),
+        }
+
+@dataclass(slots=True)
+class PivotZones:
+    """
+    Support/resistance levels for a TAReport, all taken from API-derived indicators.
+
+    Levels the LLM (or fallback) did not provide stay None.
+
+    Attributes:
+        ma200_level: 200-day moving average.
+        ma50_level: 50-day moving average.
+        ma20_level: 20-day moving average.
+        bb_middle: Middle Bollinger Band.
+        local_support: Nearby support level.
+        local_resistance: Nearby resistance level.
+    """
+    ma200_level: Optional[float] = None
+    ma50_level: Optional[float] = None
+    ma20_level: Optional[float] = None
+    bb_middle: Optional[float] = None
+    local_support: Optional[float] = None
+    local_resistance: Optional[float] = None
+
+    @classmethod
+    def from_raw(cls, raw: Any) -> "PivotZones":
+        """
+        Build PivotZones from an untrusted (LLM-produced) level dict.
+
+        Unknown keys are dropped and values that are not numbers become None.
+
+        Args:
+            raw: Dict of zone name -> level (anything else yields empty PivotZones)
+
+        Returns:
+            The coerced PivotZones
+        """
+        if not isinstance(raw, dict):
+            return cls()
+        levels = {}
+        for name in cls.__slots__:
+            try:
+                levels[name] = float(raw[name]) if raw.get(name) is not None else None
+            except (TypeError, ValueError, OverflowError):
+                levels[name] = None
+        return cls(**levels)
+
+    def items(self) -> List[Tuple[str, float]]:
+        """(zone name, level) pairs for the levels that are set, in field order."""
+        return [(name, level) for name in self.__slots__ if (level := getattr(self, name)) is not None]
+
+class TAReport(FastJSONMixin, BaseModel):
     """
     Protocol for Technical Analyst (TA) - Pure Evidence-Based Module.
 
@@ -107,6 +305,8 @@ class TAReport(BaseModel):
     numeric signals. All numbers are API-derived; all analysis is descriptive.
     TA provides structural evidence about trend alignment across multiple timeframes.
     """
+    model_config = _REPORT_CONFIG
+
     ticker: str
 
     # Core technical metrics - API-derived only
@@ -135,12 +335,12 @@ class TAReport(BaseModel):
         description="Explicit categorization as 'Dead Cat Bounce Risk' or 'Value Entry Opportunity' with multi-period trend reasoning"
     )
 
-    pivot_zones: Dict[str, float] = Field(
-        default_factory=dict,
-        description="Critical support/resistance levels from API data (e.g., {'ma200_level': 149.0, 'ma50_level': 135.0, 'local_support': 125.0})"
+    pivot_zones: PivotZones = Field(
+        default_factory=PivotZones,
+        description="Critical support/resistance levels from API data (e.g., ma200_level=149.0, ma50_level=135.0, local_support=125.0)"
     )
 
-class SAReport(BaseModel):
+class SAReport(FastJSONMixin, BaseModel):
     """
     Protocol for Sentiment Analyst (SA) - Pure Descriptive Evidence Module (Basic Mode).
 
@@ -148,11 +348,13 @@ class SAReport(BaseModel):
     sentiment scores. All analysis is descriptive and anchored in news search results.
     SA provides deep causal chain analysis and structural evidence about market expectations.
     """
+    model_config = _REPORT_CONFIG
+
     ticker: str
 
     # Core descriptive fields
-    impactful_events: List[MarketEvent] = Field(default_factory=list, description="List of detected major market events")
-    top_keywords: List[str] = Field(default_factory=list, description="Key terms extracted from news search")
+    impactful_events: MarketEventList = Field(default_factory=list, description="List of detected major market events")
+    top_keywords: InternedStrTuple = Field(default=(), description="Key terms extracted from news search")
     news_summary: str = Field(default="No news summary available", description="Narrative summary of news landscape")
 
     # Pure Qualitative Evidence - NO numeric scores
@@ -183,12 +385,14 @@ class SAReport(BaseModel):
 
 # --- 3. Final Strategy & Decision ---
 
-class StrategyDecision(BaseModel):
+class StrategyDecision(FastJSONMixin, BaseModel):
     """Protocol for Alpha Strategist (AS) final output."""
+    model_config = _REPORT_CONFIG
+
     ticker: str
     final_action: SignalIntensity
     confidence_score: float = Field(ge=0, le=100)
-    logic_chain: List[str] = Field(description="Step-by-step reasoning for the decision")
+    logic_chain: InternedStrTuple = Field(description="Step-by-step reasoning for the decision")
     risk_notes: str = Field(description="Risk management constraints for RiskMgr")
     suggested_module: str = Field(description="The name of the execution module from Scheme A")
     decision_summary: str = Field(default="No summary provided", description="High-level 2-3 sentence summary of decision rationale")
@@ -196,18 +400,35 @@ class StrategyDecision(BaseModel):
 
 # --- 4. Shared Global State ---
 
-class TradingState(BaseModel):
-    """Global context maintained in the Environment."""
+@dataclass(slots=True)
+class TradingState:
+    """
+    Global context maintained in the Environment.
+
+    A plain slotted dataclass: the reports it holds are validated when they are
+    built, so assigning them here needs no pydantic validate-on-assignment pass.
+    """
     current_ticker: str
     fa_data: Optional[FAReport] = None
     ta_data: Optional[TAReport] = None
     sa_data: Optional[SAReport] = None
     final_decision: Optional[StrategyDecision] = None
 
+    # Rendered prompt context (see BaseInvestmentAgent.get_trading_state_context),
+    # cleared whenever any report field is reassigned
+    _context_cache: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name != "_context_cache":
+            object.__setattr__(self, "_context_cache", None)
+
 # --- Updated Schemas for Scheme C (Dynamic Inquiry) ---
 
 class InvestigationRequest(BaseModel):
     """Protocol for AS to request a deep dive investigation."""
+    model_config = _REPORT_CONFIG
+
     ticker: str
     target_agent: str = "SA"
     context_issue: str = Field(description="The specific conflicting issue to investigate")
@@ -215,7 +436,7 @@ class InvestigationRequest(BaseModel):
     max_retries: int = Field(default=1, description="Max retries allowed based on importance")
     importance_level: int = Field(default=1, description="1 for Normal, 2 for High Importance")
 
-class InvestigationReport(BaseModel):
+class InvestigationReport(FastJSONMixin, BaseModel):
     """
     Protocol for SA to provide deep dive results (Advanced Mode) - Pure Descriptive Evidence.
 
@@ -223,6 +444,8 @@ class InvestigationReport(BaseModel):
     All sentiment assessment is qualitative. Focuses on explicit risk classification and
     evidence gap identification for strategic decision-making.
     """
+    model_config = _REPORT_CONFIG
+
     ticker: str
 
     # Core investigation fields - Pure descriptive
@@ -241,14 +464,14 @@ class InvestigationReport(BaseModel):
         description="Categorical classification: 'FUNDAMENTAL_THREAT', 'MANAGEABLE_NOISE', or 'INSUFFICIENT_DATA' based on structural impact analysis"
     )
 
-    evidence_gaps: List[str] = Field(
-        default_factory=list,
+    evidence_gaps: InternedStrTuple = Field(
+        default=(),
         description="Explicitly list unresolved ambiguities or missing data points that prevent full conflict resolution (e.g., ['Lack of specific revenue impact figures', 'No clarity on management mitigation timeline'])"
     )
 
     # Additional investigation metadata
-    key_evidence: List[str] = Field(
-        default_factory=list,
+    key_evidence: InternedStrTuple = Field(
+        default=(),
         description="Key evidence points that support the investigation findings"
     )
 
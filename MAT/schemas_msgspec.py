@@ -0,0 +1,224 @@
+"""
+Filename: MetaGPT-Ewan/MAT/schemas_msgspec.py
+Created Date: Friday, October 16th 2026
+Author: Ewan Su
+Description: msgspec transport mirrors of report schemas for fast pub-sub de/serialization.
+
+The pydantic models in schemas.py remain the public API and the validation
+boundary for LLM output. The Structs here only describe the JSON that agents
+exchange through message.content, so a consumer can decode and type-check a
+report in one msgspec pass and then build the pydantic model without
+re-validating it. The Structs are frozen and gc=False: they are short-lived,
+hold no reference cycles and are never mutated.
+
+msgspec is optional; without it every decode_*() function falls back to
+pydantic's model_validate_json().
+"""
+
+from typing import Dict, List, Optional, Tuple, Type, TypeVar, Union
+
+from pydantic import BaseModel
+
+from .schemas import (
+    FAReport, FinancialMetric, MetricMeta, TAReport, PivotZones, SAReport, InvestigationReport,
+    MarketEvent, intern_strings
+)
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+ReportT = TypeVar("ReportT", bound=BaseModel)
+
+
+if msgspec is not None:
+
+    class MetricMetaMsg(msgspec.Struct, frozen=True, gc=False):
+        """Transport mirror of MetricMeta."""
+        page_num: Optional[int] = None
+        relevance_score: Optional[float] = None
+        chunk_id: Optional[str] = None
+
+    class FinancialMetricMsg(msgspec.Struct, frozen=True, gc=False):
+        """Transport mirror of FinancialMetric."""
+        value: Optional[str] = None
+        analysis: str = "No analysis available"
+        evidence_md: str = "No evidence available"
+        source_link: str = "No source link available"
+        source_url: str = "No source URL available"
+        metadata: MetricMetaMsg = msgspec.field(default_factory=MetricMetaMsg)
+
+    class FAReportMsg(msgspec.Struct, frozen=True, gc=False):
+        """Transport mirror of FAReport."""
+        ticker: str
+        revenue_performance: FinancialMetricMsg = msgspec.field(default_factory=FinancialMetricMsg)
+        profitability_audit: FinancialMetricMsg = msgspec.field(default_factory=FinancialMetricMsg)
+        cash_flow_stability: FinancialMetricMsg = msgspec.field(default_factory=FinancialMetricMsg)
+        management_guidance_audit: str = "No guidance analysis available"
+        key_risks_evidence: Tuple[str, ...] = ()
+
+    class PivotZonesMsg(msgspec.Struct, frozen=True, gc=False):
+        """Transport mirror of PivotZones."""
+        ma200_level: Optional[float] = None
+        ma50_level: Optional[float] = None
+        ma20_level: Optional[float] = None
+        bb_middle: Optional[float] = None
+        local_support: Optional[float] = None
+        local_resistance: Optional[float] = None
+
+    class TAReportMsg(msgspec.Struct, frozen=True, gc=False):
+        """Transport mirror of TAReport."""
+        ticker: str
+        rsi_14: Optional[float] = 50.0
+        bb_lower_touch: bool = False
+        volatility_atr: Optional[float] = 0.0
+        price_to_ma20_dist: Optional[float] = 0.0
+        price_to_ma50_dist: Optional[float] = 0.0
+        price_to_ma200_dist: Optional[float] = 0.0
+        market_regime: str = "Neutral Consolidation"
+        indicator_tension_analysis: str = "No tension analysis available"
+        dead_cat_vs_value: str = "Insufficient data for categorization"
+        pivot_zones: PivotZonesMsg = msgspec.field(default_factory=PivotZonesMsg)
+
+    class SAReportMsg(msgspec.Struct, frozen=True, gc=False):
+        """Transport mirror of SAReport."""
+        ticker: str
+        impactful_events: List[MarketEvent] = []
+        top_keywords: Tuple[str, ...] = ()
+        news_summary: str = "No news summary available"
+        qualitative_sentiment_assessment: str = "No sentiment assessment available"
+        sentiment_matrix: Dict[str, str] = {}
+        causal_narrative: str = "No causal analysis available"
+        expectation_gap: str = "No expectation analysis available"
+        paradoxes_or_tensions: str = "None identified"
+
+    class InvestigationReportMsg(msgspec.Struct, frozen=True, gc=False):
+        """Transport mirror of InvestigationReport."""
+        ticker: str
+        detailed_findings: str
+        is_ambiguity_resolved: bool
+        qualitative_sentiment_revision: str = "No sentiment revision available"
+        risk_classification: str = "MANAGEABLE_NOISE"
+        evidence_gaps: Tuple[str, ...] = ()
+        key_evidence: Tuple[str, ...] = ()
+        confidence_level: str = "MEDIUM"
+
+    _FA_DECODER = msgspec.json.Decoder(FAReportMsg)
+    _TA_DECODER = msgspec.json.Decoder(TAReportMsg)
+    _SA_DECODER = msgspec.json.Decoder(SAReportMsg)
+    _INVESTIGATION_DECODER = msgspec.json.Decoder(InvestigationReportMsg)
+
+    def _to_metric(msg: "FinancialMetricMsg") -> FinancialMetric:
+        fields = msgspec.structs.asdict(msg)
+        fields["metadata"] = MetricMeta(**msgspec.structs.asdict(msg.metadata))
+        return FinancialMetric(**fields)
+
+else:
+    _SA_DECODER = _INVESTIGATION_DECODER = None
+
+
+def _decode_flat(
+    content: Union[str, bytes],
+    decoder,
+    model: Type[ReportT],
+    interned: Tuple[str, ...] = ()
+) -> ReportT:
+    """
+    Decode a report whose fields need no conversion beyond interning string tuples.
+
+    Args:
+        content: JSON message content
+        decoder: msgspec Decoder for the report's Struct mirror (None without msgspec)
+        model: The pydantic report class to build
+        interned: Names of InternedStrTuple fields
+
+    Returns:
+        The decoded report
+    """
+    if decoder is None:
+        return model.model_validate_json(content)
+
+    fields = msgspec.structs.asdict(decoder.decode(content))
+    for name in interned:
+        fields[name] = intern_strings(fields[name])
+    return model.model_construct(**fields)
+
+
+def decode_fa_report(content: Union[str, bytes]) -> FAReport:
+    """
+    Decode a published FAReport message body into an FAReport.
+
+    With msgspec installed the JSON is decoded and type-checked against
+    FAReportMsg, then the pydantic model is assembled with model_construct
+    (already validated, so pydantic validation is skipped). Otherwise this is
+    FAReport.model_validate_json().
+
+    Args:
+        content: JSON message content produced by publish_message()
+
+    Returns:
+        The decoded FAReport
+
+    Raises:
+        msgspec.ValidationError / pydantic.ValidationError: If the content does not match the schema
+    """
+    if msgspec is None:
+        return FAReport.model_validate_json(content)
+
+    msg = _FA_DECODER.decode(content)
+    return FAReport.model_construct(
+        ticker=msg.ticker,
+        revenue_performance=_to_metric(msg.revenue_performance),
+        profitability_audit=_to_metric(msg.profitability_audit),
+        cash_flow_stability=_to_metric(msg.cash_flow_stability),
+        management_guidance_audit=msg.management_guidance_audit,
+        key_risks_evidence=intern_strings(msg.key_risks_evidence),
+    )
+
+
+def decode_ta_report(content: Union[str, bytes]) -> TAReport:
+    """
+    Decode a published TAReport message body (see decode_fa_report()).
+
+    Args:
+        content: JSON message content produced by publish_message()
+
+    Returns:
+        The decoded TAReport
+    """
+    if msgspec is None:
+        return TAReport.model_validate_json(content)
+
+    msg = _TA_DECODER.decode(content)
+    fields = msgspec.structs.asdict(msg)
+    fields["pivot_zones"] = PivotZones(**msgspec.structs.asdict(msg.pivot_zones))
+    return TAReport.model_construct(**fields)
+
+
+def decode_sa_report(content: Union[str, bytes]) -> SAReport:
+    """
+    Decode a published SAReport message body (see decode_fa_report()).
+
+    Args:
+        content: JSON message content produced by publish_message()
+
+    Returns:
+        The decoded SAReport
+    """
+    return _decode_flat(content, _SA_DECODER, SAReport, ("top_keywords",))
+
+
+def decode_investigation_report(content: Union[str, bytes]) -> InvestigationReport:
+    """
+    Decode a published InvestigationReport message body (see decode_fa_report()).
+
+    Args:
+        content: JSON message content produced by publish_message()
+
+    Returns:
+        The decoded InvestigationReport
+    """
+    return _decode_flat(
+        content, _INVESTIGATION_DECODER, InvestigationReport, ("evidence_gaps", "key_evidence")
+    )
@@ -6,6 +6,27 @@ import asyncio
 import aiohttp
 import time
 from MAT.config_loader import get_config
+from MAT.tests.verify_common import install_uvloop
+
+try:
+    import pytest
+except ImportError:
+    pytest = None
+
+
+def _ragflow_configured() -> bool:
+    """Whether an endpoint and API key are set for the RAGFlow probe."""
+    ragflow_config = get_config().get_ragflow_config()
+    return bool(ragflow_config.get('endpoint') and ragflow_config.get('api_key'))
+
+
+if pytest is not None:
+    # Under pytest, skip at collection time instead of probing (and waiting out
+    # the 10s timeout) when RAGFlow is not configured
+    pytestmark = [
+        pytest.mark.asyncio,
+        pytest.mark.skipif(not _ragflow_configured(), reason="RAGFlow not configured")
+    ]
 
 async def test_network():
     config = get_config()
@@ -63,5 +84,10 @@ async def test_network():
         elapsed = time.time() - start
         print(f"❌ Error after {elapsed:.2f} seconds: {e}")
 
+async def main():
+    await test_network()
+
 if __name__ == "__main__":
-    asyncio.run(test_network())
+    install_uvloop()
+
+    asyncio.run(main())
@@ -25,10 +25,16 @@ CRITICAL REQUIREMENTS:
 """
 
 import asyncio
-import json
 import argparse
+import sys
 from pathlib import Path
-from datetime import datetime
+from typing import Optional
+
+try:
+    # Optional: kernel async file I/O (Linux AIO via caio) instead of a thread-pool hop
+    from aiofile import async_open
+except ImportError:
+    async_open = None
 
 # Import Actions
 from MAT.actions.synthesize_strategy import AnalyzeConflict, SynthesizeDecision
@@ -81,10 +87,47 @@ def discover_reports(ticker: str, fiscal_year: int) -> dict:
     return reports
 
 
-def load_reports(report_paths: dict) -> dict:
+async def _load_report(path: Optional[Path], model: type):
+    """
+    Read and validate one report file without blocking the event loop.
+
+    Args:
+        path: Report file path (None for an optional report that was not found)
+        model: Pydantic report class to validate against
+
+    Returns:
+        The validated report, or None if path is None
+    """
+    if path is None:
+        return None
+    return model.model_validate_json(await _read_bytes(path))
+
+
+async def _read_bytes(path: Path) -> bytes:
+    """
+    Read a file's bytes without blocking the event loop.
+
+    Uses aiofile's native async file API when it is installed, otherwise
+    Path.read_bytes() in a worker thread.
+
+    Args:
+        path: File to read
+
+    Returns:
+        The file contents
+    """
+    if async_open is None:
+        return await asyncio.to_thread(path.read_bytes)
+    async with async_open(path, "rb") as f:
+        return await f.read()
+
+
+async def load_reports(report_paths: dict) -> dict:
     """
     Load JSON reports into Pydantic models.
 
+    The four files are independent, so they are read concurrently.
+
     Args:
         report_paths: Dictionary with file paths from discover_reports()
 
@@ -101,44 +144,21 @@ def load_reports(report_paths: dict) -> dict:
     print(f"LOADING REPORTS INTO PYDANTIC MODELS")
     print(f"{'='*100}\n")
 
-    # Load RA Report
-    with open(report_paths["ra_report"], 'r', encoding='utf-8') as f:
-        ra_data = json.load(f)
-        ra_report = FAReport(**ra_data)
-        print(f"✅ RA Report loaded: {ra_report.ticker}")
-
-    # Load TA Report
-    with open(report_paths["ta_report"], 'r', encoding='utf-8') as f:
-        ta_data = json.load(f)
-        ta_report = TAReport(**ta_data)
-        print(f"✅ TA Report loaded: {ta_report.ticker}")
-
-    # Load SA Basic Report
-    with open(report_paths["sa_basic_report"], 'r', encoding='utf-8') as f:
-        sa_data = json.load(f)
-
-        # Fix MarketEvent enum serialization issue (if present)
-        # SearchDeepDive may save "MarketEvent.EARNINGS_CALL" instead of "EARNINGS_CALL"
-        if "impactful_events" in sa_data:
-            fixed_events = []
-            for event in sa_data["impactful_events"]:
-                if isinstance(event, str) and event.startswith("MarketEvent."):
-                    # Extract enum value: "MarketEvent.EARNINGS_CALL" -> "EARNINGS_CALL"
-                    fixed_events.append(event.split(".")[-1])
-                else:
-                    fixed_events.append(event)
-            sa_data["impactful_events"] = fixed_events
-
-        sa_report = SAReport(**sa_data)
-        print(f"✅ SA Basic Report loaded: {sa_report.ticker}")
-
-    # Load SA Advanced Report (if exists)
-    sa_adv_report = None
-    if report_paths["sa_advanced_report"] and report_paths["sa_advanced_report"].exists():
-        with open(report_paths["sa_advanced_report"], 'r', encoding='utf-8') as f:
-            sa_adv_data = json.load(f)
-            sa_adv_report = InvestigationReport(**sa_adv_data)
-            print(f"✅ SA Advanced Report loaded: {sa_adv_report.ticker}")
+    # Each file is parsed and validated in one pydantic pass (no intermediate dict).
+    # "MarketEvent.EARNINGS_CALL" spellings saved by SearchDeepDive are
+    # normalized by SAReport.impactful_events' validator.
+    ra_report, ta_report, sa_report, sa_adv_report = await asyncio.gather(
+        _load_report(report_paths["ra_report"], FAReport),
+        _load_report(report_paths["ta_report"], TAReport),
+        _load_report(report_paths["sa_basic_report"], SAReport),
+        _load_report(report_paths["sa_advanced_report"], InvestigationReport)
+    )
+
+    print(f"✅ RA Report loaded: {ra_report.ticker}")
+    print(f"✅ TA Report loaded: {ta_report.ticker}")
+    print(f"✅ SA Basic Report loaded: {sa_report.ticker}")
+    if sa_adv_report is not None:
+        print(f"✅ SA Advanced Report loaded: {sa_adv_report.ticker}")
     else:
         print(f"⚠️  SA Advanced Report not available (will skip advanced mode)")
 
@@ -152,6 +172,16 @@ def load_reports(report_paths: dict) -> dict:
     }
 
 
+# sentiment_matrix dimensions shown in the evidence audit, in display order
+_SENTIMENT_DIMENSIONS = ("Product_Demand", "Macro_Environment", "Management_Confidence", "Competitive_Position")
+_NA = ("N/A",) * len(_SENTIMENT_DIMENSIONS)
+
+
+def _head(text: str, n: int) -> str:
+    """Return the first n characters of text (text itself when it is already short enough)."""
+    return text if len(text) <= n else text[:n]
+
+
 def print_evidence_audit(reports: dict, ticker: str, fiscal_year: int):
     """
     Print all extracted indicators for manual inspection BEFORE calling LLM.
@@ -164,9 +194,11 @@ def print_evidence_audit(reports: dict, ticker: str, fiscal_year: int):
         ticker: Stock ticker symbol
         fiscal_year: Fiscal year
     """
-    print(f"\n{'='*100}")
-    print(f"EVIDENCE AUDIT: EXTRACTED INDICATORS FOR {ticker} (FY{fiscal_year})")
-    print(f"{'='*100}\n")
+    # Collected and written once instead of one print() (and stdout flush) per line
+    lines = []
+    lines.append(f"\n{'='*100}")
+    lines.append(f"EVIDENCE AUDIT: EXTRACTED INDICATORS FOR {ticker} (FY{fiscal_year})")
+    lines.append(f"{'='*100}\n")
 
     ra = reports["ra"]
     ta = reports["ta"]
@@ -174,77 +206,79 @@ def print_evidence_audit(reports: dict, ticker: str, fiscal_year: int):
     sa_adv = reports.get("sa_adv")
 
     # TA Metrics
-    print(f"📊 TECHNICAL ANALYSIS (TA) METRICS:")
-    print(f"   - ta_market_regime: {ta.market_regime}")
-    print(f"   - ta_indicator_tension: {ta.indicator_tension_analysis}")
-    print(f"   - ta_dead_cat_vs_value: {ta.dead_cat_vs_value}")
-    print()
+    lines.append(f"📊 TECHNICAL ANALYSIS (TA) METRICS:")
+    lines.append(f"   - ta_market_regime: {ta.market_regime}")
+    lines.append(f"   - ta_indicator_tension: {ta.indicator_tension_analysis}")
+    lines.append(f"   - ta_dead_cat_vs_value: {ta.dead_cat_vs_value}")
+    lines.append("")
 
     # RA Metrics
-    print(f"💰 RESEARCH ANALYST (RA) METRICS:")
-    print(f"   - ra_revenue_value: {ra.revenue_performance.value}")
-    print(f"   - ra_revenue_analysis: {ra.revenue_performance.analysis[:100]}...")
-    print(f"   - ra_profit_value: {ra.profitability_audit.value}")
-    print(f"   - ra_profit_analysis: {ra.profitability_audit.analysis[:100]}...")
-    print(f"   - ra_cash_value: {ra.cash_flow_stability.value}")
-    print(f"   - ra_cash_analysis: {ra.cash_flow_stability.analysis[:100]}...")
-    print(f"   - ra_guidance: {ra.management_guidance_audit[:100]}...")
-    print(f"   - ra_risks: {len(ra.key_risks_evidence)} risks identified")
+    lines.append(f"💰 RESEARCH ANALYST (RA) METRICS:")
+    lines.append(f"   - ra_revenue_value: {ra.revenue_performance.value}")
+    lines.append(f"   - ra_revenue_analysis: {_head(ra.revenue_performance.analysis, 100)}...")
+    lines.append(f"   - ra_profit_value: {ra.profitability_audit.value}")
+    lines.append(f"   - ra_profit_analysis: {_head(ra.profitability_audit.analysis, 100)}...")
+    lines.append(f"   - ra_cash_value: {ra.cash_flow_stability.value}")
+    lines.append(f"   - ra_cash_analysis: {_head(ra.cash_flow_stability.analysis, 100)}...")
+    lines.append(f"   - ra_guidance: {_head(ra.management_guidance_audit, 100)}...")
+    lines.append(f"   - ra_risks: {len(ra.key_risks_evidence)} risks identified")
 
     # Display full ra_risks content (strip metadata after second "|")
     if ra.key_risks_evidence:
         for i, risk in enumerate(ra.key_risks_evidence, 1):
-            # Parse risk string and keep only first two parts (title | impact)
-            risk_parts = risk.split("|")
-            if len(risk_parts) >= 2:
-                risk_display = f"{risk_parts[0].strip()} | {risk_parts[1].strip()}"
-            else:
-                risk_display = risk
-            print(f"      {i}. {risk_display[:120]}..." if len(risk_display) > 120 else f"      {i}. {risk_display}")
-    print()
+            # Keep only the first two parts of the risk string (title | impact)
+            head, sep, rest = risk.partition("|")
+            mid = rest.partition("|")[0]
+            risk_display = f"{head.strip()} | {mid.strip()}" if sep else risk
+            lines.append(f"      {i}. {risk_display[:120]}..." if len(risk_display) > 120 else f"      {i}. {risk_display}")
+    lines.append("")
 
     # SA Metrics
-    print(f"📰 SENTIMENT ANALYST (SA) METRICS:")
-    print(f"   - sa_news_summary: {sa.news_summary[:100]}...")
-    print(f"   - sa_sentiment_assessment: {sa.qualitative_sentiment_assessment[:100]}...")
-    print(f"   - sa_product_demand: {sa.sentiment_matrix.get('Product_Demand', 'N/A')[:80]}...")
-    print(f"   - sa_macro_env: {sa.sentiment_matrix.get('Macro_Environment', 'N/A')[:80]}...")
-    print(f"   - sa_mgmt_conf: {sa.sentiment_matrix.get('Management_Confidence', 'N/A')[:80]}...")
-    print(f"   - sa_comp_pos: {sa.sentiment_matrix.get('Competitive_Position', 'N/A')[:80]}...")
-    print(f"   - sa_causal_narrative: {sa.causal_narrative[:100]}...")
-    print(f"   - sa_expectation_gap: {sa.expectation_gap[:100]}...")
-    print(f"   - sa_tensions: {sa.paradoxes_or_tensions[:100]}...")
-    print()
+    lines.append(f"📰 SENTIMENT ANALYST (SA) METRICS:")
+    lines.append(f"   - sa_news_summary: {_head(sa.news_summary, 100)}...")
+    lines.append(f"   - sa_sentiment_assessment: {_head(sa.qualitative_sentiment_assessment, 100)}...")
+    product_demand, macro_env, mgmt_conf, comp_pos = (
+        _head(str(value), 80) for value in map(sa.sentiment_matrix.get, _SENTIMENT_DIMENSIONS, _NA)
+    )
+    lines.append(f"   - sa_product_demand: {product_demand}...")
+    lines.append(f"   - sa_macro_env: {macro_env}...")
+    lines.append(f"   - sa_mgmt_conf: {mgmt_conf}...")
+    lines.append(f"   - sa_comp_pos: {comp_pos}...")
+    lines.append(f"   - sa_causal_narrative: {_head(sa.causal_narrative, 100)}...")
+    lines.append(f"   - sa_expectation_gap: {_head(sa.expectation_gap, 100)}...")
+    lines.append(f"   - sa_tensions: {_head(sa.paradoxes_or_tensions, 100)}...")
+    lines.append("")
 
     # SA-Advanced Metrics
     if sa_adv:
-        print(f"🔍 SENTIMENT ANALYST ADVANCED (SA-ADV) METRICS:")
-        print(f"   - sa_adv_findings: {sa_adv.detailed_findings[:100]}...")
-        print(f"   - sa_adv_resolved: {sa_adv.is_ambiguity_resolved}")
-        print(f"   - sa_adv_risk_class: {sa_adv.risk_classification}")
-        print(f"   - sa_adv_revision: {sa_adv.qualitative_sentiment_revision[:100]}...")
-        print(f"   - sa_adv_confidence: {sa_adv.confidence_level}")
-        print(f"   - sa_adv_gaps: {len(sa_adv.evidence_gaps)} evidence gaps")
+        lines.append(f"🔍 SENTIMENT ANALYST ADVANCED (SA-ADV) METRICS:")
+        lines.append(f"   - sa_adv_findings: {_head(sa_adv.detailed_findings, 100)}...")
+        lines.append(f"   - sa_adv_resolved: {sa_adv.is_ambiguity_resolved}")
+        lines.append(f"   - sa_adv_risk_class: {sa_adv.risk_classification}")
+        lines.append(f"   - sa_adv_revision: {_head(sa_adv.qualitative_sentiment_revision, 100)}...")
+        lines.append(f"   - sa_adv_confidence: {sa_adv.confidence_level}")
+        lines.append(f"   - sa_adv_gaps: {len(sa_adv.evidence_gaps)} evidence gaps")
 
         # Display full sa_adv_gaps content
         if sa_adv.evidence_gaps:
             for i, gap in enumerate(sa_adv.evidence_gaps, 1):
                 gap_display = gap[:120] + "..." if len(gap) > 120 else gap
-                print(f"      {i}. {gap_display}")
+                lines.append(f"      {i}. {gap_display}")
 
         # Display full sa_adv_evidence content
-        print(f"   - sa_adv_evidence: {len(sa_adv.key_evidence)} key evidence items")
+        lines.append(f"   - sa_adv_evidence: {len(sa_adv.key_evidence)} key evidence items")
         if sa_adv.key_evidence:
             for i, evidence in enumerate(sa_adv.key_evidence, 1):
                 evidence_display = evidence[:120] + "..." if len(evidence) > 120 else evidence
-                print(f"      {i}. {evidence_display}")
-        print()
+                lines.append(f"      {i}. {evidence_display}")
+        lines.append("")
     else:
-        print(f"🔍 SENTIMENT ANALYST ADVANCED (SA-ADV) METRICS:")
-        print(f"   - N/A - Advanced investigation not triggered")
-        print()
+        lines.append(f"🔍 SENTIMENT ANALYST ADVANCED (SA-ADV) METRICS:")
+        lines.append(f"   - N/A - Advanced investigation not triggered")
+        lines.append("")
 
-    print(f"{'='*100}\n")
+    lines.append(f"{'='*100}\n")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 async def run_as_workflow(ticker: str, fiscal_year: int):
@@ -281,7 +315,7 @@ async def run_as_workflow(ticker: str, fiscal_year: int):
         return
 
     # Step 2: Load reports into Pydantic models
-    reports = load_reports(report_paths)
+    reports = await load_reports(report_paths)
 
     # Step 3: Evidence Audit (BEFORE LLM calls)
     print_evidence_audit(reports, ticker, fiscal_year)
@@ -321,31 +355,32 @@ async def run_as_workflow(ticker: str, fiscal_year: int):
     print(f"STEP 2: DECISION SYNTHESIS")
     print(f"{'='*100}\n")
 
-    synthesize_decision = SynthesizeDecision()
-    strategy_decision = await synthesize_decision.run(
-        ticker=ticker,
-        ra=reports["ra"],
-        ta=reports["ta"],
-        sa=reports["sa"],
-        sa_adv=sa_adv_for_synthesis,
-        conflict_issue=context_issue if has_conflict else None
-    )
+    # The context manager flushes the decision log before the workflow returns
+    async with SynthesizeDecision() as synthesize_decision:
+        strategy_decision = await synthesize_decision.run(
+            ticker=ticker,
+            ra=reports["ra"],
+            ta=reports["ta"],
+            sa=reports["sa"],
+            sa_adv=sa_adv_for_synthesis,
+            conflict_issue=context_issue if has_conflict else None
+        )
 
     # Step 7: Print final JSON decision
     print(f"\n{'='*100}")
     print(f"FINAL STRATEGY DECISION")
     print(f"{'='*100}\n")
 
-    decision_json = strategy_decision.model_dump_json(indent=2)
-    print(decision_json)
+    # Serialized once to bytes (orjson when available) for both the file and the console
+    decision_json = strategy_decision.to_json(indent=True)
+    print(decision_json.decode())
 
     # Save decision to file
     output_dir = Path("MAT/report/AS")
     output_dir.mkdir(parents=True, exist_ok=True)
     output_file = output_dir / f"AS_decision_{ticker}_{fiscal_year}.json"
 
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(decision_json)
+    output_file.write_bytes(decision_json)
 
     print(f"\n📁 Decision saved to: {output_file}")
     print(f"\n{'='*100}")
@@ -0,0 +1,128 @@
+"""
+Filename: MetaGPT-Ewan/MAT/tests/verify_common.py
+Created Date: Friday, October 16th 2026
+Author: Ewan Su
+Description: Helpers shared by the native verification scripts (verify_*_native.py)
+and the other script-style tests: console banners, the causal-connector scan,
+results serialization, buffered console output and the optional uvloop bootstrap.
+"""
+
+import asyncio
+import io
+import json
+import re
+import sys
+from pathlib import Path
+
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# BECAUSE-THEN causal connectors, matched case-insensitively in one scan per text
+CAUSAL_KEYWORDS = ("because", "due to", "which then", "led to", "driven by", "caused by", "resulted in")
+CAUSAL_RE = re.compile("|".join(map(re.escape, CAUSAL_KEYWORDS)), re.IGNORECASE)
+
+# Console banners
+BANNER = "=" * 100
+HBANNER = "#" * 100
+
+
+def json_default(obj):
+    """
+    JSON fallback for values the encoder cannot serialize natively.
+
+    Report models are serialized by pydantic-core in a single pass; with
+    orjson the bytes are embedded as a pre-serialized fragment.
+
+    Args:
+        obj: Unsupported value
+
+    Returns:
+        A JSON-serializable stand-in for obj
+    """
+    if isinstance(obj, BaseModel):
+        if orjson is not None and hasattr(orjson, "Fragment"):
+            return orjson.Fragment(obj.model_dump_json())
+        return obj.model_dump(mode="json")
+    return str(obj)
+
+
+def dump_json(obj, indent: bool = True) -> bytes:
+    """
+    Serialize results to UTF-8 JSON (orjson when installed, else stdlib json).
+
+    Args:
+        obj: JSON-compatible data (report models are embedded, other unsupported values become str())
+        indent: Pretty-print with 2-space indentation; False gives a single line for JSON-Lines
+
+    Returns:
+        JSON bytes
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option, default=json_default)
+    return json.dumps(
+        obj, indent=2 if indent else None, ensure_ascii=False, default=json_default
+    ).encode('utf-8')
+
+
+def load_jsonl(path: Path) -> list:
+    """
+    Read back result records streamed to a JSON-Lines file.
+
+    Args:
+        path: JSON-Lines file written with dump_json(record, indent=False)
+
+    Returns:
+        One parsed record per non-empty line
+    """
+    loads = orjson.loads if orjson is not None else json.loads
+    with path.open("rb") as f:
+        return [loads(line) for line in f if line.strip()]
+
+
+def write_console(buf: io.StringIO) -> None:
+    """
+    Flush a test's buffered console report with a single write.
+
+    Concurrent test cases each fill their own buffer, so one write per test
+    keeps their reports from interleaving on stdout.
+
+    Args:
+        buf: Buffer filled through a print(..., file=buf) helper
+    """
+    sys.stdout.write(buf.getvalue())
+    sys.stdout.flush()
+
+
+def schema_check_line(report, expected_model: type, label: str = "") -> str:
+    """
+    Console line for the Pydantic schema check of an Action's report.
+
+    Actions return already-validated models, so an isinstance check is all
+    that is left to verify.
+
+    Args:
+        report: Object returned by the Action's run()
+        expected_model: Pydantic model the Action should return
+        label: Optional suffix such as " (Advanced Mode)"
+
+    Returns:
+        PASSED/FAILED line to print
+    """
+    if isinstance(report, expected_model):
+        return f"✅ Pydantic validation PASSED{label}"
+    return f"❌ Pydantic validation FAILED{label}: expected {expected_model.__name__}, got {type(report).__name__}"
+
+
+def install_uvloop() -> None:
+    """Use uvloop's event loop when it is installed (it speeds up the aiohttp/LLM awaits)."""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
@@ -26,14 +26,16 @@ Success Criteria:
 """
 
 import asyncio
-import json
 import argparse
+import traceback
 from pathlib import Path
 from datetime import datetime
 
 # Import the Action directly
 from MAT.actions.retrieve_rag_data import RetrieveRAGData
 from MAT.schemas import FAReport, FinancialMetric
+from MAT.config_loader import get_config
+from MAT.tests.verify_common import BANNER, CAUSAL_RE, dump_json, schema_check_line
 
 
 # ============================================================
@@ -65,10 +67,10 @@ async def run_native_ra_test(ticker: str, fiscal_year: int, description: str):
         fiscal_year: Fiscal year for analysis
         description: Test description
     """
-    print(f"\n{'='*100}")
+    print(f"\n{BANNER}")
     print(f"NATIVE RA TEST: {ticker} (FY{fiscal_year})")
     print(f"Description: {description}")
-    print(f"{'='*100}\n")
+    print(f"{BANNER}\n")
 
     # Step 1: Instantiate Action (ZERO external prompts)
     ra_action = RetrieveRAGData()
@@ -80,9 +82,9 @@ async def run_native_ra_test(ticker: str, fiscal_year: int, description: str):
     )
 
     # Step 3: Print expert evidence results
-    print(f"\n{'='*100}")
+    print(f"\n{BANNER}")
     print(f"NATIVE RA FINANCIAL AUDIT FOR {ticker} (FY{fiscal_year})")
-    print(f"{'='*100}")
+    print(f"{BANNER}")
 
     print(f"\n💰 REVENUE PERFORMANCE:")
     print(f"  Value: {fa_report.revenue_performance.value}")
@@ -111,18 +113,12 @@ async def run_native_ra_test(ticker: str, fiscal_year: int, description: str):
     print(f"  Profitability Source URL: {fa_report.profitability_audit.source_url[:80]}..." if len(fa_report.profitability_audit.source_url) > 80 else f"  Profitability Source URL: {fa_report.profitability_audit.source_url}")
     print(f"  Cash Flow Source URL: {fa_report.cash_flow_stability.source_url[:80]}..." if len(fa_report.cash_flow_stability.source_url) > 80 else f"  Cash Flow Source URL: {fa_report.cash_flow_stability.source_url}")
 
-    print(f"{'='*100}\n")
+    print(f"{BANNER}\n")
 
     # Step 4: Validate Pydantic schema
-    try:
-        fa_report.model_validate(fa_report)
-        print("✅ Pydantic validation PASSED")
-    except Exception as e:
-        print(f"❌ Pydantic validation FAILED: {e}")
+    print(schema_check_line(fa_report, FAReport))
 
     # Step 5: Check for BECAUSE-THEN causal logic
-    causal_keywords = ["because", "due to", "which then", "led to", "driven by", "caused by", "resulted in"]
-
     fields_to_check = [
         ("Revenue Analysis", fa_report.revenue_performance.analysis),
         ("Profitability Analysis", fa_report.profitability_audit.analysis),
@@ -132,9 +128,8 @@ async def run_native_ra_test(ticker: str, fiscal_year: int, description: str):
 
     print(f"\n🔍 Causal Logic Check:")
     for field_name, field_text in fields_to_check:
-        has_causal = any(keyword in field_text.lower() for keyword in causal_keywords)
-        if has_causal:
-            matched = [kw for kw in causal_keywords if kw in field_text.lower()]
+        if CAUSAL_RE.search(field_text):
+            matched = list(dict.fromkeys(m.group(0).lower() for m in CAUSAL_RE.finditer(field_text)))
             print(f"✅ {field_name}: Contains causal connectors {matched}")
         else:
             print(f"⚠️  {field_name}: Missing explicit causal connectors")
@@ -154,6 +149,57 @@ async def run_native_ra_test(ticker: str, fiscal_year: int, description: str):
     return fa_report
 
 
+async def run_test_case(test_case: dict, sem: asyncio.Semaphore) -> dict:
+    """
+    Run one RA test case and check its analyses for causal logic.
+
+    Args:
+        test_case: Entry with ticker, fiscal_year and description
+        sem: Semaphore bounding concurrent RA runs across all test cases
+
+    Returns:
+        Result record with status PASSED or FAILED
+    """
+    try:
+        async with sem:
+            fa_report = await run_native_ra_test(
+                ticker=test_case["ticker"],
+                fiscal_year=test_case["fiscal_year"],
+                description=test_case["description"]
+            )
+
+        # Check for causal logic in all analysis fields
+        analyses = [
+            fa_report.revenue_performance.analysis,
+            fa_report.profitability_audit.analysis,
+            fa_report.cash_flow_stability.analysis,
+            fa_report.management_guidance_audit
+        ]
+
+        has_causal_logic = any(CAUSAL_RE.search(analysis) for analysis in analyses)
+
+        return {
+            "test_case": test_case["description"],
+            "ticker": test_case["ticker"],
+            "fiscal_year": test_case["fiscal_year"],
+            "fa_report": fa_report,  # serialized once, when the results are written
+            "has_causal_logic": has_causal_logic,
+            "status": "PASSED"
+        }
+
+    except Exception as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        traceback.print_exc()
+
+        return {
+            "test_case": test_case["description"],
+            "ticker": test_case["ticker"],
+            "fiscal_year": test_case["fiscal_year"],
+            "error": str(e),
+            "status": "FAILED"
+        }
+
+
 async def main():
     """
     Main test runner with command-line argument support.
@@ -172,6 +218,9 @@ Examples:
 
   # Run all default test cases
   python MAT/tests/verify_ra_native.py
+
+  # Also print the full JSON reports at the end
+  python MAT/tests/verify_ra_native.py --print-full
         """
     )
     parser.add_argument(
@@ -184,6 +233,11 @@ Examples:
         type=int,
         help="Fiscal year for analysis (e.g., 2021, 2022)"
     )
+    parser.add_argument(
+        "--print-full", "--verbose",
+        action="store_true",
+        help="Also print every passed report as indented JSON at the end"
+    )
 
     args = parser.parse_args()
 
@@ -206,63 +260,20 @@ Examples:
         # Use default test cases
         test_cases = DEFAULT_TEST_CASES
 
-    print("\n" + "="*100)
+    print("\n" + BANNER)
     print("NATIVE RESEARCH ANALYST (FINANCIAL AUDITOR) VERIFICATION TEST")
-    print("="*100)
+    print(BANNER)
     print("\nObjective: Verify that RetrieveRAGData Action provides expert-level financial auditing.")
     print("Requirement: ALL intelligence must come from native Action code, NOT external prompts.")
     print("\nTest Cases:")
     for i, tc in enumerate(test_cases, 1):
         print(f"  {i}. {tc['ticker']} FY{tc['fiscal_year']}: {tc['description']}")
-    print("="*100)
+    print(BANNER)
 
-    results = []
-
-    # Run tests
-    for test_case in test_cases:
-        try:
-            fa_report = await run_native_ra_test(
-                ticker=test_case["ticker"],
-                fiscal_year=test_case["fiscal_year"],
-                description=test_case["description"]
-            )
-
-            # Check for causal logic in all analysis fields
-            causal_keywords = ["because", "due to", "which then", "led to", "driven by", "caused by", "resulted in"]
-
-            analyses = [
-                fa_report.revenue_performance.analysis,
-                fa_report.profitability_audit.analysis,
-                fa_report.cash_flow_stability.analysis,
-                fa_report.management_guidance_audit
-            ]
-
-            has_causal_logic = any(
-                any(keyword in analysis.lower() for keyword in causal_keywords)
-                for analysis in analyses
-            )
-
-            results.append({
-                "test_case": test_case["description"],
-                "ticker": test_case["ticker"],
-                "fiscal_year": test_case["fiscal_year"],
-                "fa_report": fa_report.model_dump(),
-                "has_causal_logic": has_causal_logic,
-                "status": "PASSED"
-            })
-
-        except Exception as e:
-            print(f"\n❌ TEST FAILED: {e}")
-            import traceback
-            traceback.print_exc()
-
-            results.append({
-                "test_case": test_case["description"],
-                "ticker": test_case["ticker"],
-                "fiscal_year": test_case["fiscal_year"],
-                "error": str(e),
-                "status": "FAILED"
-            })
+    # Test cases are independent RAG + LLM runs, so they run concurrently;
+    # results keep test_cases order. The semaphore stays under rate limits.
+    sem = asyncio.Semaphore(get_config().get_max_concurrency(default=4))
+    results = await asyncio.gather(*(run_test_case(test_case, sem) for test_case in test_cases))
 
     # Save results
     output_dir = Path("MAT/tests")
@@ -278,13 +289,13 @@ Examples:
         "results": results
     }
 
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(output_data, f, indent=2, ensure_ascii=False, default=str)
+    # Serialize and write in a worker thread to keep the event loop free
+    await asyncio.to_thread(lambda: output_file.write_bytes(dump_json(output_data)))
 
     # Verify dual-output files exist (created by RetrieveRAGData action)
-    print(f"\n{'='*100}")
+    print(f"\n{BANNER}")
     print(f"DUAL-OUTPUT FILE VERIFICATION")
-    print(f"{'='*100}")
+    print(f"{BANNER}")
 
     for result in results:
         if result["status"] == "PASSED":
@@ -305,14 +316,14 @@ Examples:
             else:
                 print(f"❌ FAReport file MISSING: {ra_report_file}")
 
-    print(f"\n{'='*100}")
+    print(f"\n{BANNER}")
     print(f"NATIVE RA VERIFICATION COMPLETE")
-    print(f"{'='*100}")
+    print(f"{BANNER}")
     print(f"Results saved to: {output_file}")
     print(f"Total tests: {len(results)}")
     print(f"Passed: {sum(1 for r in results if r['status'] == 'PASSED')}")
     print(f"Failed: {sum(1 for r in results if r['status'] == 'FAILED')}")
-    print(f"{'='*100}\n")
+    print(f"{BANNER}\n")
 
     # Print summary
     print("\n📊 SUMMARY:")
@@ -320,32 +331,33 @@ Examples:
         status_icon = "✅" if result["status"] == "PASSED" else "❌"
         print(f"\n{status_icon} {result['ticker']} FY{result['fiscal_year']}: {result['test_case']}")
         if result["status"] == "PASSED":
-            fa_data = result["fa_report"]
+            fa_report = result["fa_report"]
             causal_icon = "✅" if result["has_causal_logic"] else "⚠️"
 
             print(f"\n  💰 Revenue Performance:")
-            print(f"     Value: {fa_data['revenue_performance']['value']}")
+            print(f"     Value: {fa_report.revenue_performance.value}")
             print(f"     {causal_icon} Causal Logic: {'Present' if result['has_causal_logic'] else 'Missing'}")
 
             print(f"\n  📊 Profitability Audit:")
-            print(f"     Value: {fa_data['profitability_audit']['value']}")
+            print(f"     Value: {fa_report.profitability_audit.value}")
 
             print(f"\n  💵 Cash Flow Stability:")
-            print(f"     Value: {fa_data['cash_flow_stability']['value']}")
+            print(f"     Value: {fa_report.cash_flow_stability.value}")
 
-            print(f"\n  ⚠️  Key Risks: {len(fa_data['key_risks_evidence'])} identified")
+            print(f"\n  ⚠️  Key Risks: {len(fa_report.key_risks_evidence)} identified")
             # source_citations removed - traceability now in each FinancialMetric
         else:
             print(f"   Error: {result.get('error', 'Unknown error')}")
 
-    # Print full JSON reports
-    print("\n" + "="*100)
-    print("FULL JSON REPORTS")
-    print("="*100)
-    for i, result in enumerate(results, 1):
-        if result["status"] == "PASSED":
-            print(f"\n{i}. {result['ticker']} FY{result['fiscal_year']}:")
-            print(json.dumps(result["fa_report"], indent=2, default=str))
+    # Print full JSON reports (the results file on disk has the same content)
+    if args.print_full:
+        print("\n" + BANNER)
+        print("FULL JSON REPORTS")
+        print(BANNER)
+        for i, result in enumerate(results, 1):
+            if result["status"] == "PASSED":
+                print(f"\n{i}. {result['ticker']} FY{result['fiscal_year']}:")
+                print(result["fa_report"].model_dump_json(indent=2))
 
 
 if __name__ == "__main__":
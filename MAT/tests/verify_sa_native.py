@@ -21,14 +21,45 @@ Success Criteria:
 """
 
 import asyncio
-import json
+import io
+import os
 import argparse
+import traceback
+from functools import lru_cache, partial
 from pathlib import Path
 from datetime import datetime
+from typing import Literal, Optional, Tuple, Union
 
 # Import the Action directly
 from MAT.actions.search_deep_dive import SearchDeepDive
 from MAT.schemas import SAReport, MarketEvent, InvestigationReport, InvestigationRequest
+from MAT.config_loader import get_config
+from MAT.llm_batch import BatchLLMCallback
+from MAT.tests.verify_common import (
+    BANNER, CAUSAL_KEYWORDS, CAUSAL_RE, HBANNER, dump_json, install_uvloop, load_jsonl,
+    schema_check_line, write_console
+)
+
+
+# Where SearchDeepDive saves raw search results and structured reports
+SA_REPORT_DIR = Path("MAT/report/SA")
+
+
+def _list_report_dir(directory: Path) -> frozenset:
+    """
+    List the file names in a report directory with a single scandir.
+
+    Args:
+        directory: Directory the Action saves its reports to
+
+    Returns:
+        Names of the entries in directory (empty if it does not exist)
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return frozenset(entry.name for entry in entries)
+    except FileNotFoundError:
+        return frozenset()
 
 
 # ============================================================
@@ -60,112 +91,121 @@ TEST_CASES = [
 ]
 
 
-async def run_native_sa_test(ticker: str, date: str, description: str):
+@lru_cache(maxsize=None)
+def build_investigation_request(ticker: str, context_issue: str) -> InvestigationRequest:
     """
-    Run native SearchDeepDive test.
+    Build (once per ticker/issue) the InvestigationRequest AS would send for a test case.
 
-    CRITICAL: This function contains ZERO LLM prompts. All intelligence comes from
-    the SearchDeepDive Action's native prompt.
+    TEST_CASES can be replaced from the CLI after import, so the requests are
+    built and cached on first use rather than at module scope. The Action only
+    reads the request, so one validated instance is shared across runs.
 
     Args:
         ticker: Stock ticker
-        date: Analysis date "YYYY-MM-DD"
-        description: Test description
-    """
-    print(f"\n{'='*100}")
-    print(f"NATIVE SA TEST: {ticker} ({date})")
-    print(f"Description: {description}")
-    print(f"{'='*100}\n")
-
-    # Step 1: Instantiate Action (ZERO external prompts)
-    sa_action = SearchDeepDive()
+        context_issue: The conflict/issue to investigate
 
-    # Step 2: Call .run() - all intelligence is native
-    # Note: SearchDeepDive's run() method signature is: run(ticker=..., mode="basic", reference_date=...)
-    # For native test, we use basic mode with reference_date for year-specific search
-    sa_report: SAReport = await sa_action.run(
+    Returns:
+        A high-importance, single-retry InvestigationRequest targeting SA
+    """
+    return InvestigationRequest(
         ticker=ticker,
-        mode="basic",
-        reference_date=date
+        target_agent="SA",
+        context_issue=context_issue,
+        current_retry=0,
+        max_retries=1,
+        importance_level=2  # High importance for thorough investigation
     )
 
-    # Step 3: Print expert evidence results
-    print(f"\n{'='*100}")
-    print(f"NATIVE SA EXPERT EVIDENCE FOR {ticker} ({date})")
-    print(f"{'='*100}")
-    print(f"\n📊 SENTIMENT METADATA:")
-    print(f"  Ticker: {sa_report.ticker}")
-    print(f"  Impactful Events: {[event.value for event in sa_report.impactful_events]}")
-    print(f"  Top Keywords: {sa_report.top_keywords[:5]}")
-
-    print(f"\n🧠 PURE DESCRIPTIVE EVIDENCE:")
-    print(f"\n  Qualitative Sentiment Assessment:")
-    print(f"  {sa_report.qualitative_sentiment_assessment}")
-
-    print(f"\n  Sentiment Matrix (Qualitative Audits):")
-    for factor, audit in sa_report.sentiment_matrix.items():
-        print(f"    - {factor}:")
-        print(f"      {audit}")
 
-    print(f"\n  Causal Narrative (BECAUSE-THEN Logic):")
-    print(f"  {sa_report.causal_narrative}")
+def _echo_sa_report(echo, sa_report: SAReport, ticker: str, date: str) -> None:
+    """
+    Print the BASIC mode expert evidence of an SAReport.
 
-    print(f"\n  Expectation Gap Analysis:")
-    print(f"  {sa_report.expectation_gap}")
+    Args:
+        echo: print-like callable writing to the test's console buffer
+        sa_report: Report returned by SearchDeepDive in basic mode
+        ticker: Stock ticker
+        date: Analysis date "YYYY-MM-DD"
+    """
+    echo(f"\n{BANNER}")
+    echo(f"NATIVE SA EXPERT EVIDENCE FOR {ticker} ({date})")
+    echo(f"{BANNER}")
+    echo(f"\n📊 SENTIMENT METADATA:")
+    echo(f"  Ticker: {sa_report.ticker}")
+    echo(f"  Impactful Events: {[event.value for event in sa_report.impactful_events]}")
+    echo(f"  Top Keywords: {sa_report.top_keywords[:5]}")
+
+    echo(f"\n🧠 PURE DESCRIPTIVE EVIDENCE:")
+    echo(f"\n  Qualitative Sentiment Assessment:")
+    echo(f"  {sa_report.qualitative_sentiment_assessment}")
+
+    echo(f"\n  Sentiment Matrix (Qualitative Audits):")
+    for factor, audit in sa_report.sentiment_matrix.items():
+        echo(f"    - {factor}:")
+        echo(f"      {audit}")
 
-    print(f"\n  Paradoxes/Tensions:")
-    print(f"  {sa_report.paradoxes_or_tensions}")
+    echo(f"\n  Causal Narrative (BECAUSE-THEN Logic):")
+    echo(f"  {sa_report.causal_narrative}")
 
-    print(f"\n  News Summary (Full Narrative):")
-    print(f"  {sa_report.news_summary}")
-    print(f"{'='*100}\n")
+    echo(f"\n  Expectation Gap Analysis:")
+    echo(f"  {sa_report.expectation_gap}")
 
-    # Step 4: Validate Pydantic schema
-    try:
-        sa_report.model_validate(sa_report)
-        print("✅ Pydantic validation PASSED")
-    except Exception as e:
-        print(f"❌ Pydantic validation FAILED: {e}")
+    echo(f"\n  Paradoxes/Tensions:")
+    echo(f"  {sa_report.paradoxes_or_tensions}")
 
-    # Step 5: Check for causal keywords (BECAUSE, DUE TO, etc.)
-    causal_keywords = ["because", "due to", "which then", "led to", "driven by", "caused by", "resulted in"]
-    has_causal_logic = any(keyword in sa_report.news_summary.lower() for keyword in causal_keywords)
+    echo(f"\n  News Summary (Full Narrative):")
+    echo(f"  {sa_report.news_summary}")
+    echo(f"{BANNER}\n")
 
-    print(f"\n🔍 Causal Logic Check:")
-    if has_causal_logic:
-        print(f"✅ News summary contains causal connectors (BECAUSE-THEN logic)")
-        matched_keywords = [kw for kw in causal_keywords if kw in sa_report.news_summary.lower()]
-        print(f"   Found: {matched_keywords}")
-    else:
-        print(f"⚠️  News summary may be missing explicit causal connectors")
-        print(f"   Expected keywords: {causal_keywords}")
 
-    # Step 6: Verify DUAL-SAVING PROTOCOL file existence
-    print(f"\n📁 DUAL-SAVING PROTOCOL Verification:")
-
-    # Extract year from date
-    year = datetime.strptime(date, "%Y-%m-%d").year
+def _echo_investigation_report(echo, investigation_report: InvestigationReport, ticker: str, date: str) -> None:
+    """
+    Print the ADVANCED mode findings of an InvestigationReport.
 
-    # Check for RAW search results
-    raw_search_file = Path(f"MAT/report/SA/Raw_Search_{ticker}_{year}.json")
-    if raw_search_file.exists():
-        print(f"✅ Raw search results file exists: {raw_search_file}")
-    else:
-        print(f"❌ Raw search results file NOT FOUND: {raw_search_file}")
+    Args:
+        echo: print-like callable writing to the test's console buffer
+        investigation_report: Report returned by SearchDeepDive in advanced mode
+        ticker: Stock ticker
+        date: Analysis date "YYYY-MM-DD"
+    """
+    echo(f"\n{BANNER}")
+    echo(f"NATIVE SA ADVANCED MODE INVESTIGATION REPORT FOR {ticker} ({date})")
+    echo(f"{BANNER}")
+    echo(f"\n📊 INVESTIGATION METADATA:")
+    echo(f"  Ticker: {investigation_report.ticker}")
+    echo(f"  Risk Classification: {investigation_report.risk_classification}")
+    echo(f"  Confidence Level: {investigation_report.confidence_level}")
+    echo(f"  Ambiguity Resolved: {investigation_report.is_ambiguity_resolved}")
+
+    echo(f"\n🧠 INVESTIGATION FINDINGS:")
+    echo(f"\n  Detailed Findings:")
+    echo(f"  {investigation_report.detailed_findings}")
+
+    echo(f"\n  Qualitative Sentiment Revision:")
+    echo(f"  {investigation_report.qualitative_sentiment_revision}")
+
+    echo(f"\n  Key Evidence:")
+    for i, evidence in enumerate(investigation_report.key_evidence, 1):
+        echo(f"    {i}. {evidence}")
 
-    # Check for BASIC mode structured report
-    structured_report_file = Path(f"MAT/report/SA/SA_report_basic_{ticker}_{year}.json")
-    if structured_report_file.exists():
-        print(f"✅ Structured BASIC report file exists: {structured_report_file}")
-    else:
-        print(f"❌ Structured BASIC report file NOT FOUND: {structured_report_file}")
+    echo(f"\n  Evidence Gaps:")
+    for i, gap in enumerate(investigation_report.evidence_gaps, 1):
+        echo(f"    {i}. {gap}")
 
-    return sa_report
+    echo(f"{BANNER}\n")
 
 
-async def run_native_sa_advanced_test(ticker: str, date: str, description: str, context_issue: str):
+async def run_native_sa(
+    ticker: str,
+    date: str,
+    description: str,
+    mode: Literal["basic", "advanced"] = "basic",
+    *,
+    context_issue: Optional[str] = None,
+    llm_callback=None
+) -> Tuple[Union[SAReport, InvestigationReport], Optional[bool]]:
     """
-    Run native SearchDeepDive ADVANCED MODE test.
+    Run native SearchDeepDive test in BASIC or ADVANCED mode.
 
     CRITICAL: This function contains ZERO LLM prompts. All intelligence comes from
     the SearchDeepDive Action's native prompt.
@@ -174,188 +214,235 @@ async def run_native_sa_advanced_test(ticker: str, date: str, description: str,
         ticker: Stock ticker
         date: Analysis date "YYYY-MM-DD"
         description: Test description
-        context_issue: The conflict/issue to investigate
+        mode: "basic" (SAReport) or "advanced" (InvestigationReport)
+        context_issue: The conflict/issue to investigate (advanced mode only)
+        llm_callback: Optional LLM transport for the Action's prompt (e.g. BatchLLMCallback)
+
+    Returns:
+        (report, has_causal_logic); has_causal_logic comes from the single
+        causal-connector scan of the news summary and is None in advanced mode
     """
-    print(f"\n{'='*100}")
-    print(f"NATIVE SA ADVANCED TEST: {ticker} ({date})")
-    print(f"Description: {description}")
-    print(f"Context Issue: {context_issue}")
-    print(f"{'='*100}\n")
+    advanced = mode == "advanced"
+    mode_suffix = " (Advanced Mode)" if advanced else ""
+
+    buf = io.StringIO()
+    echo = partial(print, file=buf)
+
+    echo(f"\n{BANNER}")
+    echo(f"NATIVE SA {'ADVANCED ' if advanced else ''}TEST: {ticker} ({date})")
+    echo(f"Description: {description}")
+    if advanced:
+        echo(f"Context Issue: {context_issue}")
+    echo(f"{BANNER}\n")
 
     # Step 1: Instantiate Action (ZERO external prompts)
     sa_action = SearchDeepDive()
 
-    # Step 2: Create InvestigationRequest (simulating what AS would send)
-    investigation_request = InvestigationRequest(
-        ticker=ticker,
-        target_agent="SA",
-        context_issue=context_issue,
-        current_retry=0,
-        max_retries=1,
-        importance_level=2  # High importance for thorough investigation
-    )
+    # Step 2: Call .run() - all intelligence is native
+    # Basic mode searches by ticker; advanced mode receives an InvestigationRequest
+    # (simulating what AS would send). reference_date keeps the search year-specific.
+    run_kwargs = {"mode": mode, "reference_date": date, "llm_callback": llm_callback}
+    if advanced:
+        run_kwargs["investigation_request"] = build_investigation_request(ticker, context_issue)
+    else:
+        run_kwargs["ticker"] = ticker
+    report = await sa_action.run(**run_kwargs)
 
-    # Step 3: Call .run() in advanced mode - all intelligence is native
-    investigation_report: InvestigationReport = await sa_action.run(
-        investigation_request=investigation_request,
-        mode="advanced",
-        reference_date=date
-    )
+    # Step 3: Print expert evidence results
+    if advanced:
+        _echo_investigation_report(echo, report, ticker, date)
+    else:
+        _echo_sa_report(echo, report, ticker, date)
 
-    # Step 4: Print expert evidence results
-    print(f"\n{'='*100}")
-    print(f"NATIVE SA ADVANCED MODE INVESTIGATION REPORT FOR {ticker} ({date})")
-    print(f"{'='*100}")
-    print(f"\n📊 INVESTIGATION METADATA:")
-    print(f"  Ticker: {investigation_report.ticker}")
-    print(f"  Risk Classification: {investigation_report.risk_classification}")
-    print(f"  Confidence Level: {investigation_report.confidence_level}")
-    print(f"  Ambiguity Resolved: {investigation_report.is_ambiguity_resolved}")
+    # Step 4: Validate Pydantic schema
+    echo(schema_check_line(report, InvestigationReport if advanced else SAReport, mode_suffix))
+
+    # Step 5: Check for causal keywords (BECAUSE, DUE TO, etc.) in the basic news summary
+    has_causal_logic = None
+    if not advanced:
+        has_causal_logic = bool(CAUSAL_RE.search(report.news_summary))
+
+        echo(f"\n🔍 Causal Logic Check:")
+        if has_causal_logic:
+            echo(f"✅ News summary contains causal connectors (BECAUSE-THEN logic)")
+            matched_keywords = list(dict.fromkeys(m.group(0).lower() for m in CAUSAL_RE.finditer(report.news_summary)))
+            echo(f"   Found: {matched_keywords}")
+        else:
+            echo(f"⚠️  News summary may be missing explicit causal connectors")
+            echo(f"   Expected keywords: {list(CAUSAL_KEYWORDS)}")
 
-    print(f"\n🧠 INVESTIGATION FINDINGS:")
-    print(f"\n  Detailed Findings:")
-    print(f"  {investigation_report.detailed_findings}")
+    # Step 6: Verify DUAL-SAVING PROTOCOL file existence
+    echo(f"\n📁 DUAL-SAVING PROTOCOL Verification{mode_suffix}:")
 
-    print(f"\n  Qualitative Sentiment Revision:")
-    print(f"  {investigation_report.qualitative_sentiment_revision}")
+    # Extract year from the "YYYY-MM-DD" date (no need to parse the full date)
+    year = int(date[:4])
 
-    print(f"\n  Key Evidence:")
-    for i, evidence in enumerate(investigation_report.key_evidence, 1):
-        print(f"    {i}. {evidence}")
+    # One directory scan answers both existence checks
+    existing = _list_report_dir(SA_REPORT_DIR)
 
-    print(f"\n  Evidence Gaps:")
-    for i, gap in enumerate(investigation_report.evidence_gaps, 1):
-        print(f"    {i}. {gap}")
+    # Check for RAW search results
+    raw_search_file = SA_REPORT_DIR / f"Raw_Search_{ticker}_{year}.json"
+    if raw_search_file.name in existing:
+        echo(f"✅ Raw search results file exists: {raw_search_file}")
+    else:
+        echo(f"❌ Raw search results file NOT FOUND: {raw_search_file}")
 
-    print(f"{'='*100}\n")
+    # Check for the mode's structured report
+    structured_report_file = SA_REPORT_DIR / f"SA_report_{mode}_{ticker}_{year}.json"
+    if structured_report_file.name in existing:
+        echo(f"✅ Structured {mode.upper()} report file exists: {structured_report_file}")
+    else:
+        echo(f"❌ Structured {mode.upper()} report file NOT FOUND: {structured_report_file}")
 
-    # Step 5: Validate Pydantic schema
-    try:
-        investigation_report.model_validate(investigation_report)
-        print("✅ Pydantic validation PASSED (Advanced Mode)")
-    except Exception as e:
-        print(f"❌ Pydantic validation FAILED (Advanced Mode): {e}")
+    write_console(buf)
+    return report, has_causal_logic
 
-    # Step 6: Verify DUAL-SAVING PROTOCOL file existence
-    print(f"\n📁 DUAL-SAVING PROTOCOL Verification (Advanced Mode):")
 
-    # Extract year from date
-    year = datetime.strptime(date, "%Y-%m-%d").year
+async def _bounded(sem: asyncio.Semaphore, coro):
+    """Await coro while holding a slot of sem."""
+    async with sem:
+        return await coro
 
-    # Check for RAW search results
-    raw_search_file = Path(f"MAT/report/SA/Raw_Search_{ticker}_{year}.json")
-    if raw_search_file.exists():
-        print(f"✅ Raw search results file exists: {raw_search_file}")
-    else:
-        print(f"❌ Raw search results file NOT FOUND: {raw_search_file}")
 
-    # Check for ADVANCED mode structured report
-    structured_report_file = Path(f"MAT/report/SA/SA_report_advanced_{ticker}_{year}.json")
-    if structured_report_file.exists():
-        print(f"✅ Structured ADVANCED report file exists: {structured_report_file}")
-    else:
-        print(f"❌ Structured ADVANCED report file NOT FOUND: {structured_report_file}")
+async def run_test_case(test_case: dict, sem: asyncio.Semaphore, llm_callback=None) -> dict:
+    """
+    Run BASIC then ADVANCED mode for one test case.
 
-    return investigation_report
+    The two modes run one after the other because both save
+    Raw_Search_{ticker}_{year}.json; in this order ADVANCED's raw results are
+    the ones kept, as in a sequential run.
 
+    Args:
+        test_case: Entry from TEST_CASES
+        sem: Semaphore bounding concurrent investigations across all test cases
+        llm_callback: Optional LLM transport shared by all investigations
 
-async def main():
+    Returns:
+        Result record with status PASSED or FAILED
+    """
+    try:
+        print(f"\n{HBANNER}")
+        print(f"# TESTING BASIC + ADVANCED MODE: {test_case['ticker']} {test_case['date']}")
+        print(f"{HBANNER}")
+
+        sa_report, has_causal_logic = await _bounded(sem, run_native_sa(
+            ticker=test_case["ticker"],
+            date=test_case["date"],
+            description=test_case["description"],
+            mode="basic",
+            llm_callback=llm_callback
+        ))
+        investigation_report, _ = await _bounded(sem, run_native_sa(
+            ticker=test_case["ticker"],
+            date=test_case["date"],
+            description=test_case["description"],
+            mode="advanced",
+            context_issue=test_case["context_issue"],
+            llm_callback=llm_callback
+        ))
+
+        return {
+            "test_case": test_case["description"],
+            "ticker": test_case["ticker"],
+            "date": test_case["date"],
+            "expected_insights": test_case["expected_insights"],
+            "context_issue": test_case["context_issue"],
+            # Models are kept as-is and serialized once, when the results are written
+            "sa_report": sa_report,
+            "investigation_report": investigation_report,
+            "has_causal_logic": has_causal_logic,
+            "status": "PASSED"
+        }
+
+    except Exception as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        traceback.print_exc()
+
+        return {
+            "test_case": test_case["description"],
+            "ticker": test_case["ticker"],
+            "date": test_case["date"],
+            "expected_insights": test_case["expected_insights"],
+            "context_issue": test_case.get("context_issue", "N/A"),
+            "error": str(e),
+            "status": "FAILED"
+        }
+
+
+async def main(use_batch: bool = False, aggregate: bool = False, print_full: bool = False):
     """
     Main test runner.
 
-    Runs native SA tests for both test cases and saves results.
+    Runs native SA tests for both test cases and streams each result record to a
+    JSON-Lines file as soon as its test case finishes.
+
+    Args:
+        use_batch: Send all investigation prompts as one OpenAI Batch API job
+            (half price, higher rate limits, but minutes-to-hours latency)
+        aggregate: Also write the single aggregated JSON results file, rebuilt
+            from the JSON-Lines records
+        print_full: Re-print every passed report as indented JSON after the summary
     """
-    print("\n" + "="*100)
+    print("\n" + BANNER)
     print("NATIVE SENTIMENT ANALYSIS VERIFICATION TEST")
-    print("="*100)
+    print(BANNER)
     print("\nObjective: Verify that SearchDeepDive Action has internalized GPT-4o intelligence.")
     print("Requirement: ALL intelligence must come from native Action code, NOT external prompts.")
     print("\nTest Cases:")
     for i, tc in enumerate(TEST_CASES, 1):
         print(f"  {i}. {tc['ticker']} {tc['date']}: {tc['description']}")
-    print("="*100)
-
-    results = []
-
-    # Run tests
-    for test_case in TEST_CASES:
-        try:
-            # Test 1: BASIC MODE
-            print(f"\n{'#'*100}")
-            print(f"# TESTING BASIC MODE: {test_case['ticker']} {test_case['date']}")
-            print(f"{'#'*100}")
-
-            sa_report = await run_native_sa_test(
-                ticker=test_case["ticker"],
-                date=test_case["date"],
-                description=test_case["description"]
-            )
-
-            # Check for causal logic
-            causal_keywords = ["because", "due to", "which then", "led to", "driven by", "caused by", "resulted in"]
-            has_causal_logic = any(keyword in sa_report.news_summary.lower() for keyword in causal_keywords)
-
-            # Test 2: ADVANCED MODE
-            print(f"\n{'#'*100}")
-            print(f"# TESTING ADVANCED MODE: {test_case['ticker']} {test_case['date']}")
-            print(f"{'#'*100}")
-
-            investigation_report = await run_native_sa_advanced_test(
-                ticker=test_case["ticker"],
-                date=test_case["date"],
-                description=test_case["description"],
-                context_issue=test_case["context_issue"]
-            )
-
-            results.append({
-                "test_case": test_case["description"],
-                "ticker": test_case["ticker"],
-                "date": test_case["date"],
-                "expected_insights": test_case["expected_insights"],
-                "context_issue": test_case["context_issue"],
-                "sa_report": sa_report.model_dump(),
-                "investigation_report": investigation_report.model_dump(),
-                "has_causal_logic": has_causal_logic,
-                "status": "PASSED"
-            })
-
-        except Exception as e:
-            print(f"\n❌ TEST FAILED: {e}")
-            import traceback
-            traceback.print_exc()
-
-            results.append({
-                "test_case": test_case["description"],
-                "ticker": test_case["ticker"],
-                "date": test_case["date"],
-                "expected_insights": test_case["expected_insights"],
-                "context_issue": test_case.get("context_issue", "N/A"),
-                "error": str(e),
-                "status": "FAILED"
-            })
-
-    # Save results
+    print(BANNER)
+
+    # Test cases are independent network-bound investigations, so they run
+    # concurrently (the two modes within each stay sequential); results keep
+    # TEST_CASES order. A semaphore caps in-flight investigations to stay under
+    # LLM/Tavily rate limits.
+    llm_callback = None
+    max_concurrency = get_config().get_max_concurrency(default=4)
+    if use_batch:
+        # One investigation per test case is in flight at a time, so the BASIC
+        # prompts form one batch job and the ADVANCED prompts a second one
+        llm_callback = BatchLLMCallback(expected=len(TEST_CASES))
+        max_concurrency = max(max_concurrency, len(TEST_CASES))
+    sem = asyncio.Semaphore(max_concurrency)
+
     output_file = Path("MAT/tests/native_sa_verification_results.json")
     output_file.parent.mkdir(parents=True, exist_ok=True)
-
-    output_data = {
-        "test_name": "Native SA Intelligence Verification",
-        "test_date": datetime.now().isoformat(),
-        "objective": "Verify SearchDeepDive has internalized GPT-4o intelligence",
-        "results": results
-    }
-
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(output_data, f, indent=2, ensure_ascii=False, default=str)
-
-    print(f"\n{'='*100}")
+    jsonl_file = output_file.with_suffix(".jsonl")
+
+    with jsonl_file.open("wb") as sink:
+        def append_record(result: dict) -> None:
+            # One line per finished test case, flushed so completed work survives a crash
+            sink.write(dump_json(result, indent=False) + b"\n")
+            sink.flush()
+
+        async def run_and_record(test_case: dict) -> dict:
+            result = await run_test_case(test_case, sem, llm_callback)
+            # Serialize and write off the event loop so the other cases' I/O keeps flowing
+            await asyncio.to_thread(append_record, result)
+            return result
+
+        results = await asyncio.gather(*(run_and_record(test_case) for test_case in TEST_CASES))
+
+    if aggregate:
+        output_data = {
+            "test_name": "Native SA Intelligence Verification",
+            "test_date": datetime.now().isoformat(),
+            "objective": "Verify SearchDeepDive has internalized GPT-4o intelligence",
+            "results": load_jsonl(jsonl_file)
+        }
+        await asyncio.to_thread(lambda: output_file.write_bytes(dump_json(output_data)))
+
+    print(f"\n{BANNER}")
     print(f"NATIVE SA VERIFICATION COMPLETE")
-    print(f"{'='*100}")
-    print(f"Results saved to: {output_file}")
+    print(f"{BANNER}")
+    print(f"Results saved to: {jsonl_file}")
+    if aggregate:
+        print(f"Aggregated results: {output_file}")
     print(f"Total tests: {len(results)}")
     print(f"Passed: {sum(1 for r in results if r['status'] == 'PASSED')}")
     print(f"Failed: {sum(1 for r in results if r['status'] == 'FAILED')}")
-    print(f"{'='*100}\n")
+    print(f"{BANNER}\n")
 
     # Print summary
     print("\n📊 SUMMARY:")
@@ -365,44 +452,50 @@ async def main():
         if result["status"] == "PASSED":
             # BASIC MODE RESULTS
             print(f"\n  🔵 BASIC MODE (SAReport):")
-            sa_data = result["sa_report"]
+            sa_report = result["sa_report"]
             causal_icon = "✅" if result["has_causal_logic"] else "⚠️"
-            print(f"     Qualitative Sentiment: {sa_data.get('qualitative_sentiment_assessment', 'N/A')[:80]}...")
-            print(f"     Events: {sa_data['impactful_events']}")
+            print(f"     Qualitative Sentiment: {sa_report.qualitative_sentiment_assessment[:80]}...")
+            print(f"     Events: {sa_report.impactful_events}")
             print(f"     {causal_icon} Causal Logic: {'Present' if result['has_causal_logic'] else 'Missing'}")
-            print(f"     Sentiment Matrix Factors: {list(sa_data.get('sentiment_matrix', {}).keys())}")
-            print(f"     Paradoxes: {sa_data.get('paradoxes_or_tensions', 'N/A')[:80]}...")
+            print(f"     Sentiment Matrix Factors: {list(sa_report.sentiment_matrix)}")
+            print(f"     Paradoxes: {sa_report.paradoxes_or_tensions[:80]}...")
 
             # ADVANCED MODE RESULTS
             print(f"\n  🔴 ADVANCED MODE (InvestigationReport):")
-            inv_data = result["investigation_report"]
-            print(f"     Risk Classification: {inv_data.get('risk_classification', 'N/A')}")
-            print(f"     Confidence Level: {inv_data.get('confidence_level', 'N/A')}")
-            print(f"     Ambiguity Resolved: {inv_data.get('is_ambiguity_resolved', False)}")
-            print(f"     Sentiment Revision: {inv_data.get('qualitative_sentiment_revision', 'N/A')[:80]}...")
-            print(f"     Key Evidence Count: {len(inv_data.get('key_evidence', []))}")
-            print(f"     Evidence Gaps Count: {len(inv_data.get('evidence_gaps', []))}")
+            inv_report = result["investigation_report"]
+            print(f"     Risk Classification: {inv_report.risk_classification}")
+            print(f"     Confidence Level: {inv_report.confidence_level}")
+            print(f"     Ambiguity Resolved: {inv_report.is_ambiguity_resolved}")
+            print(f"     Sentiment Revision: {inv_report.qualitative_sentiment_revision[:80]}...")
+            print(f"     Key Evidence Count: {len(inv_report.key_evidence)}")
+            print(f"     Evidence Gaps Count: {len(inv_report.evidence_gaps)}")
         else:
             print(f"   Error: {result.get('error', 'Unknown error')}")
 
-    # Print full JSON reports
-    print("\n" + "="*100)
-    print("FULL JSON REPORTS")
-    print("="*100)
-    for i, result in enumerate(results, 1):
-        if result["status"] == "PASSED":
-            print(f"\n{i}. {result['ticker']} {result['date']}:")
-            print(f"\n  🔵 BASIC MODE (SAReport):")
-            print(json.dumps(result["sa_report"], indent=2, default=str))
-            print(f"\n  🔴 ADVANCED MODE (InvestigationReport):")
-            print(json.dumps(result["investigation_report"], indent=2, default=str))
+    # Print full JSON reports (the results file on disk has the same content)
+    if print_full:
+        print("\n" + BANNER)
+        print("FULL JSON REPORTS")
+        print(BANNER)
+        for i, result in enumerate(results, 1):
+            if result["status"] == "PASSED":
+                print(f"\n{i}. {result['ticker']} {result['date']}:")
+                print(f"\n  🔵 BASIC MODE (SAReport):")
+                print(result["sa_report"].model_dump_json(indent=2))
+                print(f"\n  🔴 ADVANCED MODE (InvestigationReport):")
+                print(result["investigation_report"].model_dump_json(indent=2))
 
 
 if __name__ == "__main__":
+    install_uvloop()
+
     # Parse command-line arguments
     parser = argparse.ArgumentParser(description="Native verification test for SearchDeepDive action")
     parser.add_argument("--ticker", type=str, help="Stock ticker symbol (e.g., AAPL, KO)")
     parser.add_argument("--fiscal_year", type=int, help="Fiscal year for analysis (e.g., 2021, 2022)")
+    parser.add_argument("--batch", action="store_true", help="Submit all LLM prompts as one OpenAI Batch API job")
+    parser.add_argument("--aggregate", action="store_true", help="Also write the aggregated JSON results file")
+    parser.add_argument("--print-full", "--verbose", action="store_true", help="Also print every passed report as indented JSON at the end")
 
     args = parser.parse_args()
 
@@ -421,4 +514,4 @@ if __name__ == "__main__":
         })
         print(f"\n🔧 CLI Mode: Running test for {args.ticker} FY{args.fiscal_year}")
 
-    asyncio.run(main())
+    asyncio.run(main(use_batch=args.batch, aggregate=args.aggregate, print_full=args.print_full))
@@ -20,14 +20,18 @@ Success Criteria:
 """
 
 import asyncio
-import json
+import io
 import argparse
+import traceback
+from functools import partial
 from pathlib import Path
 from datetime import datetime
 
 # Import the Action directly
 from MAT.actions.calculate_technicals import CalculateTechnicals
 from MAT.schemas import TAReport
+from MAT.config_loader import get_config
+from MAT.tests.verify_common import BANNER, dump_json, schema_check_line, write_console
 
 
 # ============================================================
@@ -64,10 +68,13 @@ async def run_native_ta_test(ticker: str, start_date: str, end_date: str, descri
         end_date: End date "YYYY-MM-DD"
         description: Test description
     """
-    print(f"\n{'='*100}")
-    print(f"NATIVE TA TEST: {ticker} ({start_date} to {end_date})")
-    print(f"Description: {description}")
-    print(f"{'='*100}\n")
+    buf = io.StringIO()
+    echo = partial(print, file=buf)
+
+    echo(f"\n{BANNER}")
+    echo(f"NATIVE TA TEST: {ticker} ({start_date} to {end_date})")
+    echo(f"Description: {description}")
+    echo(f"{BANNER}\n")
 
     # Step 1: Instantiate Action (ZERO external prompts)
     ta_action = CalculateTechnicals()
@@ -80,91 +87,105 @@ async def run_native_ta_test(ticker: str, start_date: str, end_date: str, descri
     )
 
     # Step 3: Print pure descriptive multi-period evidence results
-    print(f"\n{'='*100}")
-    print(f"NATIVE TA PURE DESCRIPTIVE EVIDENCE FOR {ticker} ({end_date})")
-    print(f"{'='*100}")
-    print(f"\n📊 API-DERIVED TECHNICAL METRICS (yfinance):")
-    print(f"  Ticker: {ta_report.ticker}")
-    print(f"  RSI(14): {ta_report.rsi_14:.2f}")
-    print(f"  BB Lower Touch: {ta_report.bb_lower_touch}")
-    print(f"  ATR Volatility: ${ta_report.volatility_atr:.2f}")
-    print(f"\n  Multi-Period MA Distances:")
-    print(f"    - MA(20):  {ta_report.price_to_ma20_dist:+.2%} (Short-term)")
-    print(f"    - MA(50):  {ta_report.price_to_ma50_dist:+.2%} (Medium-term)")
-    print(f"    - MA(200): {ta_report.price_to_ma200_dist:+.2%} (Long-term)")
-
-    print(f"\n🧠 PURE DESCRIPTIVE EVIDENCE:")
-    print(f"\n  Market Regime (Multi-Period Structural Analysis):")
-    print(f"  {ta_report.market_regime}")
-    print(f"\n  Indicator Tension Analysis:")
-    print(f"  {ta_report.indicator_tension_analysis}")
-    print(f"\n  Dead Cat vs Value Entry (Multi-Period Assessment):")
-    print(f"  {ta_report.dead_cat_vs_value}")
-    print(f"\n  Pivot Zones (API-Derived Levels):")
+    echo(f"\n{BANNER}")
+    echo(f"NATIVE TA PURE DESCRIPTIVE EVIDENCE FOR {ticker} ({end_date})")
+    echo(f"{BANNER}")
+    echo(f"\n📊 API-DERIVED TECHNICAL METRICS (yfinance):")
+    echo(f"  Ticker: {ta_report.ticker}")
+    echo(f"  RSI(14): {ta_report.rsi_14:.2f}")
+    echo(f"  BB Lower Touch: {ta_report.bb_lower_touch}")
+    echo(f"  ATR Volatility: ${ta_report.volatility_atr:.2f}")
+    echo(f"\n  Multi-Period MA Distances:")
+    echo(f"    - MA(20):  {ta_report.price_to_ma20_dist:+.2%} (Short-term)")
+    echo(f"    - MA(50):  {ta_report.price_to_ma50_dist:+.2%} (Medium-term)")
+    echo(f"    - MA(200): {ta_report.price_to_ma200_dist:+.2%} (Long-term)")
+
+    echo(f"\n🧠 PURE DESCRIPTIVE EVIDENCE:")
+    echo(f"\n  Market Regime (Multi-Period Structural Analysis):")
+    echo(f"  {ta_report.market_regime}")
+    echo(f"\n  Indicator Tension Analysis:")
+    echo(f"  {ta_report.indicator_tension_analysis}")
+    echo(f"\n  Dead Cat vs Value Entry (Multi-Period Assessment):")
+    echo(f"  {ta_report.dead_cat_vs_value}")
+    echo(f"\n  Pivot Zones (API-Derived Levels):")
     for zone, level in ta_report.pivot_zones.items():
-        print(f"    - {zone}: ${level:.2f}")
-    print(f"{'='*100}\n")
+        echo(f"    - {zone}: ${level:.2f}")
+    echo(f"{BANNER}\n")
 
     # Step 4: Validate Pydantic schema
+    echo(schema_check_line(ta_report, TAReport))
+
+    write_console(buf)
+    return ta_report
+
+
+async def run_test_case(test_case: dict, sem: asyncio.Semaphore) -> dict:
+    """
+    Run one TA test case.
+
+    Args:
+        test_case: Entry from TEST_CASES
+        sem: Semaphore bounding concurrent TA runs across all test cases
+
+    Returns:
+        Result record with status PASSED or FAILED
+    """
     try:
-        ta_report.model_validate(ta_report)
-        print("✅ Pydantic validation PASSED")
+        async with sem:
+            ta_report = await run_native_ta_test(
+                ticker=test_case["ticker"],
+                start_date=test_case["start_date"],
+                end_date=test_case["end_date"],
+                description=test_case["description"]
+            )
+
+        return {
+            "test_case": test_case["description"],
+            "ticker": test_case["ticker"],
+            "date": test_case["end_date"],
+            "expected_context": test_case["expected_context"],
+            "ta_report": ta_report,  # serialized once, when the results are written
+            "status": "PASSED"
+        }
+
     except Exception as e:
-        print(f"❌ Pydantic validation FAILED: {e}")
+        print(f"\n❌ TEST FAILED: {e}")
+        traceback.print_exc()
 
-    return ta_report
+        return {
+            "test_case": test_case["description"],
+            "ticker": test_case["ticker"],
+            "date": test_case["end_date"],
+            "expected_context": test_case["expected_context"],
+            "error": str(e),
+            "status": "FAILED"
+        }
 
 
-async def main():
+async def main(print_full: bool = False):
     """
     Main test runner.
 
     Runs native TA tests for both test cases and saves results.
+
+    Args:
+        print_full: Re-print every passed report as indented JSON after the summary
     """
-    print("\n" + "="*100)
+    print("\n" + BANNER)
     print("NATIVE TECHNICAL ANALYSIS VERIFICATION TEST")
-    print("="*100)
+    print(BANNER)
     print("\nObjective: Verify that CalculateTechnicals Action has internalized GPT-4o intelligence.")
     print("Requirement: ALL intelligence must come from native Action code, NOT external prompts.")
     print("\nTest Cases:")
     for i, tc in enumerate(TEST_CASES, 1):
         print(f"  {i}. {tc['ticker']} {tc['end_date']}: {tc['description']}")
-    print("="*100)
+    print(BANNER)
 
-    results = []
-
-    # Run tests
-    for test_case in TEST_CASES:
-        try:
-            ta_report = await run_native_ta_test(
-                ticker=test_case["ticker"],
-                start_date=test_case["start_date"],
-                end_date=test_case["end_date"],
-                description=test_case["description"]
-            )
-
-            results.append({
-                "test_case": test_case["description"],
-                "ticker": test_case["ticker"],
-                "date": test_case["end_date"],
-                "expected_context": test_case["expected_context"],
-                "ta_report": ta_report.model_dump(),
-                "status": "PASSED"
-            })
-
-        except Exception as e:
-            print(f"\n❌ TEST FAILED: {e}")
-            import traceback
-            traceback.print_exc()
-
-            results.append({
-                "test_case": test_case["description"],
-                "ticker": test_case["ticker"],
-                "date": test_case["end_date"],
-                "expected_context": test_case["expected_context"],
-                "error": str(e),
-                "status": "FAILED"
-            })
+    # Test cases are independent price downloads + LLM calls, so they run
+    # concurrently; results keep TEST_CASES order. The semaphore stays under
+    # yfinance/LLM rate limits.
+    sem = asyncio.Semaphore(get_config().get_max_concurrency(default=4))
+    results = await asyncio.gather(*(run_test_case(test_case, sem) for test_case in TEST_CASES))
 
     # Save results
     output_file = Path("MAT/tests/native_ta_verification_results.json")
@@ -177,17 +198,17 @@ async def main():
         "results": results
     }
 
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(output_data, f, indent=2, ensure_ascii=False, default=str)
+    # Serialize and write in a worker thread to keep the event loop free
+    await asyncio.to_thread(lambda: output_file.write_bytes(dump_json(output_data)))
 
-    print(f"\n{'='*100}")
+    print(f"\n{BANNER}")
     print(f"NATIVE TA VERIFICATION COMPLETE")
-    print(f"{'='*100}")
+    print(f"{BANNER}")
     print(f"Results saved to: {output_file}")
     print(f"Total tests: {len(results)}")
     print(f"Passed: {sum(1 for r in results if r['status'] == 'PASSED')}")
     print(f"Failed: {sum(1 for r in results if r['status'] == 'FAILED')}")
-    print(f"{'='*100}\n")
+    print(f"{BANNER}\n")
 
     # Print summary
     print("\n📊 SUMMARY:")
@@ -195,22 +216,23 @@ async def main():
         status_icon = "✅" if result["status"] == "PASSED" else "❌"
         print(f"{status_icon} {result['ticker']} {result['date']}: {result['test_case']}")
         if result["status"] == "PASSED":
-            ta_data = result["ta_report"]
-            print(f"   Market Regime: {ta_data['market_regime'][:100]}...")
-            print(f"   Multi-Period MA Distances: MA20={ta_data['price_to_ma20_dist']:+.2%}, MA50={ta_data['price_to_ma50_dist']:+.2%}, MA200={ta_data['price_to_ma200_dist']:+.2%}")
-            print(f"   RSI: {ta_data['rsi_14']:.2f}")
-            print(f"   Dead Cat vs Value: {ta_data['dead_cat_vs_value'][:80]}...")
+            ta_report = result["ta_report"]
+            print(f"   Market Regime: {ta_report.market_regime[:100]}...")
+            print(f"   Multi-Period MA Distances: MA20={ta_report.price_to_ma20_dist:+.2%}, MA50={ta_report.price_to_ma50_dist:+.2%}, MA200={ta_report.price_to_ma200_dist:+.2%}")
+            print(f"   RSI: {ta_report.rsi_14:.2f}")
+            print(f"   Dead Cat vs Value: {ta_report.dead_cat_vs_value[:80]}...")
         else:
             print(f"   Error: {result.get('error', 'Unknown error')}")
 
-    # Print full JSON reports
-    print("\n" + "="*100)
-    print("FULL JSON REPORTS")
-    print("="*100)
-    for i, result in enumerate(results, 1):
-        if result["status"] == "PASSED":
-            print(f"\n{i}. {result['ticker']} {result['date']}:")
-            print(json.dumps(result["ta_report"], indent=2, default=str))
+    # Print full JSON reports (the results file on disk has the same content)
+    if print_full:
+        print("\n" + BANNER)
+        print("FULL JSON REPORTS")
+        print(BANNER)
+        for i, result in enumerate(results, 1):
+            if result["status"] == "PASSED":
+                print(f"\n{i}. {result['ticker']} {result['date']}:")
+                print(result["ta_report"].model_dump_json(indent=2))
 
 
 if __name__ == "__main__":
@@ -218,6 +240,7 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Native verification test for CalculateTechnicals action")
     parser.add_argument("--ticker", type=str, help="Stock ticker symbol (e.g., AAPL, KO)")
     parser.add_argument("--fiscal_year", type=int, help="Fiscal year for analysis (e.g., 2021, 2022)")
+    parser.add_argument("--print-full", "--verbose", action="store_true", help="Also print every passed report as indented JSON at the end")
 
     args = parser.parse_args()
 
@@ -234,4 +257,4 @@ if __name__ == "__main__":
         })
         print(f"\n🔧 CLI Mode: Running test for {args.ticker} FY{args.fiscal_year}")
 
-    asyncio.run(main())
+    asyncio.run(main(print_full=args.print_full))